@@ -0,0 +1,287 @@
+"""
+Geração de movimentos vetorizada (NumPy) para um lote de posições.
+
+Segue as mesmas regras do MoveValidator (capturas obrigatórias, regra da
+maioria, damas voadoras), mas processa N posições de uma vez. O laço em
+Python percorre apenas direções, passos do raio e níveis da cadeia de
+captura; todo o resto é feito com arrays sobre o lote inteiro.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.core.board import Board
+from src.core.piece import Player
+from src.core.move import Move
+from src.core.bitboard import NUM_SQUARES, RAYS, DIRECTIONS
+
+# Casa fictícia "fora do tabuleiro": sempre ocupada, nunca capturável
+OFF_BOARD = NUM_SQUARES
+
+# RAY_TABLE[d, s, k] -> k+1-ésima casa na direção d a partir de s (ou OFF_BOARD)
+RAY_TABLE = np.full((len(DIRECTIONS), NUM_SQUARES + 1, 7), OFF_BOARD, dtype=np.int64)
+for _sq in range(NUM_SQUARES):
+    for _d, _ray in enumerate(RAYS[_sq]):
+        RAY_TABLE[_d, _sq, :len(_ray)] = _ray
+
+# Direções em que cada lado anda com peças simples (Brancas sobem, Pretas descem)
+WHITE_MAN_DIRECTIONS = (0, 1)
+BLACK_MAN_DIRECTIONS = (2, 3)
+
+_SHIFTS = np.arange(NUM_SQUARES, dtype=np.int64)
+
+
+@dataclass
+class BatchMoves:
+    """
+    Resultado da geração em lote: um movimento legal por linha, em ordem de
+    posição (e, dentro dela, de origem, destino e capturas).
+    'position': (M,) índice da posição no lote.
+    'from_square', 'to_square': (M,) casas (0-31) de origem e de destino.
+    'captured': (M,) máscara das casas capturadas (0 nos movimentos simples).
+                Duas cadeias de dama com as mesmas pontas e capturas
+                diferentes são dois movimentos, como no MoveValidator.
+    'capture_counts': (N,) número de peças capturadas pelos movimentos legais
+                      (0 quando só há movimentos simples).
+    """
+    position: np.ndarray
+    from_square: np.ndarray
+    to_square: np.ndarray
+    captured: np.ndarray
+    capture_counts: np.ndarray
+
+    @property
+    def keys(self) -> np.ndarray:
+        """Move.key de cada linha (origem | destino << 5 | capturas << 10)."""
+        return self.from_square | (self.to_square << 5) | (self.captured << 10)
+
+    def moves(self, n: int) -> list[Move]:
+        """Os movimentos da posição 'n', prontos para Board.apply_move."""
+        start, stop = np.searchsorted(self.position, [n, n + 1])
+        return [Move.from_key(key) for key in self.keys[start:stop].tolist()]
+
+    def move_counts(self) -> np.ndarray:
+        return np.bincount(self.position, minlength=len(self.capture_counts))
+
+    @property
+    def masks(self) -> np.ndarray:
+        """(N, 32, 32) bool, masks[n, origem, destino] indica um movimento legal."""
+        masks = np.zeros((len(self.capture_counts), NUM_SQUARES, NUM_SQUARES), dtype=bool)
+        masks[self.position, self.from_square, self.to_square] = True
+        return masks
+
+
+def boards_to_bitboards(boards: list[Board]) -> np.ndarray:
+    """Empacota tabuleiros em um array (N, 4) uint32 na ordem de Board.masks()."""
+    return np.array([board.masks() for board in boards], dtype=np.uint32).reshape(-1, 4)
+
+
+def players_to_array(players: list[Player]) -> np.ndarray:
+    """0 para as Brancas e 1 para as Pretas."""
+    return np.array([player == Player.BLACK for player in players], dtype=bool)
+
+
+def _to_bitboards(positions: np.ndarray) -> np.ndarray:
+    positions = np.asarray(positions)
+    if positions.ndim == 3:
+        # (N, 4, 32) planos de 0/1 -> (N, 4) bitboards
+        return (positions.astype(np.int64) << _SHIFTS).sum(axis=2)
+    if positions.ndim == 2 and positions.shape[1] == 4:
+        return positions.astype(np.int64)
+    raise ValueError(f"Esperado (N, 4) bitboards ou (N, 4, 32) planos, recebeu {positions.shape}")
+
+
+def _bits(masks: np.ndarray) -> np.ndarray:
+    """(N,) máscaras -> (N, 33) bool, com a coluna OFF_BOARD no fim."""
+    bits = ((masks[:, None] >> _SHIFTS) & 1).astype(bool)
+    return np.concatenate([bits, np.zeros((len(masks), 1), dtype=bool)], axis=1)
+
+
+class BatchMoveGenerator:
+
+    def generate(self, positions: np.ndarray, black_to_move: np.ndarray) -> BatchMoves:
+        """
+        positions: (N, 4) bitboards [peças Brancas, damas Brancas, peças Pretas,
+                   damas Pretas] ou (N, 4, 32) planos 0/1 na mesma ordem.
+        black_to_move: (N,) bool, True quando é a vez das Pretas.
+        """
+        bitboards = _to_bitboards(positions)
+        black = np.asarray(black_to_move, dtype=bool).reshape(-1)
+        n = len(bitboards)
+
+        white_all = bitboards[:, 0] | bitboards[:, 1]
+        black_all = bitboards[:, 2] | bitboards[:, 3]
+        own = np.where(black, black_all, white_all)
+        own_kings = np.where(black, bitboards[:, 3], bitboards[:, 1])
+        opponent = np.where(black, white_all, black_all)
+        # O bit OFF_BOARD fica sempre "ocupado": sair do tabuleiro bloqueia
+        occupied = own | opponent | (np.int64(1) << OFF_BOARD)
+
+        capture_counts, *captures = self._captures(own, own_kings, opponent, occupied)
+
+        simple = np.nonzero(capture_counts == 0)[0]
+        masks = self._simple_moves(own[simple], own_kings[simple], occupied[simple], black[simple])
+        simple_pos, simple_from, simple_to = np.nonzero(masks)
+        simple_moves = (simple[simple_pos], simple_from, simple_to, np.zeros(len(simple_pos), dtype=np.int64))
+
+        position, from_square, to_square, captured = (
+            np.concatenate(columns) for columns in zip(captures, simple_moves))
+        order = np.lexsort((captured, to_square, from_square, position))
+        return BatchMoves(position[order], from_square[order], to_square[order], captured[order],
+                          capture_counts)
+
+    def _simple_moves(self, own, own_kings, occupied, black) -> np.ndarray:
+        n = len(own)
+        masks = np.zeros((n, NUM_SQUARES, NUM_SQUARES), dtype=bool)
+        squares = np.arange(NUM_SQUARES)
+        own_bits = _bits(own)[:, :NUM_SQUARES]
+        king_bits = _bits(own_kings)[:, :NUM_SQUARES]
+        occupied_bits = _bits(occupied)
+        occupied_bits[:, OFF_BOARD] = True
+        men = own_bits & ~king_bits
+
+        for d in range(len(DIRECTIONS)):
+            # Peças simples: um passo para frente
+            forward = black if d in BLACK_MAN_DIRECTIONS else ~black
+            dest = RAY_TABLE[d, :NUM_SQUARES, 0]
+            on_board = dest != OFF_BOARD
+            legal = men & forward[:, None] & ~occupied_bits[:, dest]
+            masks[:, squares[on_board], dest[on_board]] |= legal[:, on_board]
+
+        # Damas: desliza até a primeira casa ocupada (só nas posições que têm damas)
+        with_kings = np.nonzero(king_bits.any(axis=1))[0]
+        if len(with_kings):
+            king_bits = king_bits[with_kings]
+            occupied_bits = occupied_bits[with_kings]
+            king_masks = masks[with_kings]
+            for d in range(len(DIRECTIONS)):
+                open_ray = king_bits.copy()
+                for k in range(7):
+                    dest = RAY_TABLE[d, :NUM_SQUARES, k]
+                    on_board = dest != OFF_BOARD
+                    open_ray &= ~occupied_bits[:, dest]
+                    if not open_ray.any():
+                        break
+                    king_masks[:, squares[on_board], dest[on_board]] |= open_ray[:, on_board]
+            masks[with_kings] = king_masks
+        return masks
+
+    def _captures(self, own, own_kings, opponent, occupied
+                  ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (capture_counts, posição, origem, destino, capturas) das cadeias de
+        captura legais (com o máximo de capturas de cada posição).
+        """
+        n = len(own)
+
+        # Fronteira da busca: uma linha por (posição, peça de origem, casa atual, capturas).
+        # Começa com todas as peças do lado a jogar.
+        pos_idx, origin = np.nonzero(_bits(own)[:, :NUM_SQUARES])
+        current = origin.copy()
+        is_king = ((own_kings[pos_idx] >> origin) & 1).astype(bool)
+        captured = np.zeros(len(pos_idx), dtype=np.int64)
+        count = np.zeros(len(pos_idx), dtype=np.int64)
+
+        # Listas começam com um array vazio: a fronteira pode estar vazia desde o
+        # início (lote vazio, ou lado a jogar sem peças)
+        empty = np.empty(0, dtype=np.int64)
+        end_pos, end_origin, end_square, end_captured, end_count = [empty], [empty], [empty], [empty], [empty]
+
+        while len(pos_idx):
+            jump_entry, jump_dest, jump_capture = self._single_jumps(
+                current, is_king, captured, own[pos_idx], opponent[pos_idx], occupied[pos_idx])
+
+            # Entradas sem saltos encerram a cadeia (se já capturaram algo)
+            has_jump = np.zeros(len(pos_idx), dtype=bool)
+            has_jump[jump_entry] = True
+            done = ~has_jump & (count > 0)
+            end_pos.append(pos_idx[done])
+            end_origin.append(origin[done])
+            end_square.append(current[done])
+            end_captured.append(captured[done])
+            end_count.append(count[done])
+
+            # Próximo nível, sem repetir estados (posição, origem, casa, capturas)
+            new_captured = captured[jump_entry] | (np.int64(1) << jump_capture)
+            state = ((pos_idx[jump_entry] << 42) | (origin[jump_entry] << 37)
+                     | (jump_dest << 32) | new_captured)
+            _, unique = np.unique(state, return_index=True)
+            jump_entry, jump_dest, new_captured = jump_entry[unique], jump_dest[unique], new_captured[unique]
+
+            pos_idx = pos_idx[jump_entry]
+            origin = origin[jump_entry]
+            is_king = is_king[jump_entry]
+            count = count[jump_entry] + 1
+            current = jump_dest
+            captured = new_captured
+
+        end_pos = np.concatenate(end_pos)
+        end_origin = np.concatenate(end_origin)
+        end_square = np.concatenate(end_square)
+        end_captured = np.concatenate(end_captured)
+        end_count = np.concatenate(end_count)
+
+        # Regra da maioria: só valem as cadeias com o máximo de capturas da posição
+        capture_counts = np.zeros(n, dtype=np.int64)
+        np.maximum.at(capture_counts, end_pos, end_count)
+        best = end_count == capture_counts[end_pos]
+        return capture_counts, end_pos[best], end_origin[best], end_square[best], end_captured[best]
+
+    def _single_jumps(self, current, is_king, captured, own, opponent, occupied):
+        """
+        Saltos de uma captura para cada entrada da fronteira. 'own', 'opponent'
+        e 'occupied' já vêm indexados por entrada.
+        Retorna (índice da entrada, casa de destino, casa capturada).
+        """
+        entries, dests, captures = [], [], []
+        capturable = opponent & ~captured
+
+        # Peças simples, nas quatro direções de uma vez: adversário adjacente
+        # ainda não capturado e casa vazia logo atrás
+        men = np.nonzero(~is_king)[0]
+        if len(men):
+            mid = RAY_TABLE[:, current[men], 0]
+            dest = RAY_TABLE[:, current[men], 1]
+            jump = (((capturable[men] >> mid) & 1).astype(bool)
+                    & (((occupied[men] >> dest) & 1) == 0))
+            direction, found = np.nonzero(jump)
+            entries.append(men[found])
+            dests.append(dest[direction, found])
+            captures.append(mid[direction, found])
+
+        # Damas: percorre cada raio procurando um adversário e as casas vazias depois dele
+        kings = np.nonzero(is_king)[0]
+        if len(kings):
+            king_current = current[kings]
+            king_own = own[kings]
+            king_capturable = capturable[kings]
+            king_occupied = occupied[kings]
+            for d in range(len(DIRECTIONS)):
+                scanning = np.ones(len(kings), dtype=bool)
+                target = np.full(len(kings), OFF_BOARD, dtype=np.int64)
+                for k in range(7):
+                    sq = RAY_TABLE[d, king_current, k]
+                    is_occupied = ((king_occupied >> sq) & 1).astype(bool)
+                    searching = scanning & (target == OFF_BOARD)
+                    landing = scanning & (target != OFF_BOARD)
+
+                    # Procurando: peça própria (ou borda) para; adversário não capturado
+                    # vira o alvo; adversário já capturado é atravessado (como no MoveValidator)
+                    stop_own = searching & ((((king_own >> sq) & 1) == 1) | (sq == OFF_BOARD))
+                    new_target = searching & (((king_capturable >> sq) & 1) == 1)
+                    target = np.where(new_target, sq, target)
+
+                    # Depois do alvo: cada casa vazia é um pouso; qualquer peça para
+                    found = np.nonzero(landing & ~is_occupied)[0]
+                    entries.append(kings[found])
+                    dests.append(sq[found])
+                    captures.append(target[found])
+
+                    scanning &= ~stop_own & ~(landing & is_occupied)
+                    if not scanning.any():
+                        break
+
+        if not entries:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, empty
+        return np.concatenate(entries), np.concatenate(dests), np.concatenate(captures)
@@ -1,19 +1,28 @@
 
 from src.core.board import Board
-from src.core.piece import Piece, Player
-from src.app.use_cases.move_validator import MoveValidator, Move
+from src.core.piece import Player
+from src.core.move import Move
+from src.core.lru_cache import LRUCache
+from src.app.use_cases.table_move_validator import TableMoveValidator
 from typing import Optional
 
 class GameManager:
 
-    def __init__(self):
+    def __init__(self, validator=None, move_cache: Optional[LRUCache] = None):
         self.board = Board()
-        self.validator = MoveValidator()
+        # TableMoveValidator gera os mesmos movimentos do MoveValidator,
+        # só que bem mais rápido (usado por padrão no jogo e no autojogo)
+        self.validator = validator or TableMoveValidator()
+        # Cache opcional (posição + lado a jogar -> movimentos legais). Pode ser
+        # compartilhado entre várias partidas, ex.: no autojogo.
+        self.move_cache = move_cache
         self.current_player = Player.WHITE 
         self.winner: Optional[Player] = None
         
 
         self.legal_moves: list[Move] = []
+        # Chaves empacotadas dos movimentos legais: validação O(1) em make_move
+        self._legal_move_keys: set[int] = set()
         
         self._setup_game()
 
@@ -22,9 +31,23 @@ class GameManager:
         self._update_legal_moves()
 
     def _update_legal_moves(self):
-        self.legal_moves = self.validator.get_all_legal_moves_for_player(
-            self.board, self.current_player
-        )
+        if self.move_cache is None:
+            self.legal_moves = self.validator.get_all_legal_moves_for_player(
+                self.board, self.current_player
+            )
+            self._legal_move_keys = {move.key for move in self.legal_moves}
+        else:
+            position_key = self.board.position_key(self.current_player)
+            cached = self.move_cache.get(position_key)
+            if cached is None:
+                moves = tuple(self.validator.get_all_legal_moves_for_player(
+                    self.board, self.current_player
+                ))
+                cached = (moves, frozenset(move.key for move in moves))
+                self.move_cache.put(position_key, cached)
+            # Cópia da lista: quem recebe legal_moves pode alterá-la à vontade
+            self.legal_moves = list(cached[0])
+            self._legal_move_keys = cached[1]
         
         if not self.legal_moves:
             self.winner = Player.BLACK if self.current_player == Player.WHITE else Player.WHITE
@@ -39,30 +62,13 @@ class GameManager:
         Tenta executar um movimento. A UI ou a IA devem passar
         um dos objetos 'Move' da lista 'self.legal_moves'.
         """
-        if selected_move not in self.legal_moves:
+        selected_move = Move.coerce(selected_move)
+        if selected_move.key not in self._legal_move_keys:
             print(f"Erro: Movimento {selected_move} não é legal.")
             return False
             
-       
-        from_pos = selected_move["from_pos"]
-        to_pos = selected_move["to_pos"]
-        captures = selected_move["captures"]
-        
-        piece = self.board.get_piece(from_pos[0], from_pos[1])
-        
-        self.board.move_piece(from_pos[0], from_pos[1], to_pos[0], to_pos[1])
-        
-        for cap_pos in captures:
-            self.board.remove_piece(cap_pos[0], cap_pos[1])
-            
-        if piece and not piece.is_king:
-            
-            if (piece.player == Player.WHITE and to_pos[0] == 0) or \
-               (piece.player == Player.BLACK and to_pos[0] == self.board.ROWS - 1):
-                
-                
-                piece.make_king()
-        
+        # Deslocamento, capturas e promoção em uma única operação
+        self.board.apply_move(selected_move)
       
         self._switch_turn()
         return True
@@ -1,18 +1,7 @@
 from src.core.board import Board
 from src.core.piece import Piece, Player
-from typing import TypedDict, Optional, Literal
-
-class Move(TypedDict):
-    """
-    Define um movimento completo.
-    'from_pos': Posição inicial da peça que se move.
-    'to_pos': Posição final da peça após todos os saltos.
-    'captures': Lista de posições (row, col) de todas as peças capturadas
-               NESTA CADEIA de movimento.
-    """
-    from_pos: tuple[int, int]
-    to_pos: tuple[int, int]
-    captures: list[tuple[int, int]]
+from src.core.move import Move
+from src.core.bitboard import POS_TO_SQUARE
 
 
 class MoveValidator:
@@ -54,11 +43,7 @@ class MoveValidator:
                         break
                     
                     if board.get_piece(new_row, new_col) is None:
-                        moves.append({
-                            "from_pos": (row, col),
-                            "to_pos": (new_row, new_col),
-                            "captures": []
-                        })
+                        moves.append(Move((row, col), (new_row, new_col), []))
                     else:
                         break
         else:
@@ -68,44 +53,44 @@ class MoveValidator:
             for dr, dc in directions:
                 new_row, new_col = row + dr, col + dc
                 if board.is_within_bounds(new_row, new_col) and board.get_piece(new_row, new_col) is None:
-                    moves.append({
-                        "from_pos": (row, col),
-                        "to_pos": (new_row, new_col),
-                        "captures": []
-                    })
+                    moves.append(Move((row, col), (new_row, new_col), []))
         return moves
 
     def _find_chains_for_piece(self, board: Board, piece: Piece, start_row: int, start_col: int) -> list[Move]:
 
+        # O estado da busca é (casa atual, máscara das capturas): o tabuleiro não
+        # muda durante a cadeia, então dois caminhos que chegam ao mesmo estado
+        # (ex.: as mesmas peças capturadas em outra ordem) têm as mesmas
+        # continuações. Cada estado é expandido uma única vez, o que também
+        # elimina cadeias equivalentes (mesmo destino e mesmas capturas).
         all_chains = []
-        
-        stack: list[tuple[int, int, list[tuple[int, int]]]] = [(start_row, start_col, [])]
+        visited: set[tuple[int, int, int]] = set()
+
+        stack: list[tuple[int, int, tuple[tuple[int, int], ...], int]] = [(start_row, start_col, (), 0)]
         
         while stack:
-            curr_row, curr_col, captures_so_far = stack.pop()
+            curr_row, curr_col, captures_so_far, captured_mask = stack.pop()
             
-            potential_jumps = self._find_single_jumps(board, piece, curr_row, curr_col, captures_so_far)
+            potential_jumps = self._find_single_jumps(board, piece, curr_row, curr_col, captured_mask)
             
             if not potential_jumps:
                 if captures_so_far:
-                    all_chains.append({
-                        "from_pos": (start_row, start_col),
-                        "to_pos": (curr_row, curr_col),
-                        "captures": captures_so_far
-                    })
+                    all_chains.append(Move((start_row, start_col), (curr_row, curr_col), captures_so_far))
             else:
-                for jump in potential_jumps:
-                    new_pos = jump["to_pos"]
-                    captured_pos = jump["captures"][0]
-                    
-                    new_capture_list = captures_so_far + [captured_pos]
+                for new_pos, captured_pos in potential_jumps:
+                    new_mask = captured_mask | 1 << POS_TO_SQUARE[captured_pos[0] * board.COLS + captured_pos[1]]
+                    state = (new_pos[0], new_pos[1], new_mask)
+                    if state in visited:
+                        continue
+                    visited.add(state)
                     
-                    stack.append((new_pos[0], new_pos[1], new_capture_list))
+                    stack.append((new_pos[0], new_pos[1], captures_so_far + (captured_pos,), new_mask))
         
         return all_chains
 
     def _find_single_jumps(self, board: Board, piece: Piece, row: int, col: int, 
-                           already_captured: list[tuple[int, int]]) -> list[Move]:
+                           captured_mask: int) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """Saltos de uma captura a partir de (row, col): [(destino, peça capturada), ...]"""
         jumps = []
 
         if piece.is_king:
@@ -125,17 +110,13 @@ class MoveValidator:
                             if scanned_piece.player == piece.player:
                                 break
                             else:
-                                if (scan_row, scan_col) not in already_captured:
+                                if not captured_mask >> POS_TO_SQUARE[scan_row * board.COLS + scan_col] & 1:
                                     opponent_to_capture = (scan_row, scan_col)
                     else:
                         if scanned_piece:
                             break
                         else:
-                            jumps.append({
-                                "from_pos": (row, col),
-                                "to_pos": (scan_row, scan_col),
-                                "captures": [opponent_to_capture]
-                            })
+                            jumps.append(((scan_row, scan_col), opponent_to_capture))
         else:
             directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
             for dr, dc in directions:
@@ -150,10 +131,6 @@ class MoveValidator:
                 if opponent_piece and opponent_piece.player != piece.player and \
                    board.get_piece(dest_row, dest_col) is None:
                     
-                    if (mid_row, mid_col) not in already_captured:
-                        jumps.append({
-                            "from_pos": (row, col),
-                            "to_pos": (dest_row, dest_col),
-                            "captures": [(mid_row, mid_col)]
-                        })
-        return jumps
\ No newline at end of file
+                    if not captured_mask >> POS_TO_SQUARE[mid_row * board.COLS + mid_col] & 1:
+                        jumps.append(((dest_row, dest_col), (mid_row, mid_col)))
+        return jumps
@@ -0,0 +1,130 @@
+from src.core.board import Board
+from src.core.piece import Player
+from src.core.bitboard import (
+    RAYS, JUMPS, JUMP_MIDS_MASK, WHITE_MAN_STEPS, BLACK_MAN_STEPS
+)
+from src.core.move import Move
+
+# Movimentos simples são imutáveis: um objeto pré-construído por (origem, destino)
+_SIMPLE_MOVES: list[dict[int, Move]] = [
+    {dest: Move.from_squares(sq, dest) for ray in RAYS[sq] for dest in ray}
+    for sq in range(len(RAYS))
+]
+
+
+class TableMoveValidator:
+    """
+    Gerador de movimentos baseado nos bitboards do Board e em tabelas
+    pré-calculadas (raios diagonais e saltos por casa, ver src.core.bitboard).
+
+    Devolve exatamente os mesmos movimentos do MoveValidator, na mesma ordem,
+    mas sem chamar get_piece/is_within_bounds casa a casa.
+    """
+
+    def get_all_legal_moves_for_player(self, board: Board, player: Player) -> list[Move]:
+
+        own = board.pieces_of(player)
+        kings = board.kings_of(player)
+        opponent = board.occupied & ~own
+        occupied = own | opponent
+
+        # As casas são visitadas em ordem crescente, que é a mesma ordem
+        # linha a linha do MoveValidator.
+        all_capture_chains = []
+        remaining = own
+        while remaining:
+            bit = remaining & -remaining
+            remaining ^= bit
+            sq = bit.bit_length() - 1
+
+            if kings & bit:
+                all_capture_chains.extend(
+                    self._find_chains_for_square(sq, True, own, opponent, occupied))
+            elif opponent & JUMP_MIDS_MASK[sq]:
+                all_capture_chains.extend(
+                    self._find_chains_for_square(sq, False, own, opponent, occupied))
+
+        if all_capture_chains:
+            max_captures = max(len(chain["captures"]) for chain in all_capture_chains)
+            return [chain for chain in all_capture_chains if len(chain["captures"]) == max_captures]
+
+        return self._get_simple_moves(own, kings, occupied, player)
+
+    def _get_simple_moves(self, own: int, kings: int, occupied: int, player: Player) -> list[Move]:
+        man_steps = WHITE_MAN_STEPS if player == Player.WHITE else BLACK_MAN_STEPS
+        moves = []
+
+        remaining = own
+        while remaining:
+            bit = remaining & -remaining
+            remaining ^= bit
+            sq = bit.bit_length() - 1
+            simple_moves = _SIMPLE_MOVES[sq]
+
+            if kings & bit:
+                for ray in RAYS[sq]:
+                    for dest in ray:
+                        if occupied & (1 << dest):
+                            break
+                        moves.append(simple_moves[dest])
+            else:
+                for dest in man_steps[sq]:
+                    if not occupied & (1 << dest):
+                        moves.append(simple_moves[dest])
+        return moves
+
+    def _find_chains_for_square(self, start: int, is_king: bool, own: int,
+                                opponent: int, occupied: int) -> list[Move]:
+        # Assim como no MoveValidator, a peça não sai da casa inicial e as
+        # peças capturadas continuam no tabuleiro durante a busca da cadeia.
+        # Cada estado (casa atual, máscara das capturas) é expandido uma única
+        # vez, eliminando cadeias equivalentes.
+        all_chains = []
+        visited: set[int] = set()
+
+        # (casa atual, capturas em ordem, máscara das capturas)
+        stack: list[tuple[int, tuple[int, ...], int]] = [(start, (), 0)]
+
+        while stack:
+            curr, captures_so_far, captured_mask = stack.pop()
+
+            jumps = self._find_single_jumps(curr, is_king, own, opponent, occupied, captured_mask)
+
+            if not jumps:
+                if captures_so_far:
+                    all_chains.append(Move.from_squares(start, curr, captures_so_far))
+            else:
+                for dest, captured in jumps:
+                    new_mask = captured_mask | (1 << captured)
+                    state = dest | new_mask << 5
+                    if state in visited:
+                        continue
+                    visited.add(state)
+                    stack.append((dest, captures_so_far + (captured,), new_mask))
+
+        return all_chains
+
+    def _find_single_jumps(self, sq: int, is_king: bool, own: int, opponent: int,
+                           occupied: int, captured_mask: int) -> list[tuple[int, int]]:
+        jumps = []
+
+        if is_king:
+            for ray in RAYS[sq]:
+                opponent_to_capture = -1
+                for scan in ray:
+                    bit = 1 << scan
+                    if opponent_to_capture < 0:
+                        if own & bit:
+                            break
+                        if opponent & bit and not captured_mask & bit:
+                            opponent_to_capture = scan
+                    elif occupied & bit:
+                        break
+                    else:
+                        jumps.append((scan, opponent_to_capture))
+        else:
+            for mid, dest in JUMPS[sq]:
+                mid_bit = 1 << mid
+                if opponent & mid_bit and not occupied & (1 << dest) and not captured_mask & mid_bit:
+                    jumps.append((dest, mid))
+        return jumps
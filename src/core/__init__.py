@@ -1,3 +1,3 @@
 """Core game entities: Board, Piece, Move"""
 
-__all__ = ["board", "piece", "move"]
+__all__ = ["board", "bitboard", "piece", "move", "zobrist", "transposition_table", "lru_cache"]
@@ -0,0 +1,94 @@
+"""
+Tabelas de casas para a representação em bitboard do tabuleiro.
+
+Apenas as 32 casas escuras ((row + col) % 2 == 1) são jogáveis, então cada
+casa recebe um índice de 0 a 31 em ordem de leitura (linha a linha):
+
+    square = row * 4 + col // 2
+
+Um conjunto de peças é guardado como um inteiro de 32 bits em que o bit
+'square' indica se a casa está ocupada.
+"""
+
+ROWS, COLS = 8, 8
+NUM_SQUARES = 32
+FULL_MASK = (1 << NUM_SQUARES) - 1
+
+# square -> (row, col)
+SQUARE_TO_POS: list[tuple[int, int]] = [
+    (r, c) for r in range(ROWS) for c in range(COLS) if (r + c) % 2 == 1
+]
+
+# row * COLS + col -> square (ou -1 para casas claras)
+POS_TO_SQUARE: list[int] = [-1] * (ROWS * COLS)
+for _sq, (_r, _c) in enumerate(SQUARE_TO_POS):
+    POS_TO_SQUARE[_r * COLS + _c] = _sq
+
+# Casas de promoção: as Brancas coroam na linha 0 e as Pretas na linha 7
+WHITE_PROMOTION_MASK = sum(1 << sq for sq, (r, _) in enumerate(SQUARE_TO_POS) if r == 0)
+BLACK_PROMOTION_MASK = sum(1 << sq for sq, (r, _) in enumerate(SQUARE_TO_POS) if r == ROWS - 1)
+
+
+def square_of(row: int, col: int) -> int:
+    """Retorna o índice da casa (0-31), ou -1 se a casa não for jogável."""
+    if 0 <= row < ROWS and 0 <= col < COLS:
+        return POS_TO_SQUARE[row * COLS + col]
+    return -1
+
+
+def iter_squares(mask: int):
+    """Itera os índices dos bits ligados em 'mask', do menor para o maior."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def popcount(mask: int) -> int:
+    return mask.bit_count()
+
+
+# --- Tabelas de movimento (calculadas uma única vez na importação) ---
+
+# Mesma ordem de direções usada pelo MoveValidator
+DIRECTIONS: list[tuple[int, int]] = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+
+def _build_rays() -> list[list[tuple[int, ...]]]:
+    rays = []
+    for r, c in SQUARE_TO_POS:
+        square_rays = []
+        for dr, dc in DIRECTIONS:
+            ray = []
+            for i in range(1, ROWS):
+                sq = square_of(r + dr * i, c + dc * i)
+                if sq < 0:
+                    break
+                ray.append(sq)
+            square_rays.append(tuple(ray))
+        rays.append(square_rays)
+    return rays
+
+
+# RAYS[square][d] -> casas na diagonal DIRECTIONS[d], da mais próxima à mais distante
+RAYS: list[list[tuple[int, ...]]] = _build_rays()
+
+# JUMPS[square] -> [(casa_do_meio, casa_de_destino), ...] nas quatro direções
+# (apenas quando o destino está dentro do tabuleiro)
+JUMPS: list[tuple[tuple[int, int], ...]] = [
+    tuple((ray[0], ray[1]) for ray in RAYS[sq] if len(ray) >= 2)
+    for sq in range(NUM_SQUARES)
+]
+
+# JUMP_MIDS_MASK[square] -> casas do meio de todos os saltos possíveis a partir
+# da casa (uma peça comum só pode capturar se houver um adversário nelas)
+JUMP_MIDS_MASK: list[int] = [sum(1 << mid for mid, _ in JUMPS[sq]) for sq in range(NUM_SQUARES)]
+
+# Passos simples das peças comuns: Brancas sobem (direções 0 e 1),
+# Pretas descem (direções 2 e 3)
+WHITE_MAN_STEPS: list[tuple[int, ...]] = [
+    tuple(RAYS[sq][d][0] for d in (0, 1) if RAYS[sq][d]) for sq in range(NUM_SQUARES)
+]
+BLACK_MAN_STEPS: list[tuple[int, ...]] = [
+    tuple(RAYS[sq][d][0] for d in (2, 3) if RAYS[sq][d]) for sq in range(NUM_SQUARES)
+]
@@ -1,34 +1,263 @@
 from src.core.piece import Piece, Player
+from src.core.bitboard import (
+    NUM_SQUARES, POS_TO_SQUARE, WHITE_PROMOTION_MASK, BLACK_PROMOTION_MASK, iter_squares
+)
+from src.core.zobrist import PIECE_KEYS, BLACK_TO_MOVE_KEY, hash_masks
+from src.core.move import Move
 from typing import Optional
 
 ROWS, COLS = 8, 8
+WHITE, BLACK = Player.WHITE, Player.BLACK
+WM_KEYS, WK_KEYS, BM_KEYS, BK_KEYS = PIECE_KEYS
+# Símbolos da notação compacta, na mesma ordem de Board.masks()
+_SYMBOLS = "wWbB"
 
 class Board:
+    """
+    Tabuleiro representado por quatro bitboards de 32 bits (um bit por casa
+    escura, ver src.core.bitboard):
+    - white_men / white_kings: peças simples e damas das Brancas
+    - black_men / black_kings: peças simples e damas das Pretas
+
+    get_piece/add_piece/move_piece/remove_piece continuam disponíveis como uma
+    "visão" compatível com a antiga grade 8x8. Note que get_piece devolve um
+    Piece novo a cada chamada: alterá-lo não altera o tabuleiro (use promote).
+
+    'hash' é a chave de Zobrist da posição (ver src.core.zobrist), mantida
+    incrementalmente por todas as operações que alteram o tabuleiro.
+    """
     ROWS = ROWS
     COLS = COLS
-    
+
+    __slots__ = ("white_men", "white_kings", "black_men", "black_kings", "hash")
+
     def __init__(self):
-        self.grid: list[list[Optional[Piece]]] = [[None for _ in range(COLS)] for _ in range(ROWS)]
+        self.white_men = 0
+        self.white_kings = 0
+        self.black_men = 0
+        self.black_kings = 0
+        self.hash = 0
+
+    @classmethod
+    def from_masks(cls, white_men: int, white_kings: int, black_men: int, black_kings: int) -> 'Board':
+        board = cls.__new__(cls)
+        board.white_men = white_men
+        board.white_kings = white_kings
+        board.black_men = black_men
+        board.black_kings = black_kings
+        board.hash = hash_masks(white_men, white_kings, black_men, black_kings)
+        return board
+
+    @classmethod
+    def from_string(cls, text: str) -> 'Board':
+        """
+        Cria um tabuleiro a partir da notação compacta de to_string: 32
+        caracteres, um por casa escura em ordem de leitura, sendo
+        'w'/'W' peça/dama Branca, 'b'/'B' peça/dama Preta e '.' casa vazia.
+        """
+        if len(text) != NUM_SQUARES:
+            raise ValueError(f"Posição deve ter {NUM_SQUARES} casas, recebeu {len(text)}: {text!r}")
+        masks = [0, 0, 0, 0]
+        for sq, symbol in enumerate(text):
+            if symbol == '.':
+                continue
+            if symbol not in _SYMBOLS:
+                raise ValueError(f"Símbolo inválido {symbol!r} na posição {text!r}")
+            masks[_SYMBOLS.index(symbol)] |= 1 << sq
+        return cls.from_masks(*masks)
+
+    def to_string(self) -> str:
+        out = []
+        for sq in range(NUM_SQUARES):
+            bit = 1 << sq
+            for symbol, mask in zip(_SYMBOLS, self.masks()):
+                if mask & bit:
+                    out.append(symbol)
+                    break
+            else:
+                out.append('.')
+        return ''.join(out)
+
+    def masks(self) -> tuple[int, int, int, int]:
+        return self.white_men, self.white_kings, self.black_men, self.black_kings
+
+    def position_key(self, player: Player) -> int:
+        """Hash de Zobrist da posição com 'player' como lado a jogar."""
+        return self.hash ^ BLACK_TO_MOVE_KEY if player == BLACK else self.hash
+
+    @property
+    def occupied(self) -> int:
+        return self.white_men | self.white_kings | self.black_men | self.black_kings
+
+    def pieces_of(self, player: Player) -> int:
+        if player == Player.WHITE:
+            return self.white_men | self.white_kings
+        return self.black_men | self.black_kings
+
+    def men_of(self, player: Player) -> int:
+        return self.white_men if player == Player.WHITE else self.black_men
+
+    def kings_of(self, player: Player) -> int:
+        return self.white_kings if player == Player.WHITE else self.black_kings
+
+    def _square_bit(self, row: int, col: int) -> int:
+        if 0 <= row < ROWS and 0 <= col < COLS:
+            sq = POS_TO_SQUARE[row * COLS + col]
+            if sq >= 0:
+                return 1 << sq
+        return 0
 
     def get_piece(self, row: int, col: int) -> Optional[Piece]:
-        if self.is_within_bounds(row, col):
-            return self.grid[row][col]
+        if not (0 <= row < ROWS and 0 <= col < COLS):
+            return None
+        sq = POS_TO_SQUARE[row * COLS + col]
+        if sq < 0:
+            return None
+        bit = 1 << sq
+        if self.white_men & bit:
+            return Piece(WHITE)
+        if self.black_men & bit:
+            return Piece(BLACK)
+        if self.white_kings & bit:
+            return Piece(WHITE, True)
+        if self.black_kings & bit:
+            return Piece(BLACK, True)
         return None
 
     def add_piece(self, piece: Piece, row: int, col: int):
-        if self.is_within_bounds(row, col):
-            self.grid[row][col] = piece
+        # Casas claras não existem no bitboard: a peça é ignorada,
+        # assim como acontece fora dos limites.
+        bit = self._square_bit(row, col)
+        if not bit:
+            return
+        self._clear(bit)
+        sq = bit.bit_length() - 1
+        if piece.player == Player.WHITE:
+            if piece.is_king:
+                self.white_kings |= bit
+                self.hash ^= WK_KEYS[sq]
+            else:
+                self.white_men |= bit
+                self.hash ^= WM_KEYS[sq]
+        else:
+            if piece.is_king:
+                self.black_kings |= bit
+                self.hash ^= BK_KEYS[sq]
+            else:
+                self.black_men |= bit
+                self.hash ^= BM_KEYS[sq]
 
     def remove_piece(self, row: int, col: int):
-        if self.is_within_bounds(row, col):
-            self.grid[row][col] = None
+        bit = self._square_bit(row, col)
+        if bit:
+            self._clear(bit)
 
     def move_piece(self, from_row: int, from_col: int, to_row: int, to_col: int):
-        
-        piece = self.get_piece(from_row, from_col)
-        if piece:
-            self.remove_piece(from_row, from_col)
-            self.add_piece(piece, to_row, to_col)
+
+        from_bit = self._square_bit(from_row, from_col)
+        to_bit = self._square_bit(to_row, to_col)
+        if not from_bit or not to_bit or from_bit == to_bit:
+            return
+        from_sq = from_bit.bit_length() - 1
+        to_sq = to_bit.bit_length() - 1
+        if self.white_men & from_bit:
+            self._clear(to_bit)
+            self.white_men ^= from_bit | to_bit
+            self.hash ^= WM_KEYS[from_sq] ^ WM_KEYS[to_sq]
+        elif self.white_kings & from_bit:
+            self._clear(to_bit)
+            self.white_kings ^= from_bit | to_bit
+            self.hash ^= WK_KEYS[from_sq] ^ WK_KEYS[to_sq]
+        elif self.black_men & from_bit:
+            self._clear(to_bit)
+            self.black_men ^= from_bit | to_bit
+            self.hash ^= BM_KEYS[from_sq] ^ BM_KEYS[to_sq]
+        elif self.black_kings & from_bit:
+            self._clear(to_bit)
+            self.black_kings ^= from_bit | to_bit
+            self.hash ^= BK_KEYS[from_sq] ^ BK_KEYS[to_sq]
+
+    def promote(self, row: int, col: int):
+        """Transforma a peça simples em (row, col) em dama."""
+        bit = self._square_bit(row, col)
+        if not bit:
+            return
+        sq = bit.bit_length() - 1
+        if self.white_men & bit:
+            self.white_men ^= bit
+            self.white_kings |= bit
+            self.hash ^= WM_KEYS[sq] ^ WK_KEYS[sq]
+        elif self.black_men & bit:
+            self.black_men ^= bit
+            self.black_kings |= bit
+            self.hash ^= BM_KEYS[sq] ^ BK_KEYS[sq]
+
+    def should_promote(self, player: Player, row: int, col: int) -> bool:
+        bit = self._square_bit(row, col)
+        if player == Player.WHITE:
+            return bool(bit & WHITE_PROMOTION_MASK)
+        return bool(bit & BLACK_PROMOTION_MASK)
+
+    def apply_move(self, move) -> tuple[int, int, int, int, int]:
+        """
+        Executa um movimento completo (deslocamento, capturas e promoção)
+        diretamente neste tabuleiro e devolve um token para undo_move.
+        'move' é um src.core.move.Move (ou um dicionário no formato antigo).
+        """
+        token = (self.white_men, self.white_kings, self.black_men, self.black_kings, self.hash)
+
+        key = move.key if type(move) is Move else Move.coerce(move).key
+        from_sq = key & 31
+        to_sq = (key >> 5) & 31
+        captured = key >> 10
+        from_bit = 1 << from_sq
+        to_bit = 1 << to_sq
+
+        if captured:
+            self._clear(captured)
+
+        # Uma peça que só se moveu (sem capturar) nunca chega a uma casa
+        # ocupada, então basta trocar os bits de origem e destino.
+        if self.white_men & from_bit:
+            self.white_men ^= from_bit
+            if to_bit & WHITE_PROMOTION_MASK:
+                self.white_kings |= to_bit
+                self.hash ^= WM_KEYS[from_sq] ^ WK_KEYS[to_sq]
+            else:
+                self.white_men |= to_bit
+                self.hash ^= WM_KEYS[from_sq] ^ WM_KEYS[to_sq]
+        elif self.black_men & from_bit:
+            self.black_men ^= from_bit
+            if to_bit & BLACK_PROMOTION_MASK:
+                self.black_kings |= to_bit
+                self.hash ^= BM_KEYS[from_sq] ^ BK_KEYS[to_sq]
+            else:
+                self.black_men |= to_bit
+                self.hash ^= BM_KEYS[from_sq] ^ BM_KEYS[to_sq]
+        elif self.white_kings & from_bit:
+            self.white_kings ^= from_bit | to_bit
+            self.hash ^= WK_KEYS[from_sq] ^ WK_KEYS[to_sq]
+        elif self.black_kings & from_bit:
+            self.black_kings ^= from_bit | to_bit
+            self.hash ^= BK_KEYS[from_sq] ^ BK_KEYS[to_sq]
+
+        return token
+
+    def undo_move(self, token: tuple[int, int, int, int, int]):
+        """Desfaz um apply_move, restaurando a posição salva no token."""
+        self.white_men, self.white_kings, self.black_men, self.black_kings, self.hash = token
+
+    def _clear(self, bit: int):
+        # 'bit' pode conter várias casas (ex.: todas as capturas de uma cadeia)
+        for kind_mask, keys in ((self.white_men & bit, WM_KEYS), (self.white_kings & bit, WK_KEYS),
+                                (self.black_men & bit, BM_KEYS), (self.black_kings & bit, BK_KEYS)):
+            for sq in iter_squares(kind_mask):
+                self.hash ^= keys[sq]
+        keep = ~bit
+        self.white_men &= keep
+        self.white_kings &= keep
+        self.black_men &= keep
+        self.black_kings &= keep
 
     def is_within_bounds(self, row: int, col: int) -> bool:
         return 0 <= row < ROWS and 0 <= col < COLS
@@ -39,34 +268,32 @@ class Board:
                 if (r + c) % 2 == 1:
                     if r < 3:
                         self.add_piece(Piece(Player.BLACK), r, c)
-                    elif r > 4: 
+                    elif r > 4:
                         self.add_piece(Piece(Player.WHITE), r, c)
 
     def deep_copy(self) -> 'Board':
-        new_board = Board()
-        for r in range(self.ROWS):
-            for c in range(self.COLS):
-                piece = self.get_piece(r, c)
-                if piece:
-                    new_piece = Piece(piece.player)
-                    if piece.is_king:
-                        new_piece.make_king()
-                    new_board.add_piece(new_piece, r, c)
-        return new_board
+        # Copiar uma posição custa apenas cinco inteiros (quatro bitboards e o hash)
+        board = Board.__new__(Board)
+        board.white_men = self.white_men
+        board.white_kings = self.white_kings
+        board.black_men = self.black_men
+        board.black_kings = self.black_kings
+        board.hash = self.hash
+        return board
+
 
-                        
     def __repr__(self) -> str:
         board_str = "   " + "  ".join(str(i) for i in range(COLS)) + "\n" # Headers de coluna
         board_str += "  +" + "---" * COLS + "+\n"
         for r in range(ROWS):
-            board_str += f"{r} |" 
+            board_str += f"{r} |"
             for c in range(COLS):
-                piece = self.grid[r][c]
+                piece = self.get_piece(r, c)
                 if piece:
-                    
+
                     board_str += f"{str(piece):^3}"
                 else:
-                    board_str += " . " 
+                    board_str += " . "
             board_str += "|\n"
         board_str += "  +" + "---" * COLS + "+\n"
-        return board_str
\ No newline at end of file
+        return board_str
@@ -1,12 +1,123 @@
-from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Iterable
+
+from src.core.bitboard import SQUARE_TO_POS, POS_TO_SQUARE
+
+COLS = 8
 
 
-@dataclass
 class Move:
-    src: Tuple[int, int]
-    dst: Tuple[int, int]
-    captures: List[Tuple[int, int]] = None
+    """
+    Define um movimento completo.
+    'from_pos': Posição inicial da peça que se move.
+    'to_pos': Posição final da peça após todos os saltos.
+    'captures': Posições (row, col) de todas as peças capturadas
+               NESTA CADEIA de movimento, na ordem dos saltos.
+
+    O movimento também é empacotado em um único inteiro ('key'):
+        bits 0-4: casa de origem | bits 5-9: casa de destino |
+        bits 10-41: máscara das casas capturadas
+    'key' define igualdade e hash (comparação O(1), serve de chave de
+    dicionário/conjunto e cabe em arrays numéricos). Duas cadeias com a mesma
+    origem, destino e conjunto de capturas são o mesmo movimento.
+
+    O acesso estilo dicionário (move["from_pos"]) continua funcionando como
+    camada de compatibilidade com o antigo formato TypedDict.
+    """
+
+    __slots__ = ("from_pos", "to_pos", "captures", "key")
+
+    def __init__(self, from_pos: tuple[int, int], to_pos: tuple[int, int],
+                 captures: Iterable[tuple[int, int]] = ()):
+        self.from_pos = tuple(from_pos)
+        self.to_pos = tuple(to_pos)
+        self.captures = tuple(tuple(pos) for pos in captures)
+
+        capture_mask = 0
+        for row, col in self.captures:
+            capture_mask |= 1 << POS_TO_SQUARE[row * COLS + col]
+        self.key = (POS_TO_SQUARE[self.from_pos[0] * COLS + self.from_pos[1]]
+                    | POS_TO_SQUARE[self.to_pos[0] * COLS + self.to_pos[1]] << 5
+                    | capture_mask << 10)
+
+    @classmethod
+    def from_squares(cls, from_sq: int, to_sq: int, captured: tuple[int, ...] = ()) -> 'Move':
+        """Cria o movimento a partir de índices de casa (0-31), sem conversões."""
+        move = cls.__new__(cls)
+        move.from_pos = SQUARE_TO_POS[from_sq]
+        move.to_pos = SQUARE_TO_POS[to_sq]
+        move.captures = tuple(SQUARE_TO_POS[sq] for sq in captured)
+        capture_mask = 0
+        for sq in captured:
+            capture_mask |= 1 << sq
+        move.key = from_sq | to_sq << 5 | capture_mask << 10
+        return move
+
+    @classmethod
+    def from_key(cls, key: int) -> 'Move':
+        """Reconstrói um movimento empacotado (as capturas saem em ordem de casa)."""
+        capture_mask = key >> 10
+        captured = tuple(sq for sq in range(32) if capture_mask >> sq & 1)
+        return cls.from_squares(key & 31, (key >> 5) & 31, captured)
+
+    @classmethod
+    def coerce(cls, move) -> 'Move':
+        """Aceita um Move ou um dicionário no formato antigo."""
+        if isinstance(move, Move):
+            return move
+        return cls(move["from_pos"], move["to_pos"], move["captures"])
+
+    @property
+    def from_square(self) -> int:
+        return self.key & 31
+
+    @property
+    def to_square(self) -> int:
+        return (self.key >> 5) & 31
+
+    @property
+    def capture_mask(self) -> int:
+        return self.key >> 10
+
+    # Nomes do antigo dataclass src.core.move.Move
+    @property
+    def src(self) -> tuple[int, int]:
+        return self.from_pos
+
+    @property
+    def dst(self) -> tuple[int, int]:
+        return self.to_pos
 
     def is_capture(self) -> bool:
         return bool(self.captures)
+
+    # --- Compatibilidade com o formato dicionário ---
+
+    def __getitem__(self, name: str):
+        if name in ("from_pos", "to_pos", "captures"):
+            return getattr(self, name)
+        raise KeyError(name)
+
+    def get(self, name: str, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> dict:
+        return {"from_pos": self.from_pos, "to_pos": self.to_pos, "captures": list(self.captures)}
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Move):
+            return self.key == other.key
+        if isinstance(other, dict):
+            try:
+                return self.key == Move.coerce(other).key
+            except (KeyError, TypeError, IndexError):
+                return False
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return f"Move({self.from_pos} -> {self.to_pos}, captures={list(self.captures)})"
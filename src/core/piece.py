@@ -6,11 +6,13 @@ class Player(Enum):
     BLACK = "BLACK"
 
 class Piece:
+
+    __slots__ = ("player", "is_king")
     
-    def __init__(self, player: Player):
+    def __init__(self, player: Player, is_king: bool = False):
 
         self.player = player
-        self.is_king = False
+        self.is_king = is_king
 
     def make_king(self):
         self.is_king = True
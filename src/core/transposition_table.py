@@ -0,0 +1,96 @@
+from typing import Any, Optional
+
+
+class TranspositionTable:
+    """
+    Tabela de transposição de tamanho fixo, indexada pelo hash de Zobrist
+    (ver Board.position_key). Usada pela busca do SearchPlayer, que guarda
+    (score, limite, hash move) em 'value'. A geração de movimentos e a
+    avaliação da rede têm caches próprios (LRUCache no GameManager e
+    EvalCache), com política LRU em vez de profundidade/geração.
+
+    Cada posição do hash cai em um único slot (hash & mask). Política de
+    substituição quando dois hashes disputam o mesmo slot:
+    - slot vazio, mesma chave ou entrada de uma geração antiga: substitui;
+    - caso contrário, substitui apenas se a nova entrada tiver 'depth' maior
+      ou igual (resultados de buscas mais profundas valem mais).
+    Chame new_generation() no início de cada busca/jogo para envelhecer as entradas.
+    """
+
+    def __init__(self, size: int = 1 << 16):
+        # Arredonda para potência de 2 para indexar com uma máscara
+        capacity = 1
+        while capacity < size:
+            capacity <<= 1
+        self.capacity = capacity
+        self._mask = capacity - 1
+        # Cada slot é None ou (chave, profundidade, geração, valor)
+        self._slots: list[Optional[tuple[int, int, int, Any]]] = [None] * capacity
+        self.generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.replacements = 0
+        self.rejected = 0
+        self.used = 0
+
+    def probe(self, key: int) -> Optional[Any]:
+        """Devolve o valor guardado para 'key', ou None (contabiliza acerto/falha)."""
+        entry = self._slots[key & self._mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[3]
+        self.misses += 1
+        return None
+
+    def probe_entry(self, key: int) -> Optional[tuple[int, Any]]:
+        """Como probe, mas devolve (profundidade, valor)."""
+        entry = self._slots[key & self._mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1], entry[3]
+        self.misses += 1
+        return None
+
+    def store(self, key: int, value: Any, depth: int = 0) -> bool:
+        """Guarda 'value' para 'key'. Retorna False se a política recusou a escrita."""
+        index = key & self._mask
+        entry = self._slots[index]
+        if entry is None:
+            self.used += 1
+        elif entry[0] != key:
+            if entry[2] == self.generation and depth < entry[1]:
+                self.rejected += 1
+                return False
+            self.replacements += 1
+        self._slots[index] = (key, depth, self.generation, value)
+        self.stores += 1
+        return True
+
+    def new_generation(self):
+        self.generation += 1
+
+    def clear(self):
+        self._slots = [None] * self.capacity
+        self.used = 0
+
+    def reset_stats(self):
+        self.hits = self.misses = self.stores = self.replacements = self.rejected = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "capacity": self.capacity,
+            "used": self.used,
+            "fill_rate": self.used / self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "replacements": self.replacements,
+            "rejected": self.rejected,
+        }
+
+    def __len__(self) -> int:
+        return self.used
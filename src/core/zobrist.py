@@ -0,0 +1,33 @@
+"""
+Chaves de Zobrist (64 bits) para identificar posições rapidamente.
+
+Cada combinação (tipo de peça, casa) recebe um número aleatório fixo, e o
+hash de uma posição é o XOR das chaves de todas as peças presentes. Assim,
+mover, remover ou promover uma peça atualiza o hash com poucos XORs.
+"""
+import random
+
+from src.core.bitboard import NUM_SQUARES, iter_squares
+
+# Mesma ordem de Board.masks(): peças e damas das Brancas, peças e damas das Pretas
+WHITE_MAN, WHITE_KING, BLACK_MAN, BLACK_KING = range(4)
+
+# Semente fixa: os hashes precisam ser iguais entre processos e execuções
+_rng = random.Random(0x5EED_DA3A)
+
+PIECE_KEYS: list[list[int]] = [
+    [_rng.getrandbits(64) for _ in range(NUM_SQUARES)] for _ in range(4)
+]
+
+# Aplicada quando é a vez das Pretas
+BLACK_TO_MOVE_KEY: int = _rng.getrandbits(64)
+
+
+def hash_masks(white_men: int, white_kings: int, black_men: int, black_kings: int) -> int:
+    """Calcula o hash completo (sem o lado a jogar) a partir dos quatro bitboards."""
+    h = 0
+    for kind, mask in enumerate((white_men, white_kings, black_men, black_kings)):
+        keys = PIECE_KEYS[kind]
+        for sq in iter_squares(mask):
+            h ^= keys[sq]
+    return h
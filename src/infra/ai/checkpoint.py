@@ -0,0 +1,159 @@
+"""
+Checkpoints completos do treino, gravados em segundo plano.
+
+Um checkpoint guarda tudo o que trainer.train precisa para continuar de
+onde parou: pesos, estado do otimizador (momentos do Adam), era, epsilon,
+histórico do erro, memória de replay e estados dos geradores aleatórios.
+
+O laço de treino só tira uma cópia do estado (clone dos tensores para a
+CPU, cópia dos arrays) e a entrega a uma thread, que faz o torch.save.
+A gravação é atômica: escreve em '<arquivo>.tmp', faz fsync e troca de nome
+com os.replace. Uma queda no meio da gravação nunca deixa um checkpoint
+corrompido no lugar do anterior. Só os 'keep' mais recentes são mantidos.
+
+Arquivos: <diretório>/checkpoint-000012.pt (era 12, já concluída).
+"""
+import copy
+import glob
+import os
+import queue
+import re
+import threading
+import time
+from typing import Optional
+
+import torch
+
+CHECKPOINT_PATTERN = "checkpoint-{epoch:06d}.pt"
+_CHECKPOINT_RE = re.compile(r"checkpoint-(\d+)\.pt$")
+
+
+def atomic_torch_save(obj, path: str):
+    """torch.save em um arquivo temporário, fsync e troca de nome (atômica no mesmo disco)."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        torch.save(obj, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def snapshot_state_dict(state_dict: dict) -> dict:
+    """Cópia independente na CPU (o treino continua alterando os tensores originais)."""
+    return {name: tensor.detach().to("cpu", copy=True) for name, tensor in state_dict.items()}
+
+
+def snapshot_optimizer(optimizer: torch.optim.Optimizer) -> dict:
+    """Cópia do state dict do otimizador na CPU (os momentos do Adam mudam a cada passo)."""
+    state_dict = optimizer.state_dict()
+    return {
+        "state": {index: {name: value.detach().to("cpu", copy=True) if torch.is_tensor(value)
+                          else copy.deepcopy(value)
+                          for name, value in values.items()}
+                  for index, values in state_dict["state"].items()},
+        "param_groups": copy.deepcopy(state_dict["param_groups"]),
+    }
+
+
+def list_checkpoints(directory: str) -> list[tuple[int, str]]:
+    """(era, caminho) dos checkpoints do diretório, do mais antigo ao mais recente."""
+    found = []
+    for path in glob.glob(os.path.join(directory, "checkpoint-*.pt")):
+        match = _CHECKPOINT_RE.search(os.path.basename(path))
+        if match:
+            found.append((int(match.group(1)), path))
+    return sorted(found)
+
+
+def latest_checkpoint(directory: str) -> Optional[str]:
+    checkpoints = list_checkpoints(directory)
+    return checkpoints[-1][1] if checkpoints else None
+
+
+def load_checkpoint(path: str, map_location=None) -> dict:
+    # weights_only=False: o checkpoint também guarda arrays NumPy e estados do 'random'
+    return torch.load(path, map_location=map_location, weights_only=False)
+
+
+class CheckpointWriter:
+    """
+    Grava checkpoints em uma thread. A fila comporta um checkpoint pendente:
+    se o treino pedir outro antes do anterior terminar, 'save' espera
+    (a memória usada fica limitada a duas cópias do estado).
+    """
+
+    def __init__(self, directory: str, keep: int = 3):
+        if keep <= 0:
+            raise ValueError(f"keep deve ser positivo, recebeu {keep}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.keep = keep
+        self.saved = 0
+        # Tempo gasto pela thread gravando (não bloqueia o treino; vai para as métricas)
+        self.write_seconds = 0.0
+        self._error: Optional[BaseException] = None
+        self._queue: queue.Queue = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+        self._thread.start()
+
+    def save(self, epoch: int, state: dict, weights_path: Optional[str] = None):
+        """
+        Agenda o checkpoint da era 'epoch'. 'state' já deve ser uma cópia
+        (ver snapshot_state_dict) e ter os pesos em 'model'. Com
+        'weights_path', os pesos também são gravados ali (o .pth que o jogo carrega).
+        """
+        self._raise_pending_error()
+        self._queue.put((epoch, state, weights_path))
+
+    def save_weights(self, model_state: dict, weights_path: str):
+        """Agenda só a gravação dos pesos (nas eras sem checkpoint completo)."""
+        self._raise_pending_error()
+        self._queue.put((None, {"model": model_state}, weights_path))
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                epoch, state, weights_path = job
+                start = time.perf_counter()
+                if weights_path:
+                    atomic_torch_save(state["model"], weights_path)
+                if epoch is not None:
+                    path = os.path.join(self.directory, CHECKPOINT_PATTERN.format(epoch=epoch))
+                    atomic_torch_save(state, path)
+                    self._prune()
+                    self.saved += 1
+                self.write_seconds += time.perf_counter() - start
+            except BaseException as error:  # repassado ao laço de treino no próximo save/close
+                self._error = error
+            finally:
+                self._queue.task_done()
+
+    def _prune(self):
+        for _, path in list_checkpoints(self.directory)[:-self.keep]:
+            os.remove(path)
+
+    def _raise_pending_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("Falha ao gravar checkpoint") from error
+
+    def wait(self):
+        """Espera os checkpoints pendentes serem gravados."""
+        self._queue.join()
+        self._raise_pending_error()
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_pending_error()
+
+    def __enter__(self) -> 'CheckpointWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
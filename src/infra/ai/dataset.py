@@ -0,0 +1,241 @@
+"""
+Conjunto de dados de autojogo em disco, dividido em shards.
+
+O autojogo grava as partidas terminadas em arquivos binários só de
+acréscimo, com registros de tamanho fixo. Assim os dados sobrevivem ao fim
+de trainer.train, podem ser gerados em várias máquinas (cada escritor usa
+um prefixo próprio) e reaproveitados em vários treinos offline sem pagar o
+autojogo de novo.
+
+Formato de cada shard:
+    cabeçalho (64 bytes): magic | versão | nº de registros | nº de partidas | bytes por registro
+    registros: RECORD_DTYPE[nº de registros]
+O escritor acrescenta os registros de uma partida, esvazia o buffer do
+arquivo e só então atualiza as contagens do cabeçalho. Quem lê confia
+apenas no cabeçalho, então uma partida escrita pela metade (queda do
+processo) é simplesmente ignorada.
+
+A leitura (ShardDataset.batches) mapeia os shards com np.memmap e percorre
+blocos de registros em ordem aleatória, de todos os shards, passando por um
+buffer de embaralhamento de tamanho fixo: a memória usada não depende do
+tamanho do conjunto.
+
+    python -m src.infra.ai.dataset selfplay_data/     # resumo dos shards
+"""
+import argparse
+import glob
+import os
+import socket
+from typing import Iterator, Optional
+
+import numpy as np
+
+from src.core.board import Board
+from src.core.piece import Player
+
+MAGIC = int.from_bytes(b"CKSHRD01", "little")
+FORMAT_VERSION = 1
+HEADER_BYTES = 64
+# Índices (uint64) no cabeçalho
+_MAGIC, _VERSION, _NUM_RECORDS, _NUM_GAMES, _RECORD_BYTES = 0, 1, 2, 3, 4
+
+# Mesmos campos da ReplayBuffer, sem alinhamento: 21 bytes por posição
+RECORD_DTYPE = np.dtype([
+    ("positions", "<u4", (4,)),
+    ("target", "<f4"),
+    ("player", "u1"),
+])
+
+SHARD_SUFFIX = ".shard"
+RECORDS_PER_SHARD = 1_000_000
+
+
+def default_prefix() -> str:
+    """Prefixo único por máquina e processo (vários escritores no mesmo diretório)."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class ShardWriter:
+    """Grava partidas de autojogo em shards de até 'records_per_shard' posições."""
+
+    def __init__(self, directory: str, prefix: Optional[str] = None,
+                 records_per_shard: int = RECORDS_PER_SHARD):
+        if records_per_shard <= 0:
+            raise ValueError(f"records_per_shard deve ser positivo, recebeu {records_per_shard}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.prefix = prefix or default_prefix()
+        self.records_per_shard = records_per_shard
+        self.shard_index = 0
+        self.num_records = 0
+        self.num_games = 0
+        self._file = None
+        self._header = np.zeros(HEADER_BYTES // 8, dtype=np.uint64)
+
+    @property
+    def path(self) -> Optional[str]:
+        return self._file.name if self._file else None
+
+    def _open_next_shard(self):
+        self.close()
+        # Não sobrescreve shards de uma execução anterior com o mesmo prefixo
+        while True:
+            path = os.path.join(self.directory, f"{self.prefix}-{self.shard_index:05d}{SHARD_SUFFIX}")
+            self.shard_index += 1
+            if not os.path.exists(path):
+                break
+        self._file = open(path, "wb")
+        self._header[:] = 0
+        self._header[_MAGIC] = MAGIC
+        self._header[_VERSION] = FORMAT_VERSION
+        self._header[_RECORD_BYTES] = RECORD_DTYPE.itemsize
+        self._write_header()
+
+    def _write_header(self):
+        self._file.flush()
+        self._file.seek(0)
+        self._file.write(self._header.tobytes())
+        self._file.seek(0, os.SEEK_END)
+        self._file.flush()
+
+    def add_game(self, positions: np.ndarray, players: np.ndarray, winner: int):
+        """Uma partida (mesmo formato de ReplayBuffer.add_game): alvo +1 para o vencedor, -1 para o perdedor."""
+        players = np.asarray(players, dtype=np.uint8)
+        if len(players) == 0:
+            return
+        records = np.empty(len(players), dtype=RECORD_DTYPE)
+        records["positions"] = np.asarray(positions, dtype=np.uint32).reshape(-1, 4)
+        records["player"] = players
+        records["target"] = np.where(players == winner, 1.0, -1.0)
+
+        # A partida inteira fica no mesmo shard
+        if self._file is None or (self._header[_NUM_RECORDS]
+                                  and self._header[_NUM_RECORDS] + len(records) > self.records_per_shard):
+            self._open_next_shard()
+        self._file.write(records.tobytes())
+        self._header[_NUM_RECORDS] += len(records)
+        self._header[_NUM_GAMES] += 1
+        self._write_header()
+
+        self.num_records += len(records)
+        self.num_games += 1
+
+    def add_samples(self, samples: list[tuple[Board, Player, float]]):
+        """Formato de trainer.play_one_game: (board, jogador, +1/-1) de uma partida."""
+        if not samples:
+            return
+        winner = next((0 if player == Player.WHITE else 1)
+                      for _, player, result in samples if result > 0)
+        self.add_game([board.masks() for board, _, _ in samples],
+                      [0 if player == Player.WHITE else 1 for _, player, _ in samples],
+                      winner)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'ShardWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_shard(path: str) -> tuple[np.ndarray, int]:
+    """(registros como np.memmap somente leitura, nº de partidas) de um shard."""
+    header = np.fromfile(path, dtype=np.uint64, count=HEADER_BYTES // 8)
+    if (len(header) < HEADER_BYTES // 8 or header[_MAGIC] != MAGIC
+            or header[_VERSION] != FORMAT_VERSION or header[_RECORD_BYTES] != RECORD_DTYPE.itemsize):
+        raise ValueError(f"{path} não é um shard de autojogo (versão {FORMAT_VERSION})")
+    num_records = int(header[_NUM_RECORDS])
+    if num_records == 0:
+        return np.empty(0, dtype=RECORD_DTYPE), int(header[_NUM_GAMES])
+    records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_BYTES, shape=(num_records,))
+    return records, int(header[_NUM_GAMES])
+
+
+class ShardDataset:
+    """Leitura em fluxo de todos os shards de um ou mais diretórios/arquivos."""
+
+    def __init__(self, *sources: str):
+        paths = []
+        for source in sources:
+            if os.path.isdir(source):
+                paths.extend(sorted(glob.glob(os.path.join(source, f"*{SHARD_SUFFIX}"))))
+            else:
+                paths.append(source)
+        if not paths:
+            raise FileNotFoundError(f"Nenhum shard ({SHARD_SUFFIX}) em {', '.join(sources)}")
+
+        self.paths = paths
+        self.shards = []
+        self.num_games = 0
+        for path in paths:
+            records, num_games = open_shard(path)
+            self.shards.append(records)
+            self.num_games += num_games
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self.shards)
+
+    def batches(self, batch_size: int, rng: Optional[np.random.Generator] = None,
+                shuffle_buffer: int = 200_000, block_size: int = 1024
+                ) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Uma passada por todas as posições, em lotes (positions (n, 4),
+        players (n,), targets (n,)) no formato de ReplayBuffer.sample.
+
+        Os blocos de 'block_size' registros consecutivos são visitados em
+        ordem aleatória (misturando os shards) e acumulados até
+        'shuffle_buffer' posições, que são embaralhadas antes de virar lotes.
+        Posições vizinhas de uma mesma partida quase nunca caem no mesmo lote.
+        """
+        rng = rng or np.random.default_rng()
+        blocks = [(shard, start)
+                  for shard, records in enumerate(self.shards)
+                  for start in range(0, len(records), block_size)]
+        order = rng.permutation(len(blocks))
+        shuffle_buffer = max(shuffle_buffer, batch_size)
+
+        pending: list[np.ndarray] = []
+        pending_size = 0
+        for position, block in enumerate(order):
+            shard, start = blocks[block]
+            chunk = np.array(self.shards[shard][start:start + block_size])
+            pending.append(chunk)
+            pending_size += len(chunk)
+            last = position == len(order) - 1
+            if pending_size < shuffle_buffer and not last:
+                continue
+
+            buffer = np.concatenate(pending)
+            buffer = buffer[rng.permutation(len(buffer))]
+            # Lotes completos saem agora; a sobra continua no buffer (ou sai no fim)
+            usable = len(buffer) if last else len(buffer) - len(buffer) % batch_size
+            for batch_start in range(0, usable, batch_size):
+                batch = buffer[batch_start:batch_start + batch_size]
+                # Campos contíguos (o registro empacotado não é alinhado)
+                yield (np.ascontiguousarray(batch["positions"]), np.ascontiguousarray(batch["player"]),
+                       np.ascontiguousarray(batch["target"]))
+            pending = [buffer[usable:]]
+            pending_size = len(pending[0])
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Resumo dos shards de autojogo")
+    parser.add_argument("sources", nargs="+", help="diretórios ou arquivos .shard")
+    args = parser.parse_args(argv)
+
+    dataset = ShardDataset(*args.sources)
+    for path, records in zip(dataset.paths, dataset.shards):
+        print(f"{path}: {len(records)} posições ({os.path.getsize(path) / 1e6:.1f} MB)")
+    positions = len(dataset)
+    print(f"Total: {len(dataset.paths)} shards, {dataset.num_games} partidas, {positions} posições")
+    if positions:
+        targets = np.concatenate([records["target"] for records in dataset.shards])
+        print(f"Alvo médio: {targets.mean():+.3f}")
+
+
+if __name__ == "__main__":
+    main()
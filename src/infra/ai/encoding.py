@@ -0,0 +1,112 @@
+"""
+Codificação vetorizada de posições para a CheckersNet (somente NumPy).
+
+A posição vem dos bitboards do Board (ver src.core.bitboard): cada máscara
+de 32 bits é desempacotada com np.unpackbits e espalhada nas casas escuras
+do plano 8x8, sem nenhum get_piece. Os planos seguem a representação
+"centrada no jogador" de board_to_tensor:
+    canal 0: peças do jogador (simples e damas) | canal 1: damas do jogador
+    canal 2: peças do oponente                  | canal 3: damas do oponente
+"""
+import numpy as np
+
+from src.core.board import Board
+from src.core.piece import Player
+from src.core.bitboard import ROWS, COLS, NUM_SQUARES, SQUARE_TO_POS
+
+NUM_CHANNELS = 4
+
+# Casa de bitboard (0-31) -> índice no plano achatado 8x8
+DARK_SQUARE_INDEX = np.array([r * COLS + c for r, c in SQUARE_TO_POS], dtype=np.intp)
+
+
+def player_masks(masks: tuple[int, int, int, int], player: Player) -> tuple[int, int, int, int]:
+    """(wm, wk, bm, bk) -> as 4 máscaras dos canais, do ponto de vista de 'player'."""
+    white_men, white_kings, black_men, black_kings = masks
+    white = white_men | white_kings
+    black = black_men | black_kings
+    if player == Player.WHITE:
+        return white, white_kings, black, black_kings
+    return black, black_kings, white, white_kings
+
+
+def channel_masks_from_bitboards(positions: np.ndarray, black_to_move: np.ndarray) -> np.ndarray:
+    """Versão vetorizada de player_masks: (N, 4) bitboards + (N,) lado -> (N, 4) máscaras de canal."""
+    positions = np.asarray(positions, dtype=np.uint32).reshape(-1, 4)
+    black_to_move = np.asarray(black_to_move, dtype=bool).reshape(-1, 1)
+    white = positions[:, 0] | positions[:, 1]
+    black = positions[:, 2] | positions[:, 3]
+    as_white = np.stack([white, positions[:, 1], black, positions[:, 3]], axis=1)
+    as_black = np.stack([black, positions[:, 3], white, positions[:, 1]], axis=1)
+    return np.where(black_to_move, as_black, as_white)
+
+
+def encode_channel_masks(channel_masks: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    (N, 4) máscaras de canal -> (N, 4, 8, 8) float32.
+    Se 'out' for dado (float32 contíguo, com as casas claras zeradas), escreve
+    nele e o devolve; as casas claras nunca são tocadas.
+    """
+    channel_masks = np.asarray(channel_masks, dtype='<u4').reshape(-1, NUM_CHANNELS)
+    n = len(channel_masks)
+    if out is None:
+        out = np.zeros((n, NUM_CHANNELS, ROWS, COLS), dtype=np.float32)
+
+    bits = np.unpackbits(channel_masks.view(np.uint8), axis=1, bitorder='little')
+    flat = out.reshape(n, NUM_CHANNELS, ROWS * COLS)
+    flat[:, :, DARK_SQUARE_INDEX] = bits.reshape(n, NUM_CHANNELS, NUM_SQUARES)
+    return out
+
+
+def encode_boards(boards: list[Board], players: list[Player], out: np.ndarray = None) -> np.ndarray:
+    """Codifica um lote de tabuleiros, cada um do ponto de vista do seu jogador."""
+    channel_masks = [player_masks(board.masks(), player) for board, player in zip(boards, players)]
+    return encode_channel_masks(np.array(channel_masks, dtype=np.uint32).reshape(-1, NUM_CHANNELS), out)
+
+
+def successor_masks(board: Board, moves: list, player: Player) -> np.ndarray:
+    """
+    Máscaras de canal (N, 4) das posições após cada movimento de 'player',
+    do ponto de vista do oponente (quem joga a seguir). O tabuleiro volta ao
+    estado original.
+    """
+    opponent = Player.BLACK if player == Player.WHITE else Player.WHITE
+    channel_masks = []
+    for move in moves:
+        undo_token = board.apply_move(move)
+        channel_masks.append(player_masks(board.masks(), opponent))
+        board.undo_move(undo_token)
+    return np.array(channel_masks, dtype=np.uint32).reshape(-1, NUM_CHANNELS)
+
+
+def evaluate_successors(evaluate, board: Board, moves: list, player: Player, eval_cache=None) -> list[float]:
+    """
+    Scores brutos da rede para as posições após cada movimento (do ponto de
+    vista do oponente). 'evaluate' recebe (k, 4) máscaras de canal e devolve
+    k scores; com 'eval_cache' (ver eval_cache.EvalCache), só as posições
+    ainda não avaliadas são enviadas a ele, em um único lote.
+    """
+    if eval_cache is None:
+        return list(evaluate(successor_masks(board, moves, player)))
+
+    opponent = Player.BLACK if player == Player.WHITE else Player.WHITE
+    scores = [None] * len(moves)
+    missing, missing_keys, missing_masks = [], [], []
+    for i, move in enumerate(moves):
+        undo_token = board.apply_move(move)
+        key = board.position_key(opponent)
+        score = eval_cache.get(key)
+        if score is None:
+            missing.append(i)
+            missing_keys.append(key)
+            missing_masks.append(player_masks(board.masks(), opponent))
+        else:
+            scores[i] = score
+        board.undo_move(undo_token)
+
+    if missing:
+        new_scores = evaluate(np.array(missing_masks, dtype=np.uint32).reshape(-1, NUM_CHANNELS))
+        for i, key, score in zip(missing, missing_keys, new_scores):
+            scores[i] = score
+            eval_cache.put(key, score)
+    return scores
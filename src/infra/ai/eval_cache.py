@@ -0,0 +1,49 @@
+from typing import Hashable, Optional
+
+from src.core.lru_cache import LRUCache
+
+
+class EvalCache(LRUCache):
+    """
+    Cache dos scores da rede, por posição: a chave é Board.position_key
+    (hash Zobrist + lado a jogar) e o valor é o score bruto da CheckersNet
+    para quem joga naquela posição.
+
+    Os scores só valem para os pesos que os calcularam. Quando os pesos
+    mudam, o cache fica "vencido" e é esvaziado na próxima consulta:
+    - invalidate(): chamada manual (ex.: depois de carregar outro .pth);
+    - watch_optimizer(optimizer): invalida a cada optimizer.step().
+    """
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._stale = False
+        self.invalidations = 0
+
+    def invalidate(self):
+        # Só marca: muitos passos seguidos do otimizador custam um clear só
+        self._stale = True
+
+    def watch_optimizer(self, optimizer):
+        """Registra um hook que invalida o cache após cada passo do otimizador."""
+        return optimizer.register_step_post_hook(lambda *_: self.invalidate())
+
+    def _drop_if_stale(self):
+        if self._stale:
+            self._stale = False
+            if len(self):
+                self.clear()
+                self.invalidations += 1
+
+    def get(self, key: Hashable) -> Optional[float]:
+        self._drop_if_stale()
+        return super().get(key)
+
+    def put(self, key: Hashable, value: float):
+        self._drop_if_stale()
+        super().put(key, value)
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats["invalidations"] = self.invalidations
+        return stats
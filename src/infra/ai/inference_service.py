@@ -0,0 +1,290 @@
+"""
+Serviço de inferência com micro-lotes (asyncio) para muitas partidas simultâneas.
+
+Cada partida (corrotina ou thread) envia suas posições e recebe um futuro.
+O serviço junta os pedidos pendentes e chama a CheckersNet uma única vez
+quando o lote atinge 'max_batch_size' posições ou quando o pedido mais
+antigo já esperou 'max_wait' segundos.
+
+Uso em corrotinas (mesmo event loop):
+    service = InferenceService(model)
+    await service.start()
+    scores = await service.score_successors(board, moves, player)
+    await service.stop()
+
+Uso em threads:
+    service.start_in_thread()
+    scores = service.submit(batch).result()
+    service.stop_thread()
+
+Benchmark (partidas simultâneas da IA contra ela mesma):
+    python -m src.infra.ai.inference_service --games 64 --max-batch-size 256
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import threading
+import time
+from collections import Counter, deque
+from typing import Optional
+
+import torch
+
+from src.core.board import Board
+from src.core.piece import Player
+from src.core.move import Move
+from .model import CheckersNet, successors_to_tensor
+
+# Quantas latências recentes entram nas estatísticas
+LATENCY_WINDOW = 10_000
+
+
+class _Request:
+    __slots__ = ("batch", "future", "enqueued_at")
+
+    def __init__(self, batch: torch.Tensor, future: asyncio.Future):
+        self.batch = batch
+        self.future = future
+        self.enqueued_at = time.perf_counter()
+
+
+class InferenceService:
+    """
+    Avaliador em lote compartilhado. Um pedido é um tensor (k, 4, 8, 8)
+    (ou (4, 8, 8)); o resultado é a lista dos k scores da rede, na mesma ordem.
+    Um pedido nunca é dividido entre dois lotes.
+    """
+
+    def __init__(self, model: CheckersNet, max_batch_size: int = 64, max_wait: float = 0.002):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        # Pedido que não coube no lote anterior; abre o próximo
+        self._carry: Optional[_Request] = None
+
+        self.reset_stats()
+
+    # --- Ciclo de vida ---
+
+    async def start(self):
+        """Inicia o laço de lotes no event loop atual."""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._batch_loop())
+
+    async def stop(self):
+        """Processa o que ainda está na fila e encerra o laço."""
+        if self._worker is None:
+            return
+        await self._queue.put(None)
+        await self._worker
+        self._worker = None
+
+    def start_in_thread(self):
+        """Roda o serviço em um event loop próprio, em uma thread daemon."""
+        started = threading.Event()
+
+        def run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            started.set()
+            loop.run_until_complete(self._worker)
+            loop.close()
+
+        self._thread = threading.Thread(target=run, name="inference-service", daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop_thread(self):
+        if self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._queue.put(None), self._loop).result()
+        self._thread.join()
+        self._thread = None
+
+    # --- Pedidos ---
+
+    async def evaluate(self, batch: torch.Tensor) -> list[float]:
+        """Scores da rede para as posições de 'batch' (corrotinas do mesmo loop)."""
+        if batch.dim() == 3:
+            batch = batch.unsqueeze(0)
+        if len(batch) == 0:
+            return []
+        future = self._loop.create_future()
+        await self._queue.put(_Request(batch, future))
+        return await future
+
+    def submit(self, batch: torch.Tensor) -> concurrent.futures.Future:
+        """Versão thread-safe de evaluate: devolve um concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(self.evaluate(batch), self._loop)
+
+    async def score_successors(self, board: Board, moves: list[Move], player: Player) -> list[float]:
+        """Equivalente assíncrono de model.score_successors (ponto de vista de 'player')."""
+        # Os sucessores são codificados agora: o tabuleiro pode mudar antes do lote sair
+        opponent_scores = await self.evaluate(successors_to_tensor(board, moves, player))
+        return [-score for score in opponent_scores]
+
+    # --- Laço de lotes ---
+
+    async def _batch_loop(self):
+        stopping = False
+        while not stopping:
+            first = self._carry if self._carry is not None else await self._queue.get()
+            self._carry = None
+            if first is None:
+                break
+
+            requests = [first]
+            size = len(first.batch)
+            deadline = first.enqueued_at + self.max_wait
+
+            while size < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    if remaining > 0:
+                        request = await asyncio.wait_for(self._queue.get(), remaining)
+                    else:
+                        request = self._queue.get_nowait()
+                except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                if size + len(request.batch) > self.max_batch_size:
+                    self._carry = request
+                    break
+                requests.append(request)
+                size += len(request.batch)
+
+            self._run_batch(requests, size)
+
+        # Pedidos que chegaram junto com o sinal de parada
+        while self._carry is not None or not self._queue.empty():
+            request = self._carry if self._carry is not None else self._queue.get_nowait()
+            self._carry = None
+            if request is not None:
+                self._run_batch([request], len(request.batch))
+
+    def _run_batch(self, requests: list[_Request], size: int):
+        batch = requests[0].batch if len(requests) == 1 else torch.cat([r.batch for r in requests])
+        try:
+            with torch.no_grad():
+                scores = self.model(batch).view(-1).tolist()
+        except Exception as e:
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        now = time.perf_counter()
+        offset = 0
+        for request in requests:
+            k = len(request.batch)
+            if not request.future.done():
+                request.future.set_result(scores[offset:offset + k])
+            offset += k
+            self._latencies.append(now - request.enqueued_at)
+
+        self.batches += 1
+        self.requests += len(requests)
+        self.positions += size
+        self.batch_size_histogram[size] += 1
+
+    # --- Estatísticas ---
+
+    @property
+    def queue_depth(self) -> int:
+        """Pedidos esperando na fila (sem contar o lote em execução)."""
+        pending = self._queue.qsize() if self._queue is not None else 0
+        return pending + (1 if self._carry is not None else 0)
+
+    def reset_stats(self):
+        self.batches = 0
+        self.requests = 0
+        self.positions = 0
+        self.batch_size_histogram: Counter = Counter()
+        self._latencies: deque = deque(maxlen=LATENCY_WINDOW)
+
+    def stats(self) -> dict:
+        latencies = sorted(self._latencies)
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))]
+
+        return {
+            "queue_depth": self.queue_depth,
+            "batches": self.batches,
+            "requests": self.requests,
+            "positions": self.positions,
+            "mean_batch_size": self.positions / self.batches if self.batches else 0.0,
+            "batch_size_histogram": dict(sorted(self.batch_size_histogram.items())),
+            "latency_mean_ms": 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+            "latency_p50_ms": 1000 * percentile(0.50),
+            "latency_p95_ms": 1000 * percentile(0.95),
+            "latency_max_ms": 1000 * (latencies[-1] if latencies else 0.0),
+        }
+
+
+# --- Benchmark ---
+
+async def _play_game(service: InferenceService, max_moves: int) -> int:
+    # Import local: o GameManager puxa a camada de aplicação só no benchmark
+    from src.app.use_cases.game_manager import GameManager
+
+    game = GameManager()
+    moves_played = 0
+    while game.winner is None and moves_played < max_moves:
+        moves = game.legal_moves
+        player = game.current_player
+        scores = await service.score_successors(game.get_board(), moves, player)
+        best_index = max(range(len(moves)), key=scores.__getitem__)
+        game.make_move(moves[best_index])
+        moves_played += 1
+    return moves_played
+
+
+async def _benchmark(model: CheckersNet, games: int, max_moves: int,
+                     max_batch_size: int, max_wait: float):
+    service = InferenceService(model, max_batch_size, max_wait)
+    await service.start()
+    start = time.perf_counter()
+    moves = await asyncio.gather(*(_play_game(service, max_moves) for _ in range(games)))
+    elapsed = time.perf_counter() - start
+    await service.stop()
+
+    stats = service.stats()
+    print(f"{games} partidas, {sum(moves)} lances em {elapsed:.2f}s "
+          f"({sum(moves) / elapsed:.0f} lances/s)")
+    print(f"Lotes: {stats['batches']}, média de {stats['mean_batch_size']:.1f} posições")
+    print(f"Latência (ms): média {stats['latency_mean_ms']:.2f}, p50 {stats['latency_p50_ms']:.2f}, "
+          f"p95 {stats['latency_p95_ms']:.2f}, máx {stats['latency_max_ms']:.2f}")
+    print(f"Histograma de tamanhos de lote: {stats['batch_size_histogram']}")
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Benchmark do serviço de inferência em lote")
+    parser.add_argument("--model", default=None, help="arquivo .pth (padrão: pesos aleatórios)")
+    parser.add_argument("--games", type=int, default=32, help="partidas simultâneas")
+    parser.add_argument("--max-moves", type=int, default=100, help="limite de lances por partida")
+    parser.add_argument("--max-batch-size", type=int, default=256, help="posições por lote")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0, help="espera máxima do lote (ms)")
+    args = parser.parse_args(argv)
+
+    model = CheckersNet()
+    if args.model:
+        model.load_state_dict(torch.load(args.model, map_location=torch.device('cpu')))
+    model.eval()
+    asyncio.run(_benchmark(model, args.games, args.max_moves,
+                           args.max_batch_size, args.max_wait_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
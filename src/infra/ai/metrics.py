@@ -0,0 +1,193 @@
+"""
+Métricas do treino por era: tempo de cada fase, vazão e tamanho das partidas.
+
+O trainer mede as fases (autojogo, amostragem, codificação, forward,
+backward, passo do otimizador, checkpoint) com um PhaseTimer e grava uma
+linha JSON por era em um arquivo JSONL (MetricsLogger). Com isso dá para
+saber se uma execução lenta é limitada pela geração de movimentos/inferência
+(autojogo) ou pela otimização.
+
+Para olhar uma era em detalhe, profile_epoch liga o cProfile (.prof, abre
+com snakeviz/pstats) ou o torch.profiler (trace do Chrome) só durante ela.
+Com o autojogo em paralelo, o cProfile só enxerga o processo do treinador.
+
+    python -m src.infra.ai.metrics training_metrics.jsonl           # resumo
+    python -m src.infra.ai.metrics training_metrics.jsonl --plot    # gráfico (PNG)
+"""
+import argparse
+import cProfile
+import json
+import os
+import pstats
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+PROFILERS = ("cprofile", "torch")
+
+
+class PhaseTimer:
+    """
+    Acumula o tempo de parede de cada fase:
+        with timer.phase("forward"): ...
+    'sync' (ex.: torch.cuda.synchronize) é chamado antes de fechar cada
+    medição, para que o trabalho assíncrono da GPU conte na fase certa.
+    """
+
+    def __init__(self, sync: Optional[Callable[[], None]] = None):
+        self.sync = sync
+        self.seconds: dict[str, float] = defaultdict(float)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.sync is not None:
+                self.sync()
+            self.seconds[name] += time.perf_counter() - start
+
+    def add(self, name: str, seconds: float):
+        self.seconds[name] += seconds
+
+    def total(self, *names: str) -> float:
+        return sum(self.seconds.get(name, 0.0) for name in names)
+
+    def as_dict(self) -> dict[str, float]:
+        return {name: round(seconds, 6) for name, seconds in self.seconds.items()}
+
+
+class MetricsLogger:
+    """Uma linha JSON por chamada de 'log', acrescentada ao arquivo (sobrevive a reinícios)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def log(self, record: dict):
+        record = {"time": round(time.time(), 3), **record}
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self) -> 'MetricsLogger':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_metrics(path: str) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@contextmanager
+def profile_epoch(profiler: str, out_dir: str, epoch: int) -> Iterator[None]:
+    """
+    Perfila o bloco com o cProfile ('cprofile') ou com o torch.profiler
+    ('torch'). Grava em 'out_dir' e imprime as 20 funções mais caras.
+    """
+    if profiler not in PROFILERS:
+        raise ValueError(f"Profiler desconhecido: {profiler} (opções: {', '.join(PROFILERS)})")
+    os.makedirs(out_dir, exist_ok=True)
+
+    if profiler == "cprofile":
+        path = os.path.join(out_dir, f"epoch-{epoch:04d}.prof")
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            profile.dump_stats(path)
+            pstats.Stats(profile).sort_stats("cumulative").print_stats(20)
+            print(f"Perfil da era {epoch} gravado em {path}")
+        return
+
+    from torch.profiler import ProfilerActivity, profile as torch_profile
+    import torch
+
+    activities = [ProfilerActivity.CPU]
+    if torch.cuda.is_available():
+        activities.append(ProfilerActivity.CUDA)
+    path = os.path.join(out_dir, f"epoch-{epoch:04d}.trace.json")
+    with torch_profile(activities=activities, record_shapes=True) as prof:
+        yield
+    prof.export_chrome_trace(path)
+    print(prof.key_averages().table(sort_by="self_cpu_time_total", row_limit=20))
+    print(f"Trace da era {epoch} gravado em {path}")
+
+
+def plot_metrics(records: list[dict], out_path: str):
+    """Tempo por fase (barras empilhadas) e erro por era, em um PNG."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    epochs = [record["epoch"] for record in records]
+    phases = sorted({phase for record in records for phase in record.get("phases", {})})
+    fig, (ax_time, ax_loss) = plt.subplots(2, 1, figsize=(10, 8), sharex=True)
+
+    bottom = [0.0] * len(records)
+    for phase in phases:
+        values = [record.get("phases", {}).get(phase, 0.0) for record in records]
+        ax_time.bar(epochs, values, bottom=bottom, label=phase)
+        bottom = [b + v for b, v in zip(bottom, values)]
+    ax_time.set_ylabel("Segundos")
+    ax_time.set_title("Tempo por fase")
+    ax_time.legend()
+
+    # Eras de aquecimento (só autojogo) não têm erro
+    ax_loss.plot(epochs, [record.get("loss", float("nan")) for record in records])
+    ax_loss.set_xlabel("Era de Treinamento")
+    ax_loss.set_ylabel("Erro (Loss) Médio")
+    ax_loss.grid(True)
+
+    fig.tight_layout()
+    fig.savefig(out_path)
+    plt.close(fig)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Resumo das métricas de treino (JSONL)")
+    parser.add_argument("path", help="arquivo de métricas gravado pelo trainer")
+    parser.add_argument("--plot", nargs="?", const="", default=None,
+                        help="gera um PNG (padrão: mesmo nome do arquivo, com .png)")
+    args = parser.parse_args(argv)
+
+    records = [record for record in read_metrics(args.path) if "epoch" in record]
+    if not records:
+        print(f"Nenhuma era registrada em {args.path}")
+        return
+
+    totals: dict[str, float] = defaultdict(float)
+    for record in records:
+        for phase, seconds in record.get("phases", {}).items():
+            totals[phase] += seconds
+    elapsed = sum(totals.values())
+    print(f"{len(records)} eras, {elapsed:.1f} s medidos")
+    for phase, seconds in sorted(totals.items(), key=lambda item: -item[1]):
+        print(f"  {phase:<12} {seconds:9.2f} s  {seconds / elapsed:6.1%}")
+
+    last = records[-1]
+    print(f"Última era ({last['epoch']}): {last.get('games_per_s', 0):.1f} partidas/s, "
+          f"{last.get('positions_per_s', 0):.0f} posições/s no autojogo, "
+          f"{last.get('samples_per_s', 0):.0f} amostras/s no treino, "
+          f"{last.get('avg_game_length', 0):.1f} lances por partida")
+
+    if args.plot is not None:
+        out_path = args.plot or os.path.splitext(args.path)[0] + ".png"
+        plot_metrics(records, out_path)
+        print(f"Gráfico gravado em {out_path}")
+
+
+if __name__ == "__main__":
+    main()
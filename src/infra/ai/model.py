@@ -1,8 +1,13 @@
+import numpy as np
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
 from src.core.board import Board
 from src.core.piece import Player
+from typing import Optional
+from .encoding import (NUM_CHANNELS, encode_boards, encode_channel_masks, player_masks,
+                       successor_masks, evaluate_successors)
+from .eval_cache import EvalCache
 
 class CheckersNet(nn.Module):
     """
@@ -39,36 +44,80 @@ class CheckersNet(nn.Module):
 
 def board_to_tensor(board: Board, player: Player) -> torch.Tensor:
     """
-    Converte um objeto Board em um Tensor 4x8x8 para a Rede Neural.
+    Converte um objeto Board em um Tensor (1, 4, 8, 8) para a Rede Neural.
     A representação é "centrada no jogador":
     - Canal 0: Peças do jogador atual
     - Canal 1: Damas (Reis) do jogador atual
     - Canal 2: Peças do oponente
     - Canal 3: Damas (Reis) do oponente
+    Os planos saem direto dos bitboards (ver src.infra.ai.encoding).
     """
-    # Cria 4 "planos" 8x8
-    player_pieces = torch.zeros((8, 8), dtype=torch.float32)
-    player_kings = torch.zeros((8, 8), dtype=torch.float32)
-    opponent_pieces = torch.zeros((8, 8), dtype=torch.float32)
-    opponent_kings = torch.zeros((8, 8), dtype=torch.float32)
-
-    opponent = Player.BLACK if player == Player.WHITE else Player.WHITE
-
-    for r in range(board.ROWS):
-        for c in range(board.COLS):
-            piece = board.get_piece(r, c)
-            if piece:
-                if piece.player == player:
-                    player_pieces[r, c] = 1
-                    if piece.is_king:
-                        player_kings[r, c] = 1
-                elif piece.player == opponent:
-                    opponent_pieces[r, c] = 1
-                    if piece.is_king:
-                        opponent_kings[r, c] = 1
-                        
-    # Empilha os 4 planos para criar o tensor (4, 8, 8)
-    tensor = torch.stack([player_pieces, player_kings, opponent_pieces, opponent_kings])
-    # Adiciona a dimensão "batch" (N=1) -> (1, 4, 8, 8)
-    tensor = tensor.unsqueeze(0) 
-    return tensor
\ No newline at end of file
+    return torch.from_numpy(encode_boards([board], [player]))
+
+
+def boards_to_tensor(boards: list[Board], players: list[Player]) -> torch.Tensor:
+    """Versão em lote de board_to_tensor: (N, 4, 8, 8), um jogador por tabuleiro."""
+    return torch.from_numpy(encode_boards(boards, players))
+
+
+class BoardEncoder:
+    """
+    Codificador com buffer pré-alocado: os lotes são escritos sempre no mesmo
+    tensor (N, 4, 8, 8), sem alocar planos novos a cada avaliação.
+    O tensor devolvido é uma visão do buffer e só vale até a próxima chamada.
+    Não é seguro entre threads: cada jogador/chamador usa o seu.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        self.buffer = torch.zeros((capacity, NUM_CHANNELS, 8, 8), dtype=torch.float32)
+        # Visão NumPy da mesma memória
+        self._array = self.buffer.numpy()
+
+    def encode_masks(self, channel_masks: np.ndarray) -> torch.Tensor:
+        """(N, 4) máscaras de canal (ver encoding.player_masks) -> visão (N, 4, 8, 8)."""
+        n = len(channel_masks)
+        if n > len(self.buffer):
+            self._allocate(max(n, 2 * len(self.buffer)))
+        encode_channel_masks(channel_masks, self._array[:n])
+        return self.buffer[:n]
+
+    def encode(self, boards: list[Board], players: list[Player]) -> torch.Tensor:
+        channel_masks = [player_masks(board.masks(), player) for board, player in zip(boards, players)]
+        return self.encode_masks(np.array(channel_masks, dtype=np.uint32).reshape(-1, NUM_CHANNELS))
+
+
+def successors_to_tensor(board: Board, moves: list, player: Player) -> torch.Tensor:
+    """
+    Aplica cada movimento de 'player', codifica a posição resultante do ponto
+    de vista do oponente (quem joga a seguir) e desfaz o movimento.
+    Retorna um lote (N, 4, 8, 8), na ordem de 'moves'.
+    """
+    return torch.from_numpy(encode_channel_masks(successor_masks(board, moves, player)))
+
+
+def score_successors(model: CheckersNet, board: Board, moves: list, player: Player,
+                     eval_cache: Optional[EvalCache] = None,
+                     encoder: Optional[BoardEncoder] = None) -> torch.Tensor:
+    """
+    Avalia todos os sucessores em um único forward pass.
+    Retorna (N,) scores do ponto de vista de 'player' (o negativo do score
+    que a rede dá ao oponente).
+    Com 'eval_cache', só as posições ainda não avaliadas passam pela rede.
+    Com 'encoder', o lote é escrito no buffer dele; sem, é alocado a cada chamada.
+    """
+    def encode(channel_masks: np.ndarray) -> torch.Tensor:
+        if encoder is None:
+            return torch.from_numpy(encode_channel_masks(channel_masks))
+        return encoder.encode_masks(channel_masks)
+
+    if eval_cache is None:
+        return -model(encode(successor_masks(board, moves, player))).view(-1)
+
+    def evaluate(channel_masks: np.ndarray) -> list[float]:
+        return model(encode(channel_masks)).view(-1).tolist()
+
+    scores = evaluate_successors(evaluate, board, moves, player, eval_cache)
+    return -torch.tensor(scores, dtype=torch.float32)
@@ -1,20 +1,36 @@
 import torch
 from src.core.board import Board
 from src.core.piece import Piece, Player
-from src.app.use_cases.move_validator import Move
-from .model import CheckersNet, board_to_tensor
+from src.core.move import Move
+from .model import BoardEncoder, CheckersNet, score_successors
+from .eval_cache import EvalCache
+from .shared_weights import SHARED_WEIGHTS_SUFFIX, SharedWeights, load_into_torch
 from typing import Optional
 
+# Posições guardadas no cache de avaliações de cada jogador
+EVAL_CACHE_SIZE = 100_000
+
 class NeuralNetPlayer:
     
-    def __init__(self, player: Player, model_path: str):
+    def __init__(self, player: Player, model_path: str,
+                 quantization: Optional[str] = None, calibration_path: Optional[str] = None,
+                 eval_cache_size: int = EVAL_CACHE_SIZE):
         self.player = player
         self.model = CheckersNet()
+        self.eval_cache = None
+        # Pesos publicados pelo treinador em um arquivo mapeado (ver shared_weights.py)
+        self._shared_weights = None
+        self._weights_version = None
         
         try:
-            # Tenta carregar o modelo (CPU por padrão)
-            self.model.load_state_dict(torch.load(model_path, map_location=torch.device('cpu')))
-            print(f"Modelo {model_path} carregado com sucesso.")
+            if model_path.endswith(SHARED_WEIGHTS_SUFFIX):
+                self._shared_weights = SharedWeights(model_path)
+                self._refresh_shared_weights()
+                print(f"Pesos compartilhados {model_path} mapeados (versão {self._weights_version}).")
+            else:
+                # Tenta carregar o modelo (CPU por padrão)
+                self.model.load_state_dict(torch.load(model_path, map_location=torch.device('cpu')))
+                print(f"Modelo {model_path} carregado com sucesso.")
         except FileNotFoundError:
             print(f"Aviso: Arquivo de modelo {model_path} não encontrado. IA jogará com pesos aleatórios.")
         except Exception as e:
@@ -22,55 +38,56 @@ class NeuralNetPlayer:
 
         self.model.eval()
 
-    def _simulate_move_on_board(self, board: Board, move: Move) -> Board:
+        # Inferência int8 opcional ('dynamic' ou 'static', ver quantization.py)
+        if quantization:
+            from .quantization import quantize_model, load_positions
+            positions = load_positions(calibration_path) if calibration_path else None
+            self.model = quantize_model(self.model, quantization, positions)
+            print(f"Modelo quantizado para int8 (modo {quantization}).")
+            # O modelo quantizado é uma cópia: não acompanha novas versões
+            self._shared_weights = None
 
-        temp_board = board.deep_copy()
-        
-        from_pos = move["from_pos"]
-        to_pos = move["to_pos"]
-        captures = move["captures"]
-        
-        piece = temp_board.get_piece(from_pos[0], from_pos[1])
-        temp_board.move_piece(from_pos[0], from_pos[1], to_pos[0], to_pos[1])
-        
-        for cap_pos in captures:
-            temp_board.remove_piece(cap_pos[0], cap_pos[1])
-            
-        # Checagem de Promoção
-        if piece and not piece.is_king:
-            if (piece.player == Player.WHITE and to_pos[0] == 0) or \
-               (piece.player == Player.BLACK and to_pos[0] == temp_board.ROWS - 1):
-                
-                promoted_piece = temp_board.get_piece(to_pos[0], to_pos[1])
-                if promoted_piece:
-                    promoted_piece.make_king()
-                    
-        return temp_board
+        # Os pesos não mudam durante a partida: posições repetidas não voltam à rede
+        self.eval_cache = EvalCache(eval_cache_size) if eval_cache_size else None
+        # Buffer de codificação próprio (o de outro jogador pode estar em uso em outra thread)
+        self.encoder = BoardEncoder()
+
+    def _refresh_shared_weights(self) -> bool:
+        """
+        Aponta o modelo para a versão mais nova dos pesos compartilhados, se
+        mudou. Retorna True quando recarregou (avaliações antigas não valem mais).
+        """
+        if self._shared_weights is None or (self._shared_weights.version == self._weights_version
+                                            and self._shared_weights.intact()):
+            return False
+        self._weights_version, arrays = self._shared_weights.arrays()
+        load_into_torch(self.model, arrays)
+        if self.eval_cache is not None:
+            self.eval_cache.invalidate()
+        return True
+
+    def _shared_weights_intact(self) -> bool:
+        """
+        False se o treinador reescreveu o slot mapeado (duas publicações)
+        enquanto o modelo o usava: o resultado deve ser descartado e refeito.
+        """
+        return self._shared_weights is None or self._shared_weights.intact()
 
     @torch.no_grad() # 
     def get_move(self, board: Board, legal_moves: list[Move]) -> Optional[Move]:
         if not legal_moves:
             return None
+        # Um único forward pass sobre todos os sucessores; argmax devolve o
+        # primeiro máximo, o mesmo desempate do antigo laço com '>'
+        while True:
+            self._refresh_shared_weights()
+            scores = score_successors(self.model, board, legal_moves, self.player, self.eval_cache,
+                                      self.encoder)
+            if self._shared_weights_intact():
+                break
+        best_index = int(torch.argmax(scores))
+        best_score = scores[best_index].item()
+        best_move = legal_moves[best_index]
 
-        best_score = -float('inf')
-        best_move = None
-        
-        for move in legal_moves:
-            future_board = self._simulate_move_on_board(board, move)
-            
-            opponent = Player.BLACK if self.player == Player.WHITE else Player.WHITE
-            board_tensor = board_to_tensor(future_board, opponent)
-            score = self.model(board_tensor).item()
-
-            current_move_score = -score
-            
-            if current_move_score > best_score:
-                best_score = current_move_score
-                best_move = move
-        
-
-        if best_move is None:
-            best_move = legal_moves[0]
-            
         print(f"[NN Player] Escolheu movimento com score: {best_score:.4f}")
         return best_move
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""
+Forward pass da CheckersNet só com NumPy (sem importar torch).
+
+Serve para jogar e para os processos de autojogo, que nunca precisam de
+autograd: o processo não paga a importação do PyTorch nem a memória dele.
+
+Os pesos vêm do state dict do .pth, exportado uma vez para .npz (as chaves
+são as mesmas: 'conv1.weight', 'conv1.bias', ...). A exportação e a
+conferência numérica precisam do torch:
+    python -m src.infra.ai.numpy_net checkers_model.pth            # gera checkers_model.npz
+    python -m src.infra.ai.numpy_net checkers_model.pth --check    # exporta e compara
+"""
+import argparse
+import os
+from typing import Optional
+
+import numpy as np
+
+from .encoding import NUM_CHANNELS
+
+# Formatos do state dict da CheckersNet
+WEIGHT_SHAPES: dict[str, tuple[int, ...]] = {
+    "conv1.weight": (16, NUM_CHANNELS, 3, 3),
+    "conv1.bias": (16,),
+    "conv2.weight": (32, 16, 3, 3),
+    "conv2.bias": (32,),
+    "fc1.weight": (128, 512),
+    "fc1.bias": (128,),
+    "fc2.weight": (1, 128),
+    "fc2.bias": (1,),
+}
+
+
+def _conv3x3_relu(x: np.ndarray, weight: np.ndarray, bias: np.ndarray) -> np.ndarray:
+    """Convolução 3x3 sem padding (im2col + matmul) seguida de ReLU. NCHW -> NCHW."""
+    n, channels, height, width = x.shape
+    out_h, out_w = height - 2, width - 2
+    # (N, C, H', W', 3, 3) -> (N, H', W', C, 3, 3): mesma ordem do peso (C, kh, kw)
+    windows = np.lib.stride_tricks.sliding_window_view(x, (3, 3), axis=(2, 3))
+    columns = windows.transpose(0, 2, 3, 1, 4, 5).reshape(n * out_h * out_w, channels * 9)
+    out = columns @ weight.reshape(len(weight), -1).T + bias
+    np.maximum(out, 0, out=out)
+    return out.reshape(n, out_h, out_w, -1).transpose(0, 3, 1, 2)
+
+
+class NumpyCheckersNet:
+    """
+    Mesma conta da CheckersNet.forward, em float32:
+    conv1 + ReLU -> conv2 + ReLU -> achata (ordem C, H, W) -> fc1 + ReLU -> fc2 -> tanh.
+    """
+
+    def __init__(self, weights: dict[str, np.ndarray]):
+        missing = set(WEIGHT_SHAPES) - set(weights)
+        if missing:
+            raise ValueError(f"Pesos faltando no arquivo: {sorted(missing)}")
+        self.weights = {name: np.ascontiguousarray(weights[name], dtype=np.float32).reshape(shape)
+                        for name, shape in WEIGHT_SHAPES.items()}
+
+    @classmethod
+    def load(cls, path: str) -> 'NumpyCheckersNet':
+        with np.load(path) as data:
+            return cls(dict(data))
+
+    @classmethod
+    def random(cls, seed: Optional[int] = None) -> 'NumpyCheckersNet':
+        """Pesos aleatórios com a mesma inicialização padrão do PyTorch (uniforme ±1/sqrt(fan_in))."""
+        rng = np.random.default_rng(seed)
+        weights = {}
+        for name, shape in WEIGHT_SHAPES.items():
+            layer = name.split(".")[0]
+            fan_in = int(np.prod(WEIGHT_SHAPES[f"{layer}.weight"][1:]))
+            bound = 1 / np.sqrt(fan_in)
+            weights[name] = rng.uniform(-bound, bound, shape).astype(np.float32)
+        return cls(weights)
+
+    def save(self, path: str):
+        np.savez(path, **self.weights)
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """(N, 4, 8, 8) float32 -> (N, 1) scores em (-1, 1)."""
+        w = self.weights
+        x = np.asarray(x, dtype=np.float32)
+        x = _conv3x3_relu(x, w["conv1.weight"], w["conv1.bias"])
+        x = _conv3x3_relu(x, w["conv2.weight"], w["conv2.bias"])
+        x = x.reshape(len(x), 512)
+        x = x @ w["fc1.weight"].T + w["fc1.bias"]
+        np.maximum(x, 0, out=x)
+        x = x @ w["fc2.weight"].T + w["fc2.bias"]
+        return np.tanh(x)
+
+
+# --- Exportação e conferência (usam torch) ---
+
+def export_weights(state_dict_path: str, out_path: Optional[str] = None) -> str:
+    """Converte o state dict de um .pth em .npz. Retorna o caminho gerado."""
+    import torch
+
+    state_dict = torch.load(state_dict_path, map_location=torch.device('cpu'))
+    out_path = out_path or os.path.splitext(state_dict_path)[0] + ".npz"
+    np.savez(out_path, **{name: tensor.numpy() for name, tensor in state_dict.items()})
+    return out_path
+
+
+def check_against_torch(state_dict_path: Optional[str], net: NumpyCheckersNet,
+                        num_samples: int = 2048, seed: int = 0) -> float:
+    """Maior diferença absoluta entre os scores NumPy e torch em posições aleatórias."""
+    import torch
+    from .model import CheckersNet
+
+    model = CheckersNet()
+    if state_dict_path:
+        model.load_state_dict(torch.load(state_dict_path, map_location=torch.device('cpu')))
+    else:
+        model.load_state_dict({name: torch.from_numpy(np.array(array)) for name, array in net.weights.items()})
+    model.eval()
+
+    # Planos 0/1 com densidade parecida com a de uma partida
+    rng = np.random.default_rng(seed)
+    x = (rng.random((num_samples, NUM_CHANNELS, 8, 8)) < 0.2).astype(np.float32)
+    with torch.no_grad():
+        expected = model(torch.from_numpy(x)).numpy()
+    return float(np.abs(net(x) - expected).max())
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Exporta os pesos da CheckersNet para o backend NumPy")
+    parser.add_argument("model", help="arquivo .pth (state dict da CheckersNet)")
+    parser.add_argument("--out", default=None, help="arquivo .npz de saída (padrão: mesmo nome)")
+    parser.add_argument("--check", action="store_true", help="compara o forward NumPy com o torch")
+    args = parser.parse_args(argv)
+
+    out_path = export_weights(args.model, args.out)
+    print(f"Pesos exportados para {out_path}")
+    if args.check:
+        max_delta = check_against_torch(args.model, NumpyCheckersNet.load(out_path))
+        print(f"Diferença máxima NumPy x torch: {max_delta:.2e}")
+
+
+if __name__ == "__main__":
+    main()
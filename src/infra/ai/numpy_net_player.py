@@ -0,0 +1,58 @@
+import os
+import numpy as np
+from src.core.board import Board
+from src.core.piece import Player
+from src.core.move import Move
+from .encoding import NUM_CHANNELS, encode_channel_masks, successor_masks
+from .numpy_net import NumpyCheckersNet
+from .shared_weights import SHARED_WEIGHTS_SUFFIX, SharedNumpyNet
+from typing import Optional
+
+class NumpyNetPlayer:
+    """
+    Mesmo jogador do NeuralNetPlayer (1 lance à frente), mas com o forward
+    pass em NumPy: não importa torch. Usa os pesos exportados para .npz
+    (ver src.infra.ai.numpy_net); se receber o caminho do .pth, procura o
+    .npz de mesmo nome. Com um arquivo '.weights' (ver shared_weights.py),
+    usa os pesos compartilhados e acompanha as versões publicadas.
+    """
+
+    def __init__(self, player: Player, model_path: str):
+        self.player = player
+        weights_path = os.path.splitext(model_path)[0] + ".npz"
+
+        try:
+            if model_path.endswith(SHARED_WEIGHTS_SUFFIX):
+                # Pesos publicados pelo treinador: views do mmap, recarga automática
+                weights_path = model_path
+                self.model = SharedNumpyNet(model_path)
+            else:
+                self.model = NumpyCheckersNet.load(weights_path)
+            print(f"Modelo {weights_path} carregado com sucesso (backend NumPy).")
+        except FileNotFoundError:
+            print(f"Aviso: Arquivo de pesos {weights_path} não encontrado "
+                  f"(exporte com 'python -m src.infra.ai.numpy_net {model_path}'). "
+                  f"IA jogará com pesos aleatórios.")
+            self.model = NumpyCheckersNet.random()
+        except Exception as e:
+            print(f"Erro ao carregar pesos: {e}. IA jogará com pesos aleatórios.")
+            self.model = NumpyCheckersNet.random()
+
+        # Buffer reaproveitado entre jogadas (as casas claras nunca são escritas)
+        self._buffer = np.zeros((64, NUM_CHANNELS, 8, 8), dtype=np.float32)
+
+    def get_move(self, board: Board, legal_moves: list[Move]) -> Optional[Move]:
+        if not legal_moves:
+            return None
+
+        n = len(legal_moves)
+        if n > len(self._buffer):
+            self._buffer = np.zeros((n, NUM_CHANNELS, 8, 8), dtype=np.float32)
+        batch = encode_channel_masks(successor_masks(board, legal_moves, self.player), self._buffer[:n])
+
+        # A rede avalia do ponto de vista do oponente; argmax fica com o primeiro máximo
+        scores = -self.model(batch).reshape(-1)
+        best_index = int(np.argmax(scores))
+
+        print(f"[NN Player] Escolheu movimento com score: {scores[best_index]:.4f}")
+        return legal_moves[best_index]
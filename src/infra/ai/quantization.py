@@ -0,0 +1,244 @@
+"""
+Inferência int8 (CPU) para a CheckersNet.
+
+Dois modos, ambos opcionais:
+- "dynamic": quantização dinâmica das camadas lineares (fc1, fc2). Os pesos
+  viram int8 e as ativações são quantizadas na hora; não precisa calibrar.
+  (O PyTorch não tem quantização dinâmica para convoluções.)
+- "static": quantização estática de conv1, conv2, fc1 e fc2, com as camadas
+  fundidas ao ReLU. As escalas das ativações vêm de uma calibração sobre
+  posições gravadas.
+
+Posições para calibração: arquivo texto, uma por linha, no formato
+"<W|B> <Board.to_string>" (lado a jogar e o tabuleiro). Sem arquivo, usa
+posições de partidas aleatórias.
+
+Relatório de precisão e benchmark contra o modelo float:
+    python -m src.infra.ai.quantization --model checkers_model.pth --mode static
+"""
+import argparse
+import copy
+import random
+import time
+import warnings
+from typing import Optional
+
+import torch
+import torch.nn as nn
+from torch.ao import quantization as tq
+
+from src.core.board import Board
+from src.core.piece import Player
+from .model import CheckersNet, boards_to_tensor, score_successors
+
+QUANTIZATION_MODES = ("dynamic", "static")
+
+# Lado a jogar no arquivo de posições
+_SIDE_TO_PLAYER = {"W": Player.WHITE, "B": Player.BLACK}
+_PLAYER_TO_SIDE = {player: side for side, player in _SIDE_TO_PLAYER.items()}
+
+
+def _default_backend() -> str:
+    engines = torch.backends.quantized.supported_engines
+    for backend in ("x86", "fbgemm", "qnnpack"):
+        if backend in engines:
+            return backend
+    raise RuntimeError("Nenhum backend de quantização disponível neste PyTorch")
+
+
+class StaticQuantCheckersNet(nn.Module):
+    """
+    Mesma arquitetura da CheckersNet, com os pontos de (de)quantização e os
+    ReLU como módulos (necessário para a fusão e a quantização estática).
+    O tanh final roda em float, depois do DeQuantStub.
+    """
+
+    def __init__(self, model: CheckersNet):
+        super().__init__()
+        self.quant = tq.QuantStub()
+        self.conv1 = copy.deepcopy(model.conv1)
+        self.relu1 = nn.ReLU()
+        self.conv2 = copy.deepcopy(model.conv2)
+        self.relu2 = nn.ReLU()
+        self.fc1 = copy.deepcopy(model.fc1)
+        self.relu3 = nn.ReLU()
+        self.fc2 = copy.deepcopy(model.fc2)
+        self.dequant = tq.DeQuantStub()
+
+    def forward(self, x):
+        x = self.quant(x)
+        x = self.relu1(self.conv1(x))
+        x = self.relu2(self.conv2(x))
+        x = x.reshape(-1, 512)
+        x = self.relu3(self.fc1(x))
+        x = self.dequant(self.fc2(x))
+        return torch.tanh(x)
+
+
+def quantize_dynamic(model: CheckersNet) -> nn.Module:
+    model = copy.deepcopy(model).eval()
+    return tq.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+
+
+def quantize_static(model: CheckersNet, calibration_batch: torch.Tensor,
+                    backend: Optional[str] = None, batch_size: int = 256) -> nn.Module:
+    """Funde, calibra com 'calibration_batch' (N, 4, 8, 8) e converte para int8."""
+    backend = backend or _default_backend()
+    torch.backends.quantized.engine = backend
+
+    qmodel = StaticQuantCheckersNet(model).eval()
+    qmodel = tq.fuse_modules(qmodel, [["conv1", "relu1"], ["conv2", "relu2"], ["fc1", "relu3"]])
+    qmodel.qconfig = tq.get_default_qconfig(backend)
+    tq.prepare(qmodel, inplace=True)
+
+    with torch.no_grad():
+        for start in range(0, len(calibration_batch), batch_size):
+            qmodel(calibration_batch[start:start + batch_size])
+
+    tq.convert(qmodel, inplace=True)
+    return qmodel
+
+
+def quantize_model(model: CheckersNet, mode: str,
+                   positions: Optional[list[tuple[Board, Player]]] = None) -> nn.Module:
+    """Ponto de entrada único: 'dynamic' ou 'static' (este calibra com 'positions')."""
+    if mode not in QUANTIZATION_MODES:
+        raise ValueError(f"Modo de quantização desconhecido: {mode} (use {QUANTIZATION_MODES})")
+
+    # torch.ao.quantization avisa que será migrado para o torchao; a API
+    # eager continua funcionando nas versões do requirements.txt
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        warnings.simplefilter("ignore", UserWarning)
+        if mode == "dynamic":
+            return quantize_dynamic(model)
+        if not positions:
+            positions = sample_positions()
+        boards, players = zip(*positions)
+        return quantize_static(model, boards_to_tensor(list(boards), list(players)))
+
+
+# --- Posições gravadas ---
+
+def load_positions(path: str) -> list[tuple[Board, Player]]:
+    positions = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            side, text = line.split()
+            positions.append((Board.from_string(text), _SIDE_TO_PLAYER[side.upper()]))
+    return positions
+
+
+def save_positions(path: str, positions: list[tuple[Board, Player]]):
+    with open(path, "w") as f:
+        for board, player in positions:
+            f.write(f"{_PLAYER_TO_SIDE[player]} {board.to_string()}\n")
+
+
+def sample_positions(num_games: int = 20, max_moves: int = 120, seed: int = 0) -> list[tuple[Board, Player]]:
+    """Posições (e lado a jogar) de partidas com movimentos aleatórios."""
+    from src.app.use_cases.game_manager import GameManager
+
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(num_games):
+        game = GameManager()
+        for _ in range(max_moves):
+            if game.get_winner():
+                break
+            positions.append((game.get_board().deep_copy(), game.current_player))
+            game.make_move(rng.choice(game.legal_moves))
+    return positions
+
+
+# --- Relatório e benchmark ---
+
+@torch.no_grad()
+def compare_models(float_model: nn.Module, quantized_model: nn.Module,
+                   positions: list[tuple[Board, Player]]) -> dict:
+    """
+    Diferença de score nas próprias posições e concordância do movimento
+    escolhido (1 lance à frente, como o NeuralNetPlayer).
+    """
+    from src.app.use_cases.table_move_validator import TableMoveValidator
+
+    boards, players = zip(*positions)
+    batch = boards_to_tensor(list(boards), list(players))
+    delta = (float_model(batch) - quantized_model(batch)).abs().view(-1)
+
+    validator = TableMoveValidator()
+    agree = total = 0
+    for board, player in positions:
+        moves = validator.get_all_legal_moves_for_player(board, player)
+        if len(moves) < 2:
+            continue
+        float_choice = int(torch.argmax(score_successors(float_model, board, moves, player)))
+        quant_choice = int(torch.argmax(score_successors(quantized_model, board, moves, player)))
+        agree += float_choice == quant_choice
+        total += 1
+
+    return {
+        "positions": len(positions),
+        "mean_abs_delta": delta.mean().item(),
+        "max_abs_delta": delta.max().item(),
+        "move_agreement": agree / total if total else 1.0,
+        "move_decisions": total,
+    }
+
+
+@torch.no_grad()
+def benchmark(model: nn.Module, batch: torch.Tensor, iterations: int = 200) -> float:
+    """Latência média (ms) de um forward pass sobre 'batch'."""
+    for _ in range(10):
+        model(batch)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        model(batch)
+    return 1000 * (time.perf_counter() - start) / iterations
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Quantização int8 da CheckersNet: precisão e latência")
+    parser.add_argument("--model", default=None, help="arquivo .pth (padrão: pesos aleatórios)")
+    parser.add_argument("--mode", choices=QUANTIZATION_MODES, action="append",
+                        help="modo a avaliar (pode repetir; padrão: ambos)")
+    parser.add_argument("--positions", default=None,
+                        help="arquivo de posições para calibrar e avaliar (padrão: partidas aleatórias)")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 16, 256])
+    args = parser.parse_args(argv)
+
+    float_model = CheckersNet()
+    if args.model:
+        float_model.load_state_dict(torch.load(args.model, map_location=torch.device('cpu')))
+    float_model.eval()
+
+    positions = load_positions(args.positions) if args.positions else sample_positions()
+    # Calibra com metade das posições e avalia com a outra metade
+    rng = random.Random(0)
+    positions = positions[:]
+    rng.shuffle(positions)
+    half = len(positions) // 2
+    calibration, evaluation = positions[:half], positions[half:]
+    boards, players = zip(*evaluation)
+    eval_batch = boards_to_tensor(list(boards), list(players))
+
+    for mode in args.mode or QUANTIZATION_MODES:
+        quantized = quantize_model(float_model, mode, calibration)
+        report = compare_models(float_model, quantized, evaluation)
+        print(f"--- {mode} ({report['positions']} posições) ---")
+        print(f"Diferença de score: média {report['mean_abs_delta']:.5f}, máx {report['max_abs_delta']:.5f}")
+        print(f"Concordância de movimento: {100 * report['move_agreement']:.1f}% "
+              f"({report['move_decisions']} decisões)")
+        for batch_size in args.batch_sizes:
+            batch = eval_batch[:batch_size]
+            float_ms = benchmark(float_model, batch)
+            quant_ms = benchmark(quantized, batch)
+            print(f"Lote {batch_size:4d}: float {float_ms:.3f} ms, int8 {quant_ms:.3f} ms "
+                  f"({float_ms / quant_ms:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 import random
 from src.core.board import Board
 from src.core.piece import Player
-from src.app.use_cases.move_validator import Move
+from src.core.move import Move
 
 class RandomPlayer:
 
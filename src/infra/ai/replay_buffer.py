@@ -0,0 +1,384 @@
+"""
+Memória de replay em arrays pré-alocados, sem posições repetidas.
+
+Toda partida de autojogo começa do mesmo setup_board() e as aberturas se
+repetem o tempo todo: guardar cada ocorrência encheria a memória de cópias
+das mesmas posições, com alvos ±1 contraditórios. Aqui cada par (posição,
+lado que jogou) ocupa um único slot, com as estatísticas agregadas de todas
+as vezes em que apareceu: número de visitas e soma dos resultados. O alvo
+de treino é o resultado médio (em [-1, 1]), de variância bem menor.
+
+As posições são identificadas pelo hash de Zobrist de 64 bits (o mesmo de
+Board.position_key), calculado de forma vetorizada a partir dos bitboards.
+Duas posições diferentes com o mesmo hash seriam somadas no mesmo slot; com
+64 bits, a chance disso em milhões de posições é desprezível (a mesma
+aposta da tabela de transposição). Cada lote recebido é agregado com
+np.unique e procurado de uma vez em uma tabela hash de endereçamento aberto
+(sondagem linear, 2 entradas por slot), guardada junto com os arrays: não
+há dicionário em RAM nem índice a reconstruir ao reabrir.
+
+Cada slot ocupa 41 bytes (hash, era da última atualização, 4 bitboards,
+soma dos resultados, visitas, lado que jogou), mais 8 bytes da tabela.
+Quando a memória enche, saem os slots atualizados há mais tempo: as
+posições de abertura, revistas a cada partida, ficam com as estatísticas
+acumuladas, e saem as posições que não aparecem mais.
+'extend' é vetorizado e custa quase o mesmo para uma partida ou para uma
+era inteira: o treinador junta as partidas da era e as acrescenta de uma vez.
+A amostragem sorteia slots únicos e devolve arrays prontos para
+encoding.channel_masks_from_bitboards / encode_channel_masks.
+
+Com 'path', os arrays ficam em um arquivo np.memmap: a memória pode passar
+de milhões de posições sem ocupar RAM e sobrevive a reinícios. O checkpoint
+dessa memória guarda só o cabeçalho: retomar de um checkpoint mais antigo
+que o arquivo (versão do conteúdo diferente) é recusado.
+
+A amostragem usa o Generator passado em 'rng' (o treinador guarda o
+estado dele no checkpoint, para que a retomada sorteie os mesmos lotes).
+
+Formato do arquivo:
+    cabeçalho (64 bytes): magic | capacidade | tamanho | entradas removidas da tabela |
+                          posições vistas | versão do conteúdo (incrementada a cada escrita)
+    hashes: uint64[capacidade] | última atualização: uint64[capacidade] |
+    tabela: int32[potência de 2 >= 2 * capacidade] | posições: uint32[capacidade, 4] |
+    somas: float32[capacidade] | visitas: uint32[capacidade] | lados: uint8[capacidade]
+"""
+import os
+from typing import Optional
+
+import numpy as np
+
+from src.core.board import Board
+from src.core.piece import Player
+from src.core.zobrist import BLACK_TO_MOVE_KEY, PIECE_KEYS
+
+MAGIC = int.from_bytes(b"CKRPLY03", "little")
+HEADER_BYTES = 64
+_MAGIC, _CAPACITY, _SIZE, _TOMBSTONES, _SEEN, _CONTENT_VERSION = 0, 1, 2, 3, 4, 5
+
+# Entradas da tabela: 0 = vazia, -1 = removida, slot + 1 = ocupada
+_EMPTY, _TOMBSTONE = 0, -1
+
+
+def _byte_keys() -> np.ndarray:
+    """XOR das chaves de Zobrist das casas de cada byte possível: [tipo, byte, valor]."""
+    keys = np.array(PIECE_KEYS, dtype=np.uint64).reshape(4, 4, 8)
+    bits = (np.arange(256)[:, None] >> np.arange(8)) & 1
+    return np.bitwise_xor.reduce(np.where(bits[None, None], keys[:, :, None, :], np.uint64(0)), axis=3)
+
+
+_BYTE_KEYS = _byte_keys()
+
+
+def position_hashes(positions: np.ndarray, players: np.ndarray) -> np.ndarray:
+    """Board.position_key de cada posição ((k, 4) bitboards, (k,) lados 0/1), sem criar Boards."""
+    as_bytes = np.ascontiguousarray(positions, dtype="<u4").view(np.uint8).reshape(-1, 4, 4)
+    hashes = np.bitwise_xor.reduce(
+        _BYTE_KEYS[np.arange(4)[:, None], np.arange(4), as_bytes].reshape(-1, 16), axis=1)
+    return np.where(np.asarray(players) == 1, hashes ^ np.uint64(BLACK_TO_MOVE_KEY), hashes)
+
+
+def _table_size(capacity: int) -> int:
+    return 1 << (2 * capacity - 1).bit_length()
+
+
+def _layout(capacity: int) -> list[tuple[str, type, tuple[int, ...]]]:
+    """Arrays da memória, na ordem do arquivo (os de 8 bytes primeiro, alinhados)."""
+    return [
+        ("hashes", np.uint64, (capacity,)),
+        ("updated", np.uint64, (capacity,)),
+        ("table", np.int32, (_table_size(capacity),)),
+        ("positions", np.uint32, (capacity, 4)),
+        ("outcome_sums", np.float32, (capacity,)),
+        ("visits", np.uint32, (capacity,)),
+        ("players", np.uint8, (capacity,)),
+    ]
+
+
+class ReplayBuffer:
+
+    def __init__(self, capacity: int, path: Optional[str] = None,
+                 rng: Optional[np.random.Generator] = None):
+        if capacity <= 0:
+            raise ValueError(f"Capacidade da memória deve ser positiva, recebeu {capacity}")
+        self.capacity = capacity
+        self.path = path
+        self.rng = rng or np.random.default_rng()
+        # Próximos slots a sair (os menos atualizados) e a versão de cada um
+        # quando entrou na fila: só fica em RAM, é refeita quando preciso
+        self._eviction_queue = np.empty(0, dtype=np.int64)
+        self._eviction_versions = np.empty(0, dtype=np.uint64)
+
+        if path is None:
+            self._header = np.zeros(HEADER_BYTES // 8, dtype=np.uint64)
+            for name, dtype, shape in _layout(capacity):
+                setattr(self, name, np.zeros(shape, dtype=dtype))
+        else:
+            self._open_memmap(path)
+
+    def _open_memmap(self, path: str):
+        capacity = self.capacity
+        layout = _layout(capacity)
+        size = HEADER_BYTES + sum(np.dtype(dtype).itemsize * int(np.prod(shape)) for _, dtype, shape in layout)
+        exists = os.path.exists(path)
+        if exists:
+            header = np.fromfile(path, dtype=np.uint64, count=HEADER_BYTES // 8)
+            if (len(header) < 2 or header[_MAGIC] != MAGIC or header[_CAPACITY] != capacity
+                    or os.path.getsize(path) != size):
+                raise ValueError(f"{path} não é uma memória de replay com capacidade {capacity}")
+        else:
+            with open(path, "wb") as f:
+                f.truncate(size)
+
+        self._header = np.memmap(path, dtype=np.uint64, mode="r+", shape=(HEADER_BYTES // 8,))
+        offset = HEADER_BYTES
+        for name, dtype, shape in layout:
+            setattr(self, name, np.memmap(path, dtype=dtype, mode="r+", offset=offset, shape=shape))
+            offset += np.dtype(dtype).itemsize * int(np.prod(shape))
+
+        if not exists:
+            self._header[_MAGIC] = MAGIC
+            self._header[_CAPACITY] = capacity
+            self.flush()
+
+    def __len__(self) -> int:
+        """Número de posições únicas guardadas."""
+        return int(self._header[_SIZE])
+
+    @property
+    def positions_seen(self) -> int:
+        """Total de posições recebidas, contando as repetidas."""
+        return int(self._header[_SEEN])
+
+    @property
+    def targets(self) -> np.ndarray:
+        """Resultado médio de cada slot ocupado."""
+        size = len(self)
+        return self.outcome_sums[:size] / np.maximum(self.visits[:size], 1)
+
+    # --- Tabela hash (endereçamento aberto, sondagem linear, vetorizada) ---
+
+    def _probe(self, hashes: np.ndarray) -> np.ndarray:
+        """Índice na tabela de cada hash, ou -1 se não está na memória."""
+        mask = len(self.table) - 1
+        index = (hashes & np.uint64(mask)).astype(np.int64)
+        found = np.full(len(hashes), -1, dtype=np.int64)
+        pending = np.arange(len(hashes))
+        while len(pending):
+            entry = self.table[index[pending]]
+            hit = entry > 0
+            hit[hit] = self.hashes[entry[hit] - 1] == hashes[pending[hit]]
+            found[pending[hit]] = index[pending[hit]]
+            # Segue sondando enquanto não acha nem chega a uma entrada vazia
+            pending = pending[~hit & (entry != _EMPTY)]
+            index[pending] = (index[pending] + 1) & mask
+        return found
+
+    def find(self, hashes: np.ndarray) -> np.ndarray:
+        """Slot de cada hash (ver position_hashes), ou -1 se não está na memória."""
+        index = self._probe(np.asarray(hashes, dtype=np.uint64))
+        return np.where(index >= 0, self.table[index] - 1, -1).astype(np.int64)
+
+    def _insert(self, hashes: np.ndarray, slots: np.ndarray):
+        """Põe na tabela hashes distintos que ainda não estão nela."""
+        mask = len(self.table) - 1
+        index = (hashes & np.uint64(mask)).astype(np.int64)
+        pending = np.arange(len(hashes))
+        reused = 0
+        while len(pending):
+            free = pending[self.table[index[pending]] <= 0]
+            # Uma entrada livre por rodada para cada posição da tabela disputada
+            buckets, first = np.unique(index[free], return_index=True)
+            winners = free[first]
+            reused += int(np.count_nonzero(self.table[buckets] == _TOMBSTONE))
+            self.table[buckets] = slots[winners] + 1
+            placed = np.zeros(len(hashes), dtype=bool)
+            placed[winners] = True
+            pending = pending[~placed[pending]]
+            index[pending] = (index[pending] + 1) & mask
+        self._header[_TOMBSTONES] = int(self._header[_TOMBSTONES]) - reused
+
+    def _remove(self, hashes: np.ndarray):
+        self.table[self._probe(hashes)] = _TOMBSTONE
+        self._header[_TOMBSTONES] = int(self._header[_TOMBSTONES]) + len(hashes)
+
+    def _rebuild_table(self):
+        size = len(self)
+        self.table[:] = _EMPTY
+        self._header[_TOMBSTONES] = 0
+        self._insert(self.hashes[:size], np.arange(size))
+
+    def _least_recently_updated(self, count: int) -> np.ndarray:
+        """
+        Os 'count' slots atualizados há mais tempo. Um argpartition percorre
+        a memória inteira, então cada passada separa de uma vez 1/64 dela
+        (em ordem); os slots atualizados depois de entrar na fila são pulados.
+        """
+        chosen = []
+        while count:
+            if not len(self._eviction_queue):
+                size = len(self)
+                k = min(size, max(count, self.capacity // 64))
+                oldest = np.argpartition(self.updated[:size], k - 1)[:k]
+                self._eviction_queue = oldest[np.argsort(self.updated[oldest], kind="stable")]
+                self._eviction_versions = self.updated[self._eviction_queue]
+            candidates = self._eviction_queue[:count]
+            valid = candidates[self.updated[candidates] == self._eviction_versions[:count]]
+            self._eviction_queue = self._eviction_queue[count:]
+            self._eviction_versions = self._eviction_versions[count:]
+            chosen.append(valid)
+            count -= len(valid)
+        return np.concatenate(chosen)
+
+    # --- Escrita ---
+
+    def extend(self, positions: np.ndarray, players: np.ndarray, targets: np.ndarray):
+        """Acrescenta k posições ((k, 4) bitboards, (k,) lados 0/1, (k,) resultados)."""
+        positions = np.asarray(positions, dtype=np.uint32).reshape(-1, 4)
+        players = np.asarray(players, dtype=np.uint8)
+        targets = np.asarray(targets, dtype=np.float32)
+        if len(positions) == 0:
+            return
+
+        # Agrega o lote: uma linha por posição distinta
+        hashes = position_hashes(positions, players)
+        unique, first, inverse = np.unique(hashes, return_index=True, return_inverse=True)
+        sums = np.bincount(inverse, weights=targets, minlength=len(unique))
+        counts = np.bincount(inverse, minlength=len(unique))
+        version = int(self._header[_CONTENT_VERSION]) + 1
+
+        slots = self.find(unique)
+        known = slots >= 0
+        existing = slots[known]
+        self.outcome_sums[existing] += sums[known]
+        self.visits[existing] += counts[known].astype(np.uint32)
+        self.updated[existing] = version
+
+        new = np.flatnonzero(~known)
+        if len(new) > self.capacity:
+            # Lote maior que a memória: ficam as posições vistas por último
+            last = len(hashes) - 1 - np.unique(hashes[::-1], return_index=True)[1]
+            new = new[np.argsort(last[new], kind="stable")[-self.capacity:]]
+
+        size = len(self)
+        free = min(self.capacity - size, len(new))
+        new_slots = np.arange(size, size + free)
+        num_evicted = len(new) - free
+        if num_evicted:
+            # Saem os slots atualizados há mais tempo (os deste lote têm a versão nova)
+            evicted = self._least_recently_updated(num_evicted)
+            self._remove(self.hashes[evicted])
+            new_slots = np.concatenate([new_slots, evicted])
+
+        self.hashes[new_slots] = unique[new]
+        self.updated[new_slots] = version
+        self.positions[new_slots] = positions[first[new]]
+        self.players[new_slots] = players[first[new]]
+        self.outcome_sums[new_slots] = sums[new]
+        self.visits[new_slots] = counts[new]
+        self._insert(unique[new], new_slots)
+        self._header[_SIZE] = size + free
+        # Entradas removidas alongam as sondagens: refaz a tabela quando passam de 1/4
+        if int(self._header[_TOMBSTONES]) > len(self.table) // 4:
+            self._rebuild_table()
+
+        self._header[_SEEN] += len(positions)
+        self._header[_CONTENT_VERSION] = version
+
+    def add_game(self, positions: np.ndarray, players: np.ndarray, winner: int):
+        """Uma partida de autojogo: resultado +1 para as posições do vencedor, -1 para as do perdedor."""
+        players = np.asarray(players, dtype=np.uint8)
+        targets = np.where(players == winner, 1.0, -1.0).astype(np.float32)
+        self.extend(positions, players, targets)
+
+    def add_games(self, games: list[tuple[np.ndarray, np.ndarray, int]]):
+        """Várias partidas (positions, players, winner) em uma só chamada de 'extend'."""
+        if not games:
+            return
+        players = [np.asarray(game_players, dtype=np.uint8) for _, game_players, _ in games]
+        self.extend(np.concatenate([np.asarray(positions, dtype=np.uint32).reshape(-1, 4)
+                                    for positions, _, _ in games]),
+                    np.concatenate(players),
+                    np.concatenate([np.where(game_players == winner, 1.0, -1.0)
+                                    for game_players, (_, _, winner) in zip(players, games)]))
+
+    def add_samples(self, samples: list[tuple[Board, Player, float]]):
+        """Formato antigo da memória: (board, jogador, alvo)."""
+        if not samples:
+            return
+        self.extend([board.masks() for board, _, _ in samples],
+                    [0 if player == Player.WHITE else 1 for _, player, _ in samples],
+                    [target for _, _, target in samples])
+
+    def flush(self):
+        if self.path is not None:
+            self._header.flush()
+            for name, _, _ in _layout(self.capacity):
+                getattr(self, name).flush()
+
+    # --- Checkpoints (ver checkpoint.py) ---
+
+    def state_dict(self) -> dict:
+        """
+        Cópia do conteúdo. Com memmap, o próprio arquivo já é o estado: só
+        esvazia os buffers e guarda o caminho e o cabeçalho, para conferir
+        na retomada que o arquivo ainda está igual.
+        """
+        if self.path is not None:
+            self.flush()
+            return {"capacity": self.capacity, "path": self.path,
+                    "memmap_header": self._header[_SIZE:_CONTENT_VERSION + 1].copy()}
+        state = {"capacity": self.capacity, "header": self._header.copy()}
+        for name, _, _ in _layout(self.capacity):
+            state[name] = getattr(self, name).copy()
+        return state
+
+    def load_state_dict(self, state: dict):
+        if state["capacity"] != self.capacity:
+            raise ValueError(f"Checkpoint da memória tem capacidade {state['capacity']}, "
+                             f"esperava {self.capacity}")
+        if "header" not in state:
+            # Memória em memmap: o conteúdo já foi reaberto do arquivo, e
+            # precisa ser exatamente o do momento do checkpoint
+            saved = state["memmap_header"]
+            current = self._header[_SIZE:_CONTENT_VERSION + 1]
+            if self.path is None or not np.array_equal(saved, current):
+                raise ValueError(
+                    f"A memória de replay em {self.path} mudou depois do checkpoint "
+                    f"(tamanho, removidas, vistas, versão: {current.tolist()}, "
+                    f"esperava {saved.tolist()}); não é possível retomar exatamente deste checkpoint")
+            return
+        self._header[:] = state["header"]
+        for name, _, _ in _layout(self.capacity):
+            getattr(self, name)[:] = state[name]
+        self._eviction_queue = self._eviction_queue[:0]
+        self._eviction_versions = self._eviction_versions[:0]
+
+    # --- Leitura ---
+
+    def sample(self, n: int, rng: Optional[np.random.Generator] = None
+               ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        n posições únicas sorteadas: (positions (n, 4), players (n,), targets (n,)),
+        com o resultado médio de cada uma como alvo. Sem 'rng', usa self.rng.
+        """
+        rng = rng or self.rng
+        size = len(self)
+        indices = rng.choice(size, size=min(n, size), replace=False)
+        targets = self.outcome_sums[indices] / self.visits[indices]
+        return self.positions[indices], self.players[indices], targets.astype(np.float32)
+
+    def sample_batches(self, num_batches: int, batch_size: int,
+                       rng: Optional[np.random.Generator] = None
+                       ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        'num_batches' sorteios independentes de 'batch_size' posições distintas,
+        concatenados na ordem dos lotes (uma posição pode aparecer em vários
+        lotes, como no treino antigo, que sorteava a cada passo).
+        """
+        rng = rng or self.rng
+        size = len(self)
+        batch_size = min(batch_size, size)
+        indices = np.concatenate([rng.choice(size, size=batch_size, replace=False)
+                                  for _ in range(num_batches)])
+        targets = self.outcome_sums[indices] / self.visits[indices]
+        return self.positions[indices], self.players[indices], targets.astype(np.float32)
@@ -0,0 +1,220 @@
+import time
+import torch
+from src.core.board import Board
+from src.core.piece import Player
+from src.core.transposition_table import TranspositionTable
+from src.core.move import Move
+from src.app.use_cases.table_move_validator import TableMoveValidator
+from .model import score_successors
+from .neural_net_player import NeuralNetPlayer
+from typing import Optional
+
+# Valor de uma vitória/derrota confirmada pela busca. Fica fora do intervalo
+# (-1, 1) da rede para que um mate sempre seja preferido a uma estimativa.
+WIN_SCORE = 10.0
+# Cada ply até o mate desconta MATE_PLY_STEP. Qualquer |score| acima de
+# MATE_THRESHOLD é um mate (a rede fica em (-1, 1)).
+MATE_PLY_STEP = 0.01
+MATE_THRESHOLD = WIN_SCORE / 2
+
+# Flags das entradas na tabela de transposição
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+
+class SearchAborted(Exception):
+    """Levantada quando a busca estoura o orçamento de nós ou de tempo."""
+
+
+class SearchPlayer(NeuralNetPlayer):
+    """
+    Jogador com busca negamax alfa-beta e aprofundamento iterativo.
+
+    - A CheckersNet avalia as folhas: todos os filhos de um nó de
+      profundidade 1 são avaliados em um único lote (batch).
+    - Ordenação: primeiro o movimento guardado na tabela de transposição
+      (hash move), depois as capturas (as maiores primeiro).
+    - Limites: profundidade máxima, número máximo de nós e/ou tempo. Quando um
+      limite estoura, usa o melhor movimento da última iteração completa.
+    """
+
+    def __init__(self, player: Player, model_path: str, max_depth: int = 4,
+                 node_budget: Optional[int] = None, time_budget: Optional[float] = None,
+                 table_size: int = 1 << 18, quantization: Optional[str] = None,
+                 calibration_path: Optional[str] = None):
+        super().__init__(player, model_path, quantization, calibration_path)
+        self.max_depth = max(1, max_depth)
+        self.node_budget = node_budget
+        self.time_budget = time_budget
+        self.validator = TableMoveValidator()
+        self.table = TranspositionTable(table_size)
+
+        self.nodes = 0
+        self.leaf_evaluations = 0
+        self._deadline: Optional[float] = None
+
+    @torch.no_grad()
+    def get_move(self, board: Board, legal_moves: list[Move]) -> Optional[Move]:
+        if not legal_moves:
+            return None
+        if len(legal_moves) == 1:
+            return legal_moves[0]
+        # A busca altera o tabuleiro (apply/undo); trabalhamos em uma cópia
+        # para não expor estados intermediários à interface
+        board = board.deep_copy()
+        # Se o slot dos pesos for reescrito no meio da busca, ela é refeita
+        # com a versão nova (e a tabela, limpa)
+        while True:
+            if self._refresh_shared_weights():
+                # Valores e limites guardados foram calculados pela rede antiga
+                self.table.clear()
+            best_move, best_score, depth_reached = self._iterative_deepening(board, legal_moves)
+            if self._shared_weights_intact():
+                break
+
+        print(f"[Search Player] Profundidade {depth_reached}, {self.nodes} nós, "
+              f"{self.leaf_evaluations} folhas, score: {best_score:.4f}")
+        return best_move
+
+    def _iterative_deepening(self, board: Board, legal_moves: list[Move]) -> tuple[Move, float, int]:
+        """(melhor movimento, score, profundidade) da última iteração completa."""
+        self.nodes = 0
+        self.leaf_evaluations = 0
+        self.table.new_generation()
+        self._deadline = time.perf_counter() + self.time_budget if self.time_budget else None
+
+        best_move = legal_moves[0]
+        best_score = -float('inf')
+        depth_reached = 0
+
+        for depth in range(1, self.max_depth + 1):
+            try:
+                score, move = self._search_root(board, legal_moves, depth)
+            except SearchAborted:
+                break
+            best_score, best_move, depth_reached = score, move, depth
+        return best_move, best_score, depth_reached
+
+    def _search_root(self, board: Board, legal_moves: list[Move], depth: int) -> tuple[float, Move]:
+        alpha, beta = -float('inf'), float('inf')
+        key = board.position_key(self.player)
+        ordered = self._order_moves(legal_moves, self._hash_move(key))
+
+        if depth == 1:
+            scores = self._evaluate_children(board, ordered, self.player)
+            best_index = max(range(len(ordered)), key=lambda i: scores[i])
+            best_score, best_move = scores[best_index], ordered[best_index]
+        else:
+            opponent = _opponent(self.player)
+            best_score, best_move = -float('inf'), ordered[0]
+            for move in ordered:
+                undo_token = board.apply_move(move)
+                score = -self._negamax(board, opponent, depth - 1, -beta, -alpha, 1)
+                board.undo_move(undo_token)
+                if score > best_score:
+                    best_score, best_move = score, move
+                alpha = max(alpha, score)
+
+        self.table.store(key, (best_score, EXACT, best_move.key), depth)
+        return best_score, best_move
+
+    def _negamax(self, board: Board, player: Player, depth: int,
+                 alpha: float, beta: float, ply: int) -> float:
+        self.nodes += 1
+        if self.node_budget is not None and self.nodes > self.node_budget:
+            raise SearchAborted()
+        if self._deadline is not None and (self.nodes & 255) == 0 and time.perf_counter() > self._deadline:
+            raise SearchAborted()
+
+        alpha_orig = alpha
+        key = board.position_key(player)
+        entry = self.table.probe_entry(key)
+        hash_move = None
+        if entry is not None:
+            entry_depth, (value, flag, hash_move) = entry
+            value = _score_from_table(value, ply)
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return value
+                if flag == LOWER_BOUND:
+                    alpha = max(alpha, value)
+                elif flag == UPPER_BOUND:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        moves = self.validator.get_all_legal_moves_for_player(board, player)
+        if not moves:
+            # Sem movimentos: derrota. Derrotas mais distantes valem um pouco mais.
+            return -WIN_SCORE + ply * MATE_PLY_STEP
+
+        ordered = self._order_moves(moves, hash_move)
+        best_score, best_move = -float('inf'), ordered[0]
+
+        if depth == 1:
+            scores = self._evaluate_children(board, ordered, player)
+            for move, score in zip(ordered, scores):
+                if score > best_score:
+                    best_score, best_move = score, move
+        else:
+            opponent = _opponent(player)
+            for move in ordered:
+                undo_token = board.apply_move(move)
+                score = -self._negamax(board, opponent, depth - 1, -beta, -alpha, ply + 1)
+                board.undo_move(undo_token)
+                if score > best_score:
+                    best_score, best_move = score, move
+                alpha = max(alpha, score)
+                if alpha >= beta:
+                    break
+
+        if best_score <= alpha_orig:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.table.store(key, (_score_to_table(best_score, ply), flag, best_move.key), depth)
+        return best_score
+
+    def _evaluate_children(self, board: Board, moves: list[Move], player: Player) -> list[float]:
+        """
+        Avalia todos os filhos de uma só vez: um único forward pass da rede
+        sobre o lote (N, 4, 8, 8). Retorna os scores do ponto de vista de 'player'.
+        """
+        self.leaf_evaluations += len(moves)
+        return score_successors(self.model, board, moves, player, self.eval_cache, self.encoder).tolist()
+
+    def _hash_move(self, key: int) -> Optional[int]:
+        entry = self.table.probe(key)
+        return entry[2] if entry is not None else None
+
+    def _order_moves(self, moves: list[Move], hash_move: Optional[int]) -> list[Move]:
+        # sorted é estável: empates mantêm a ordem do gerador
+        def priority(move: Move) -> tuple[int, int]:
+            return (0 if move.key == hash_move else 1, -len(move.captures))
+        return sorted(moves, key=priority)
+
+
+def _score_to_table(score: float, ply: int) -> float:
+    """
+    Mates são medidos a partir da raiz (o ply entra no score); na tabela
+    ficam relativos ao próprio nó, para valerem quando a mesma posição
+    aparece em outro ply.
+    """
+    if score > MATE_THRESHOLD:
+        return score + ply * MATE_PLY_STEP
+    if score < -MATE_THRESHOLD:
+        return score - ply * MATE_PLY_STEP
+    return score
+
+
+def _score_from_table(score: float, ply: int) -> float:
+    if score > MATE_THRESHOLD:
+        return score - ply * MATE_PLY_STEP
+    if score < -MATE_THRESHOLD:
+        return score + ply * MATE_PLY_STEP
+    return score
+
+
+def _opponent(player: Player) -> Player:
+    return Player.BLACK if player == Player.WHITE else Player.WHITE
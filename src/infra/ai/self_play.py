@@ -0,0 +1,197 @@
+"""
+Autojogo em paralelo, com um pool de processos.
+
+Cada processo mapeia os pesos publicados pelo treinador (shared_weights) e
+joga com o forward pass NumPy: nenhum worker importa o torch, e todos
+enxergam a mesma cópia dos pesos na memória. Quando o treinador publica uma
+nova versão, os workers passam a usá-la na partida seguinte.
+
+Cada partida tem a sua semente, derivada de (semente da execução, era,
+índice da partida): o resultado não depende do número de workers nem da
+ordem em que as partidas terminam.
+
+As partidas voltam como GameRecord (bitboards + lado a jogar, em arrays
+NumPy) em vez de listas de Board.
+
+Benchmark de escala:
+    python -m src.infra.ai.self_play --workers 1 2 4 8 --games 64
+"""
+import argparse
+import multiprocessing as mp
+import os
+import random
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from src.core.board import Board
+from src.core.piece import Player
+from src.core.lru_cache import LRUCache
+from src.app.use_cases.game_manager import GameManager
+from .encoding import encode_channel_masks, evaluate_successors
+from .eval_cache import EvalCache
+from .numpy_net import NumpyCheckersNet
+from .shared_weights import SharedNumpyNet, WeightPublisher
+
+# Caches de cada worker (movimentos legais e avaliações da rede)
+WORKER_MOVE_CACHE_SIZE = 100_000
+WORKER_EVAL_CACHE_SIZE = 100_000
+
+NO_WINNER = -1
+
+
+@dataclass
+class GameRecord:
+    """
+    Uma partida de autojogo, compacta:
+    'positions': (T, 4) uint32, Board.masks() ANTES de cada lance;
+    'players': (T,) uint8, quem jogou (0 = Brancas, 1 = Pretas);
+    'winner': 0, 1 ou NO_WINNER.
+    """
+    positions: np.ndarray
+    players: np.ndarray
+    winner: int
+    seed: int
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def to_training_samples(self) -> list[tuple[Board, Player, float]]:
+        """Mesmo formato de trainer.play_one_game: (board, jogador, +1/-1)."""
+        if self.winner == NO_WINNER:
+            return []
+        samples = []
+        for masks, side in zip(self.positions.tolist(), self.players.tolist()):
+            player = Player.BLACK if side else Player.WHITE
+            result = 1.0 if side == self.winner else -1.0
+            samples.append((Board.from_masks(*masks), player, result))
+        return samples
+
+
+def game_seed(run_seed: int, epoch: int, game_index: int) -> int:
+    return int(np.random.SeedSequence([run_seed, epoch, game_index]).generate_state(1)[0])
+
+
+def play_game(net, seed: int, epsilon: float,
+              move_cache: Optional[LRUCache] = None,
+              eval_cache: Optional[EvalCache] = None) -> GameRecord:
+    """
+    Uma partida IA vs IA com epsilon-greedy (mesma regra de
+    trainer.play_one_game). 'net' recebe (N, 4, 8, 8) e devolve (N, 1).
+    """
+    rng = random.Random(seed)
+    game = GameManager(move_cache=move_cache)
+    positions, players = [], []
+
+    def evaluate(channel_masks: np.ndarray) -> list[float]:
+        return net(encode_channel_masks(channel_masks)).reshape(-1).tolist()
+
+    while not game.get_winner():
+        player = game.get_current_player()
+        legal_moves = game.get_legal_moves()
+        board = game.get_board()
+
+        positions.append(board.masks())
+        players.append(0 if player == Player.WHITE else 1)
+
+        if rng.random() < epsilon:
+            chosen_move = rng.choice(legal_moves)
+        else:
+            # O menor score do oponente; em empate, o primeiro (como no trainer)
+            opponent_scores = evaluate_successors(evaluate, board, legal_moves, player, eval_cache)
+            chosen_move = legal_moves[int(np.argmin(opponent_scores))]
+        game.make_move(chosen_move)
+
+    winner = game.get_winner()
+    return GameRecord(
+        positions=np.array(positions, dtype=np.uint32).reshape(-1, 4),
+        players=np.array(players, dtype=np.uint8),
+        winner=NO_WINNER if winner is None else (0 if winner == Player.WHITE else 1),
+        seed=seed,
+    )
+
+
+# --- Estado de cada processo do pool ---
+
+_worker_net: Optional[SharedNumpyNet] = None
+_worker_move_cache: Optional[LRUCache] = None
+_worker_eval_cache: Optional[EvalCache] = None
+
+
+def _init_worker(weights_path: str, move_cache_size: int, eval_cache_size: int):
+    global _worker_net, _worker_move_cache, _worker_eval_cache
+    _worker_net = SharedNumpyNet(weights_path)
+    _worker_move_cache = LRUCache(move_cache_size)
+    _worker_eval_cache = EvalCache(eval_cache_size)
+
+
+def _play_task(task: tuple[int, float]) -> GameRecord:
+    seed, epsilon = task
+    if _worker_net.maybe_reload():
+        _worker_eval_cache.invalidate()
+    return play_game(_worker_net, seed, epsilon, _worker_move_cache, _worker_eval_cache)
+
+
+class SelfPlayPool:
+    """Pool de processos de autojogo ligado a um arquivo de pesos compartilhados."""
+
+    def __init__(self, num_workers: int, weights_path: str, seed: int = 0,
+                 move_cache_size: int = WORKER_MOVE_CACHE_SIZE,
+                 eval_cache_size: int = WORKER_EVAL_CACHE_SIZE):
+        self.num_workers = num_workers
+        self.seed = seed
+        # 'spawn': os workers não herdam o estado do torch do processo do treinador
+        context = mp.get_context("spawn")
+        self._pool = context.Pool(num_workers, initializer=_init_worker,
+                                  initargs=(weights_path, move_cache_size, eval_cache_size))
+
+    def play(self, num_games: int, epsilon: float, epoch: int = 0) -> list[GameRecord]:
+        """Joga 'num_games' partidas com os pesos publicados mais recentes (ordem fixa)."""
+        tasks = [(game_seed(self.seed, epoch, i), epsilon) for i in range(num_games)]
+        chunksize = max(1, num_games // (4 * self.num_workers))
+        return self._pool.map(_play_task, tasks, chunksize=chunksize)
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self) -> 'SelfPlayPool':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Benchmark do autojogo em paralelo")
+    parser.add_argument("--weights", default=None,
+                        help="arquivo .weights publicado pelo treinador (padrão: pesos aleatórios)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--games", type=int, default=32)
+    parser.add_argument("--epsilon", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    weights_path = args.weights
+    if weights_path is None:
+        weights_path = os.path.join(tempfile.mkdtemp(), "random.weights")
+        WeightPublisher(weights_path).publish(NumpyCheckersNet.random(args.seed).weights)
+
+    baseline = None
+    for num_workers in args.workers:
+        with SelfPlayPool(num_workers, weights_path, args.seed) as pool:
+            start = time.perf_counter()
+            records = pool.play(args.games, args.epsilon)
+            elapsed = time.perf_counter() - start
+        games_per_second = args.games / elapsed
+        baseline = baseline or games_per_second
+        positions = sum(len(record) for record in records)
+        print(f"{num_workers:3d} workers: {games_per_second:6.1f} partidas/s "
+              f"({positions} posições, {games_per_second / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
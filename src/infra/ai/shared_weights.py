@@ -0,0 +1,201 @@
+"""
+Distribuição dos pesos da CheckersNet entre processos por um arquivo mapeado
+em memória (mmap), sem torch.load em cada processo.
+
+O treinador publica os pesos no arquivo; os processos de autojogo/arena
+apontam views NumPy direto para as páginas mapeadas (zero cópia, a memória
+é compartilhada pelo sistema operacional) e recarregam sozinhos quando a
+versão muda.
+
+Formato do arquivo (buffer duplo):
+    cabeçalho (64 bytes): magic | versão | slot ativo | nº de floats | seq[0] | seq[1]
+    slot 0: float32[nº de floats]
+    slot 1: float32[nº de floats]
+O editor sempre escreve no slot inativo e só então troca o slot ativo e
+incrementa a versão; quem está lendo o slot ativo nunca vê uma escrita pela
+metade. 'seq' é ímpar enquanto o slot está sendo escrito (a paridade é
+definida explicitamente, não relativa: um editor morto no meio da escrita
+não deixa o slot ímpar para sempre).
+
+As views continuam apontando para o mesmo slot depois de uma troca de
+versão, e a publicação seguinte à próxima reescreve esse slot. Por isso quem
+usa as views confere, depois de cada uso, que o 'seq' do slot não mudou
+(SharedWeights.intact); se mudou, descarta o resultado, remapeia e refaz.
+Os pesos ficam na ordem de numpy_net.WEIGHT_SHAPES.
+"""
+import os
+import time
+from typing import Optional
+
+import numpy as np
+
+from .numpy_net import WEIGHT_SHAPES, NumpyCheckersNet
+
+# Extensão dos arquivos de pesos compartilhados (os jogadores reconhecem por ela)
+SHARED_WEIGHTS_SUFFIX = ".weights"
+
+MAGIC = int.from_bytes(b"CKWTS001", "little")
+HEADER_BYTES = 64
+# Índices (uint64) no cabeçalho
+_MAGIC, _VERSION, _ACTIVE, _NUM_FLOATS, _SEQ0 = 0, 1, 2, 3, 4
+
+NUM_FLOATS = sum(int(np.prod(shape)) for shape in WEIGHT_SHAPES.values())
+
+
+def _split(flat: np.ndarray) -> dict[str, np.ndarray]:
+    """Views (sem cópia) de cada peso dentro do vetor achatado."""
+    arrays, offset = {}, 0
+    for name, shape in WEIGHT_SHAPES.items():
+        size = int(np.prod(shape))
+        arrays[name] = flat[offset:offset + size].reshape(shape)
+        offset += size
+    return arrays
+
+
+class WeightPublisher:
+    """Lado do treinador: cria o arquivo (se preciso) e publica novas versões."""
+
+    def __init__(self, path: str):
+        self.path = path
+        size = HEADER_BYTES + 2 * NUM_FLOATS * 4
+        if not os.path.exists(path) or os.path.getsize(path) != size:
+            with open(path, "wb") as f:
+                f.truncate(size)
+        self._header = np.memmap(path, dtype=np.uint64, mode="r+", shape=(HEADER_BYTES // 8,))
+        self._slots = np.memmap(path, dtype=np.float32, mode="r+", offset=HEADER_BYTES,
+                                shape=(2, NUM_FLOATS))
+        if self._header[_MAGIC] != MAGIC:
+            self._header[:] = 0
+            self._header[_MAGIC] = MAGIC
+            self._header[_NUM_FLOATS] = NUM_FLOATS
+        else:
+            # Um editor anterior pode ter morrido no meio de uma escrita (seq ímpar).
+            # Só o slot inativo pode estar pela metade, e ele será reescrito.
+            for seq in (_SEQ0, _SEQ0 + 1):
+                self._header[seq] &= ~np.uint64(1)
+        self._header.flush()
+
+    @property
+    def version(self) -> int:
+        return int(self._header[_VERSION])
+
+    def publish(self, weights: dict) -> int:
+        """
+        Publica um state dict (tensores torch ou arrays NumPy, com as chaves
+        da CheckersNet). Retorna a nova versão.
+        """
+        slot = 1 - int(self._header[_ACTIVE]) if self.version else 0
+        seq = _SEQ0 + slot
+
+        self._header[seq] |= np.uint64(1)  # ímpar: escrevendo
+        self._header.flush()
+        target = _split(self._slots[slot])
+        for name in WEIGHT_SHAPES:
+            value = weights[name]
+            if hasattr(value, "detach"):
+                value = value.detach().cpu().numpy()
+            target[name][...] = value
+        self._slots.flush()
+        self._header[seq] += np.uint64(1)  # par: pronto
+
+        self._header[_ACTIVE] = slot
+        self._header[_VERSION] += 1
+        self._header.flush()
+        return self.version
+
+    def publish_model(self, model) -> int:
+        return self.publish(model.state_dict())
+
+
+class SharedWeights:
+    """Lado dos processos: mapeia o arquivo só para leitura e expõe views dos pesos."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._header = np.memmap(path, dtype=np.uint64, mode="r", shape=(HEADER_BYTES // 8,))
+        if self._header[_MAGIC] != MAGIC or self._header[_NUM_FLOATS] != NUM_FLOATS:
+            raise ValueError(f"{path} não é um arquivo de pesos compartilhados da CheckersNet")
+        self._slots = np.memmap(path, dtype=np.float32, mode="r", offset=HEADER_BYTES,
+                                shape=(2, NUM_FLOATS))
+        # Slot e 'seq' das views devolvidas pelo último 'arrays'
+        self._slot: Optional[int] = None
+        self._seq: Optional[int] = None
+
+    @property
+    def version(self) -> int:
+        return int(self._header[_VERSION])
+
+    def arrays(self, timeout: float = 5.0) -> tuple[int, dict[str, np.ndarray]]:
+        """
+        (versão, pesos) do slot ativo, como views do mmap. Espera enquanto
+        não houver nenhuma versão publicada ou o slot estiver sendo escrito.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            version = self.version
+            slot = int(self._header[_ACTIVE])
+            seq = int(self._header[_SEQ0 + slot])
+            if version and seq % 2 == 0:
+                arrays = _split(self._slots[slot])
+                if self.version == version:
+                    self._slot, self._seq = slot, seq
+                    return version, arrays
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Nenhuma versão de pesos publicada em {self.path}")
+            time.sleep(0.001)
+
+    def intact(self) -> bool:
+        """
+        True se o slot das views do último 'arrays' não começou a ser
+        reescrito desde então. Confira depois de usar as views: se der False,
+        o que foi calculado com elas pode ter misturado duas versões.
+        """
+        return self._seq is not None and int(self._header[_SEQ0 + self._slot]) == self._seq
+
+
+class SharedNumpyNet:
+    """
+    NumpyCheckersNet ligada ao arquivo compartilhado: antes de cada avaliação
+    confere a versão (leitura de 8 bytes) e, se mudou, aponta para o novo slot.
+    Trocar de versão não copia nem relê nada do disco.
+    """
+
+    def __init__(self, path: str):
+        self.shared = SharedWeights(path)
+        self.version: Optional[int] = None
+        self.net: Optional[NumpyCheckersNet] = None
+        self.reloads = 0
+        self.maybe_reload()
+
+    def maybe_reload(self) -> bool:
+        if self.shared.version == self.version and self.shared.intact():
+            return False
+        self.version, arrays = self.shared.arrays()
+        self.net = NumpyCheckersNet(arrays)
+        self.reloads += 1
+        return True
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        while True:
+            self.maybe_reload()
+            values = self.net(x)
+            # Slot reescrito durante a avaliação: refaz com a versão nova
+            if self.shared.intact():
+                return values
+
+
+def load_into_torch(model, arrays: dict[str, np.ndarray]):
+    """
+    Aponta os parâmetros de uma CheckersNet (torch) para as views do mmap,
+    sem copiar. Serve só para inferência: os tensores ficam somente leitura
+    e só valem enquanto SharedWeights.intact() for True.
+    """
+    import warnings
+    import torch
+
+    with warnings.catch_warnings():
+        # torch.from_numpy avisa que o array não é gravável (mmap em modo 'r')
+        warnings.simplefilter("ignore", UserWarning)
+        for name, tensor in model.state_dict(keep_vars=True).items():
+            tensor.data = torch.from_numpy(arrays[name])
+    return model
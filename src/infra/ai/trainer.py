@@ -1,32 +1,96 @@
+import argparse
+import os
+import time
+from contextlib import ExitStack
 import torch
 import torch.nn as nn
 import torch.optim as optim
 import random
 import matplotlib.pyplot as plt
 from typing import List, Tuple
-from collections import deque
+import numpy as np
 
 from src.app.use_cases.game_manager import GameManager
+from src.core.lru_cache import LRUCache
 from src.core.board import Board
 from src.core.piece import Player
-from src.infra.ai.model import CheckersNet, board_to_tensor
+from src.infra.ai.model import CheckersNet, score_successors
+from src.infra.ai.encoding import channel_masks_from_bitboards, encode_channel_masks
+from src.infra.ai.replay_buffer import ReplayBuffer
+from src.infra.ai.dataset import ShardDataset, ShardWriter
+from src.infra.ai.checkpoint import (CheckpointWriter, latest_checkpoint, load_checkpoint,
+                                     snapshot_optimizer, snapshot_state_dict)
+from src.infra.ai.metrics import PROFILERS, MetricsLogger, PhaseTimer, profile_epoch
+from src.infra.ai.eval_cache import EvalCache
+from src.infra.ai.shared_weights import WeightPublisher
+from src.infra.ai.self_play import SelfPlayPool, NO_WINNER
 
 # --- CONSTANTES DE TREINAMENTO ---
 NUM_EPOCHS = 500             # Quantas "eras" de treinamento
 GAMES_PER_EPOCH = 100        # Quantos jogos de autojogo por era
 BATCH_SIZE = 64              # Quantas posições treinar de uma vez
+# Quantos mini-lotes (passos do otimizador) por era. O treino original dava um
+# passo por posição, em 640 posições por era; 640 mini-lotes mantêm o mesmo
+# número de passos (e o mesmo LEARNING_RATE e calendário de epsilon, que são por
+# era), agora com 64 posições por passo.
+BATCHES_PER_EPOCH = 640
 LEARNING_RATE = 0.001        # Taxa de aprendizado (o 'passo' do Gradiente Descendente)
 MODEL_SAVE_PATH = "checkers_model_v1.pth" # Onde salvar o cérebro treinado
+# Pesos publicados a cada era para os processos de jogo (mmap, ver shared_weights.py)
+SHARED_WEIGHTS_PATH = "checkers_model_v1.weights"
 
 # Parâmetros de Exploração (Epsilon-Greedy)
 EPSILON_START = 1.0          # 100% de chance de jogada aleatória no início
 EPSILON_END = 0.05           # 5% de chance de jogada aleatória no final
 EPSILON_DECAY = 0.99         # Como o epsilon diminui a cada era
 
+# Cache de movimentos legais compartilhado pelas partidas de autojogo
+# (posições repetidas, como as idas e vindas de damas no final, não são recalculadas)
+MOVE_CACHE_SIZE = 200_000
+# Cache de avaliações da rede (posição + lado a jogar -> score). É esvaziado
+# sempre que o otimizador altera os pesos.
+EVAL_CACHE_SIZE = 200_000
+
+# "Memória de Longo Prazo" das posições: buffer circular de bitboards, uma
+# entrada por posição única (com o resultado médio das vezes em que apareceu).
+# Com um caminho, vira um np.memmap em disco (pode crescer e sobrevive a reinícios).
+# Nesse caso o checkpoint não copia o arquivo: --resume só aceita o checkpoint
+# se o arquivo não mudou desde ele.
+REPLAY_MEMORY_SIZE = 50_000
+REPLAY_MEMORY_PATH = None    # ex.: "replay_memory.bin"
+
+# Diretório onde as partidas de autojogo são gravadas em shards (ver dataset.py),
+# para treinos offline com train_from_dataset. None = não grava.
+DATASET_DIR = None           # ex.: "selfplay_data"
+# Passadas completas pelos shards em um treino offline (--dataset). Cada uma
+# percorre todas as posições gravadas: bem mais cara que uma era de autojogo.
+DATASET_EPOCHS = 1
+
+# Checkpoints completos (pesos, otimizador, era, epsilon, memória de replay),
+# gravados em segundo plano. Continuar com: python -m src.infra.ai.trainer --resume
+CHECKPOINT_DIR = "checkpoints"
+CHECKPOINT_EVERY = 1         # A cada quantas eras (os pesos em MODEL_SAVE_PATH saem em toda era)
+CHECKPOINT_KEEP = 3          # Quantos checkpoints manter
+
+# Métricas por era (tempo de cada fase, vazão), uma linha JSON por era.
+# Resumo/gráfico: python -m src.infra.ai.metrics training_metrics.jsonl --plot
+METRICS_PATH = "training_metrics.jsonl"
+PROFILE_EPOCH = None         # Era (1, 2, ...) a perfilar; None = nenhuma
+PROFILER = "cprofile"        # "cprofile" ou "torch"
+PROFILE_DIR = "profiles"
+SHOW_LOSS_PLOT = True        # Gráfico do erro no fim (plt.show bloqueia até fechar a janela)
+
+# Autojogo em paralelo (ver self_play.py). Com 1 worker (padrão), joga no próprio
+# processo; mais workers são opt-in (--workers N, até os.cpu_count()).
+NUM_SELF_PLAY_WORKERS = 1
+SELF_PLAY_SEED = 0           # Semente das partidas: mesma semente, mesmas partidas
+SAMPLING_SEED = 0            # Semente dos sorteios de lotes da memória de replay
+
 
 @torch.no_grad() # 
 def get_best_move_from_model(model: CheckersNet, board: Board, 
-                             legal_moves: List[dict], player: Player) -> dict:
+                             legal_moves: List[dict], player: Player,
+                             eval_cache: EvalCache | None = None) -> dict:
     """
     Simula 1 passo à frente para todos os movimentos legais e 
     retorna o movimento que leva ao *menor* score do oponente.
@@ -34,42 +98,18 @@ def get_best_move_from_model(model: CheckersNet, board: Board,
     if not legal_moves:
         return None
 
-    best_score = -float('inf')
-    best_move = None
-    
-    opponent = Player.BLACK if player == Player.WHITE else Player.WHITE
-
-    for move in legal_moves:
-        # Simula o movimento
-        temp_board = board.deep_copy()
-        
-        # (Lógica simplificada de 'make_move' para simulação)
-        piece = temp_board.get_piece(move["from_pos"][0], move["from_pos"][1])
-        temp_board.move_piece(move["from_pos"][0], move["from_pos"][1], 
-                              move["to_pos"][0], move["to_pos"][1])
-        for cap_pos in move["captures"]:
-            temp_board.remove_piece(cap_pos[0], cap_pos[1])
-        # (Simplificado: não estamos simulando a promoção aqui, mas poderíamos)
-
-        # Avalia a posição resultante do *ponto de vista do oponente*
-        board_tensor = board_to_tensor(temp_board, opponent)
-        score_tensor = model(board_tensor)
-        score = score_tensor.item()
-        
-        # Queremos o movimento que MINIMIZA o score do oponente.
-        # Minimizar 'score' é o mesmo que maximizar '-score'.
-        current_move_score = -score 
-        
-        if current_move_score > best_score:
-            best_score = current_move_score
-            best_move = move
-            
-    return best_move if best_move else random.choice(legal_moves)
+    # Avalia todos os sucessores em um único lote, do ponto de vista do
+    # oponente. Queremos o movimento que MINIMIZA o score do oponente, ou
+    # seja, o maior '-score' (argmax fica com o primeiro em caso de empate).
+    scores = score_successors(model, board, legal_moves, player, eval_cache)
+    return legal_moves[int(torch.argmax(scores))]
 
 
 # --- FUNÇÃO DE AUTOJOGO (SELF-PLAY) ---
 
-def play_one_game(model: CheckersNet, epsilon: float) -> List[Tuple[Board, Player, float]]:
+def play_one_game(model: CheckersNet, epsilon: float,
+                  move_cache: LRUCache | None = None,
+                  eval_cache: EvalCache | None = None) -> List[Tuple[Board, Player, float]]:
     """
     Simula um jogo completo de autojogo (IA vs IA).
     Usa Epsilon-Greedy: 'epsilon' de chance de jogar aleatório (Explorar)
@@ -79,7 +119,7 @@ def play_one_game(model: CheckersNet, epsilon: float) -> List[Tuple[Board, Playe
     [(board, player_que_jogou, resultado_final_para_aquele_player), ...]
     """
     
-    game = GameManager()
+    game = GameManager(move_cache=move_cache)
     game_memory: List[Tuple[Board, Player]] = [] # (board_state, player_who_moved)
     
     while not game.get_winner():
@@ -96,7 +136,7 @@ def play_one_game(model: CheckersNet, epsilon: float) -> List[Tuple[Board, Playe
         else:
             # EXPLORAR (Exploit): Usa o modelo para escolher a melhor jogada
             chosen_move = get_best_move_from_model(model, game.get_board(), 
-                                                   legal_moves, current_player)
+                                                   legal_moves, current_player, eval_cache)
         
         game.make_move(chosen_move)
 
@@ -115,9 +155,63 @@ def play_one_game(model: CheckersNet, epsilon: float) -> List[Tuple[Board, Playe
     return labeled_data
 
 
+# --- FASE DE APRENDIZADO (MINI-LOTES) ---
+
+def train_on_samples(model: CheckersNet, optimizer: optim.Optimizer, loss_function: nn.Module,
+                     positions: np.ndarray, players: np.ndarray, target_scores: np.ndarray,
+                     device: torch.device, timer: PhaseTimer | None = None) -> float:
+    """
+    Treina em mini-lotes de BATCH_SIZE posições (um passo do otimizador por
+    lote). Todas as amostras ((N, 4) bitboards, (N,) lados 0/1, (N,) alvos,
+    como saem da ReplayBuffer) são codificadas de uma vez, antes do laço.
+    Com 'timer', acumula o tempo das fases encode/forward/backward/optimizer.
+    Retorna o erro (loss) médio por posição.
+    """
+    timer = timer or PhaseTimer()
+    with timer.phase("encode"):
+        channel_masks = channel_masks_from_bitboards(positions, players)
+        inputs = torch.from_numpy(encode_channel_masks(channel_masks)).to(device)
+        targets = torch.as_tensor(target_scores, dtype=torch.float32).view(-1, 1).to(device)
+
+    total_loss = 0.0
+    for start in range(0, len(inputs), BATCH_SIZE):
+        batch_inputs = inputs[start:start + BATCH_SIZE]
+        batch_targets = targets[start:start + BATCH_SIZE]
+
+        # --- O Coração do Aprendizado ---
+
+        with timer.phase("forward"):
+            # 1. Zera os gradientes antigos
+            optimizer.zero_grad()
+
+            # 2. Forward Pass: Pede a previsão do modelo para o lote inteiro
+            prediction = model(batch_inputs)
+
+            # 3. Calcula o "Erro" (Função de Custo) médio do lote
+            loss = loss_function(prediction, batch_targets)
+
+        with timer.phase("backward"):
+            # 4. Backpropagation: Calcula o Gradiente
+            loss.backward()
+
+        with timer.phase("optimizer"):
+            # 5. Gradiente Descendente: Atualiza os pesos (neurônios) [cite: 13, 21]
+            optimizer.step()
+
+        total_loss += loss.item() * len(batch_inputs)
+        # --- Fim do Coração ---
+
+    return total_loss / len(inputs)
+
+
 # --- O LOOP DE TREINAMENTO PRINCIPAL ---
 
-def train():
+def train(resume: str | None = None):
+    """
+    'resume': caminho de um checkpoint, ou "latest" para o mais recente de
+    CHECKPOINT_DIR. Restaura pesos, otimizador, era, epsilon, histórico do
+    erro, memória de replay e geradores aleatórios.
+    """
     print("--- Iniciando Treinamento da IA ---")
     
     # 1. Carrega o Cérebro e as Ferramentas de Treinamento
@@ -125,13 +219,26 @@ def train():
     print(f"Usando dispositivo: {device}")
     
     model = CheckersNet().to(device)
-    
-    # Tenta carregar um modelo existente para continuar o treino
-    try:
-        model.load_state_dict(torch.load(MODEL_SAVE_PATH))
-        print(f"Modelo {MODEL_SAVE_PATH} carregado. Continuando treinamento.")
-    except FileNotFoundError:
-        print(f"Nenhum modelo encontrado. Começando um novo treinamento.")
+
+    checkpoint = None
+    if resume is not None:
+        checkpoint_path = latest_checkpoint(CHECKPOINT_DIR) if resume == "latest" else resume
+        if checkpoint_path is None:
+            print(f"Nenhum checkpoint em {CHECKPOINT_DIR}. Começando um novo treinamento.")
+        else:
+            # Tudo na CPU: o estado do gerador do torch precisa ser um ByteTensor da
+            # CPU, e load_state_dict já copia pesos e momentos para o dispositivo
+            checkpoint = load_checkpoint(checkpoint_path, map_location="cpu")
+            model.load_state_dict(checkpoint["model"])
+            print(f"Checkpoint {checkpoint_path} carregado (era {checkpoint['epoch']}).")
+
+    # Sem checkpoint, tenta carregar um modelo existente para continuar o treino
+    if checkpoint is None:
+        try:
+            model.load_state_dict(torch.load(MODEL_SAVE_PATH))
+            print(f"Modelo {MODEL_SAVE_PATH} carregado. Continuando treinamento.")
+        except FileNotFoundError:
+            print(f"Nenhum modelo encontrado. Começando um novo treinamento.")
         
     # Otimizador (Gradiente Descendente) [cite: 13, 21]
     optimizer = optim.Adam(model.parameters(), lr=LEARNING_RATE)
@@ -143,83 +250,219 @@ def train():
     # Guarda o histórico de erros para o gráfico 
     all_epochs_loss = []
     epsilon = EPSILON_START
+    start_epoch = 0
     
     # "Memória de Longo Prazo" das posições
-    replay_memory = deque(maxlen=50000) 
+    sampling_rng = np.random.default_rng(SAMPLING_SEED)
+    replay_memory = ReplayBuffer(REPLAY_MEMORY_SIZE, REPLAY_MEMORY_PATH, sampling_rng)
+
+    if checkpoint is not None:
+        optimizer.load_state_dict(checkpoint["optimizer"])
+        replay_memory.load_state_dict(checkpoint["replay_memory"])
+        all_epochs_loss = checkpoint["loss_history"]
+        epsilon = checkpoint["epsilon"]
+        start_epoch = checkpoint["epoch"]
+        random.setstate(checkpoint["random_state"])
+        torch.set_rng_state(checkpoint["torch_rng_state"])
+        sampling_rng.bit_generator.state = checkpoint["sampling_rng_state"]
+    if len(replay_memory):
+        print(f"Memória de replay reaberta com {len(replay_memory)} posições.")
+    checkpoint_writer = CheckpointWriter(CHECKPOINT_DIR, CHECKPOINT_KEEP)
+    move_cache = LRUCache(MOVE_CACHE_SIZE)
+    eval_cache = EvalCache(EVAL_CACHE_SIZE)
+    eval_cache.watch_optimizer(optimizer)
+    weight_publisher = WeightPublisher(SHARED_WEIGHTS_PATH)
+    weight_publisher.publish_model(model)
+    dataset_writer = ShardWriter(DATASET_DIR) if DATASET_DIR else None
+    self_play_pool = None
+    if NUM_SELF_PLAY_WORKERS > 1:
+        self_play_pool = SelfPlayPool(NUM_SELF_PLAY_WORKERS, SHARED_WEIGHTS_PATH, SELF_PLAY_SEED)
+        print(f"Autojogo em paralelo com {NUM_SELF_PLAY_WORKERS} processos.")
+    metrics = MetricsLogger(METRICS_PATH) if METRICS_PATH else None
+    sync = torch.cuda.synchronize if device.type == "cuda" else None
+    # Fecha o perfil (se houver) no início da era seguinte
+    epoch_profiler = ExitStack()
 
     # 2. O Loop de Treinamento (Eras)
-    for epoch in range(NUM_EPOCHS):
+    for epoch in range(start_epoch, NUM_EPOCHS):
+        epoch_profiler.close()
+        if PROFILE_EPOCH == epoch + 1:
+            epoch_profiler.enter_context(profile_epoch(PROFILER, PROFILE_DIR, epoch + 1))
         print(f"\n--- ERA {epoch + 1} / {NUM_EPOCHS} ---")
         print(f"Epsilon (Exploração) atual: {epsilon:.4f}")
+        timer = PhaseTimer(sync)
+        game_lengths = []
         
         # --- FASE 1: AUTOJOGO (Coleta de Dados) ---
         # "O treinamento ocorreu por repetição, em milhares de partidas de autojogo" 
         model.eval() # Modo de avaliação (não aprende)
         
-        games_played = 0
-        while games_played < GAMES_PER_EPOCH:
-            game_data = play_one_game(model, epsilon)
-            if game_data:
-                replay_memory.extend(game_data)
-                games_played += 1
+        with timer.phase("self_play"):
+            # As partidas da era entram na memória de uma vez (extend é vetorizado)
+            if self_play_pool is not None:
+                # Os workers usam os pesos publicados no fim da era anterior
+                finished_games = []
+                for record in self_play_pool.play(GAMES_PER_EPOCH, epsilon, epoch):
+                    game_lengths.append(len(record))
+                    if record.winner != NO_WINNER:
+                        finished_games.append((record.positions, record.players, record.winner))
+                        if dataset_writer is not None:
+                            dataset_writer.add_game(record.positions, record.players, record.winner)
+                replay_memory.add_games(finished_games)
+            else:
+                epoch_samples = []
+                while len(game_lengths) < GAMES_PER_EPOCH:
+                    game_data = play_one_game(model, epsilon, move_cache, eval_cache)
+                    if game_data:
+                        epoch_samples.extend(game_data)
+                        if dataset_writer is not None:
+                            dataset_writer.add_samples(game_data)
+                        game_lengths.append(len(game_data))
+                replay_memory.add_samples(epoch_samples)
+        self_play_seconds = timer.total("self_play")
+        print(f"Autojogo: {len(game_lengths) / self_play_seconds:.1f} partidas/s, "
+              f"{sum(game_lengths) / self_play_seconds:.0f} posições/s")
+        self_play_metrics = {
+            "games": len(game_lengths),
+            "positions": sum(game_lengths),
+            "avg_game_length": sum(game_lengths) / max(1, len(game_lengths)),
+            "games_per_s": len(game_lengths) / self_play_seconds,
+            "positions_per_s": sum(game_lengths) / self_play_seconds,
+            "replay_unique": len(replay_memory),
+            "replay_seen": replay_memory.positions_seen,
+        }
                 
         if len(replay_memory) < BATCH_SIZE:
             print("Coletando mais dados antes de iniciar o treino...")
+            if metrics is not None:
+                # Era de aquecimento (só autojogo): entra nas métricas sem os campos do treino
+                metrics.log({"epoch": epoch + 1, "epsilon": epsilon, "warmup": True,
+                             **self_play_metrics, "phases": timer.as_dict()})
             continue
         
-        print(f"Jogos simulados. {len(replay_memory)} posições na memória.")
+        print(f"Jogos simulados. {len(replay_memory)} posições únicas na memória "
+              f"({replay_memory.positions_seen} vistas).")
+        if self_play_pool is None:
+            print(f"Cache de movimentos: {move_cache.hit_rate:.1%} de acertos, {len(move_cache)} posições")
+            print(f"Cache de avaliações: {eval_cache.hit_rate:.1%} de acertos, {len(eval_cache)} posições")
+            eval_cache.reset_stats()
 
         # --- FASE 2: APRENDIZADO (Backpropagation) ---
         # "demonstrar com clareza o processo de otimização" 
         model.train() # Modo de treinamento (aprende)
         
-        epoch_loss = 0.0
-        
-        # Pega um "lote" aleatório da memória para treinar
-        training_batch = random.sample(replay_memory, 
-                                     min(len(replay_memory), BATCH_SIZE * 10))
-        
-        for board_state, player, target_score in training_batch:
-            
-            # --- O Coração do Aprendizado ---
-            
-            # 1. Zera os gradientes antigos
-            optimizer.zero_grad()
-            
-            # 2. Converte o estado para Tensor
-            tensor = board_to_tensor(board_state, player).to(device)
-            target = torch.tensor([target_score], dtype=torch.float32).to(device)
-            
-            # 3. Forward Pass: Pede a previsão do modelo
-            prediction = model(tensor)
-            
-            # 4. Calcula o "Erro" (Função de Custo) 
-            loss = loss_function(prediction, target)
-            
-            # 5. Backpropagation: Calcula o Gradiente 
-            loss.backward()
-            
-            # 6. Gradiente Descendente: Atualiza os pesos (neurônios) [cite: 13, 21]
-            optimizer.step()
-            
-            epoch_loss += loss.item()
-            # --- Fim do Coração ---
-
-        avg_loss = epoch_loss / len(training_batch)
+        # Pega várias amostras aleatórias da memória para treinar
+        with timer.phase("sample"):
+            positions, players, targets = replay_memory.sample_batches(BATCHES_PER_EPOCH, BATCH_SIZE)
+        avg_loss = train_on_samples(model, optimizer, loss_function, positions, players, targets,
+                                    device, timer)
         all_epochs_loss.append(avg_loss)
         print(f"Treinamento da Era concluído. Erro (Loss) médio: {avg_loss:.6f}")
         
-        # 3. Salva o Cérebro
-        torch.save(model.state_dict(), MODEL_SAVE_PATH)
-        
-        # 4. Diminui a exploração
+        # 3. Diminui a exploração
         epsilon = max(EPSILON_END, epsilon * EPSILON_DECAY)
 
+        # 4. Salva o Cérebro. O laço só copia o estado; a gravação em disco
+        # fica com a thread do CheckpointWriter.
+        with timer.phase("checkpoint"):
+            model_state = snapshot_state_dict(model.state_dict())
+            if (epoch + 1) % CHECKPOINT_EVERY == 0:
+                checkpoint_writer.save(epoch + 1, {
+                    "epoch": epoch + 1,
+                    "model": model_state,
+                    "optimizer": snapshot_optimizer(optimizer),
+                    "epsilon": epsilon,
+                    "loss_history": list(all_epochs_loss),
+                    "replay_memory": replay_memory.state_dict(),
+                    "random_state": random.getstate(),
+                    "torch_rng_state": torch.get_rng_state(),
+                    "sampling_rng_state": sampling_rng.bit_generator.state,
+                }, MODEL_SAVE_PATH)
+            else:
+                checkpoint_writer.save_weights(model_state, MODEL_SAVE_PATH)
+                replay_memory.flush()
+        with timer.phase("publish"):
+            version = weight_publisher.publish_model(model)
+        print(f"Pesos publicados em {SHARED_WEIGHTS_PATH} (versão {version})")
+
+        # 5. Métricas da era
+        if metrics is not None:
+            training_seconds = timer.total("encode", "forward", "backward", "optimizer")
+            metrics.log({
+                "epoch": epoch + 1,
+                "epsilon": epsilon,
+                "loss": avg_loss,
+                **self_play_metrics,
+                "samples_trained": len(targets),
+                "samples_per_s": len(targets) / training_seconds,
+                "phases": timer.as_dict(),
+                # Acumulado da thread de gravação (fora do caminho do treino)
+                "checkpoint_write_s": round(checkpoint_writer.write_seconds, 6),
+            })
+
+    if self_play_pool is not None:
+        self_play_pool.close()
+    if dataset_writer is not None:
+        dataset_writer.close()
+        print(f"{dataset_writer.num_games} partidas gravadas em {DATASET_DIR}")
+    epoch_profiler.close()
+    checkpoint_writer.close()
+    if metrics is not None:
+        metrics.close()
+        print(f"Métricas por era em {METRICS_PATH}")
+
     print("\n--- TREINAMENTO CONCLUÍDO ---")
     print(f"Modelo salvo em: {MODEL_SAVE_PATH}")
     
-    # 5. Gera o Gráfico da Função de Custo
+    # 6. Gera o Gráfico da Função de Custo
     # "evidenciada pela redução contínua do erro" 
+    if SHOW_LOSS_PLOT:
+        plot_loss(all_epochs_loss)
+
+
+def train_from_dataset(*sources: str, num_epochs: int = 1, seed: int = SELF_PLAY_SEED):
+    """
+    Treino offline a partir de shards gravados pelo autojogo (DATASET_DIR),
+    sem jogar nenhuma partida. Cada era é uma passada embaralhada por todas
+    as posições, lidas em fluxo do disco.
+    """
+    print("--- Iniciando Treinamento Offline ---")
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    dataset = ShardDataset(*sources)
+    print(f"{len(dataset.paths)} shards, {dataset.num_games} partidas, {len(dataset)} posições.")
+
+    model = CheckersNet().to(device)
+    try:
+        model.load_state_dict(torch.load(MODEL_SAVE_PATH))
+        print(f"Modelo {MODEL_SAVE_PATH} carregado. Continuando treinamento.")
+    except FileNotFoundError:
+        print(f"Nenhum modelo encontrado. Começando um novo treinamento.")
+    optimizer = optim.Adam(model.parameters(), lr=LEARNING_RATE)
+    loss_function = nn.MSELoss()
+    rng = np.random.default_rng(seed)
+
+    all_epochs_loss = []
+    model.train()
+    for epoch in range(num_epochs):
+        start = time.perf_counter()
+        total_loss, total_positions = 0.0, 0
+        # Cada bloco lido do disco vira BATCHES_PER_EPOCH mini-lotes
+        for positions, players, targets in dataset.batches(BATCH_SIZE * BATCHES_PER_EPOCH, rng):
+            loss = train_on_samples(model, optimizer, loss_function, positions, players, targets, device)
+            total_loss += loss * len(targets)
+            total_positions += len(targets)
+        avg_loss = total_loss / max(1, total_positions)
+        all_epochs_loss.append(avg_loss)
+        print(f"Era {epoch + 1} / {num_epochs}: Erro (Loss) médio {avg_loss:.6f} "
+              f"({total_positions / (time.perf_counter() - start):.0f} posições/s)")
+        torch.save(model.state_dict(), MODEL_SAVE_PATH)
+
+    print(f"Modelo salvo em: {MODEL_SAVE_PATH}")
+    if SHOW_LOSS_PLOT:
+        plot_loss(all_epochs_loss)
+
+
+def plot_loss(all_epochs_loss: List[float]):
     plt.figure(figsize=(10, 5))
     plt.plot(all_epochs_loss)
     plt.title("Gráfico de Convergência (Função de Custo vs. Eras)")
@@ -230,5 +473,45 @@ def train():
 
 
 # --- Ponto de Entrada do Script ---
+
+def main(argv: list[str] | None = None):
+    global NUM_EPOCHS, CHECKPOINT_DIR, CHECKPOINT_EVERY, CHECKPOINT_KEEP
+    global METRICS_PATH, PROFILE_EPOCH, PROFILER, SHOW_LOSS_PLOT, NUM_SELF_PLAY_WORKERS
+
+    parser = argparse.ArgumentParser(description="Treinamento da CheckersNet por autojogo")
+    parser.add_argument("--resume", nargs="?", const="latest", default=None,
+                        help="continua de um checkpoint (sem caminho: o mais recente de --checkpoint-dir)")
+    parser.add_argument("--epochs", type=int, default=NUM_EPOCHS, help="total de eras (contando as já feitas)")
+    parser.add_argument("--checkpoint-dir", default=CHECKPOINT_DIR)
+    parser.add_argument("--checkpoint-every", type=int, default=CHECKPOINT_EVERY, help="eras entre checkpoints")
+    parser.add_argument("--keep", type=int, default=CHECKPOINT_KEEP, help="checkpoints mantidos")
+    parser.add_argument("--workers", type=int, default=NUM_SELF_PLAY_WORKERS,
+                        help="processos de autojogo (1 = no próprio processo)")
+    parser.add_argument("--metrics", default=METRICS_PATH, help="arquivo JSONL de métricas ('' desliga)")
+    parser.add_argument("--profile-epoch", type=int, default=PROFILE_EPOCH, help="era a perfilar (1, 2, ...)")
+    parser.add_argument("--profiler", choices=PROFILERS, default=PROFILER)
+    parser.add_argument("--no-plot", action="store_true", help="não abre o gráfico do erro no fim")
+    parser.add_argument("--dataset", nargs="+", default=None,
+                        help="treino offline a partir de shards de autojogo (diretórios ou arquivos .shard); "
+                             "ignora --epochs")
+    parser.add_argument("--dataset-epochs", type=int, default=DATASET_EPOCHS,
+                        help="passadas completas pelos shards no treino offline")
+    args = parser.parse_args(argv)
+
+    NUM_EPOCHS = args.epochs
+    CHECKPOINT_DIR = args.checkpoint_dir
+    CHECKPOINT_EVERY = max(1, args.checkpoint_every)
+    CHECKPOINT_KEEP = args.keep
+    METRICS_PATH = args.metrics
+    NUM_SELF_PLAY_WORKERS = max(1, min(args.workers, os.cpu_count() or 1))
+    PROFILE_EPOCH = args.profile_epoch
+    PROFILER = args.profiler
+    SHOW_LOSS_PLOT = not args.no_plot
+    if args.dataset:
+        train_from_dataset(*args.dataset, num_epochs=args.dataset_epochs)
+    else:
+        train(resume=args.resume)
+
+
 if __name__ == "__main__":
-    train()
\ No newline at end of file
+    main()
\ No newline at end of file
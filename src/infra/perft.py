@@ -0,0 +1,150 @@
+"""
+Perft: conta as folhas da árvore de movimentos legais até a profundidade N.
+
+Serve para duas coisas:
+- Correção: compara as contagens com valores de referência gravados
+  (gerados pelo MoveValidator). Qualquer gerador alternativo precisa bater
+  exatamente com eles. Cadeias equivalentes (mesma origem, destino e
+  conjunto de capturas) contam como um único movimento.
+- Desempenho: mede nós por segundo de cada gerador.
+
+Uso:
+    python -m src.infra.perft                      # confere todas as posições
+    python -m src.infra.perft --validator reference --validator table --depth 4
+    python -m src.infra.perft --position king_chain --divide
+"""
+import argparse
+import sys
+import time
+
+from src.core.board import Board
+from src.core.piece import Player
+from src.app.use_cases.move_validator import MoveValidator
+from src.app.use_cases.table_move_validator import TableMoveValidator
+
+VALIDATORS = {
+    "reference": MoveValidator,
+    "table": TableMoveValidator,
+}
+
+# nome -> (lado a jogar, posição em Board.to_string)
+# As posições (exceto a inicial) foram tiradas de partidas de autojogo aleatório.
+POSITIONS: dict[str, tuple[Player, str]] = {
+    "start": (Player.WHITE, "bbbbbbbbbbbb........wwwwwwwwwwww"),
+    # Dama branca com cadeia de capturas e regra da maioria (2 x 3 capturas)
+    "king_chain": (Player.WHITE, "b.b.....bbbb.....wwWw..w.wwwwww."),
+    # Pretas: cadeias de 3 e 5 capturas, com cadeias equivalentes repetidas
+    "majority_black": (Player.BLACK, "....b...W.bb....www....wwwwww.w."),
+    # Maioria entre peças simples (3 x 4 capturas)
+    "majority_men": (Player.WHITE, "b.b.bbbb.b.b..b....b.bw.w...ww.w"),
+    # Damas dos dois lados com capturas de vários pousos
+    "king_landings": (Player.WHITE, "..W..bb.........bb......w.....B."),
+    # Final de damas: muitos movimentos longos e repetições de posição
+    "kings_endgame": (Player.WHITE, "..W..........W..........b..w.BB."),
+}
+
+# nome -> contagens de referência para as profundidades 1, 2, 3, ...
+REFERENCE_COUNTS: dict[str, list[int]] = {
+    "start": [7, 49, 302, 1469, 7473, 37628, 187302],
+    "king_chain": [1, 4, 41, 155, 1293, 4692, 30195, 90667],
+    "majority_black": [3, 21, 60, 256, 1031, 4323, 17820, 73154],
+    "majority_men": [1, 1, 7, 55, 293, 2042, 9521, 56035],
+    "king_landings": [5, 40, 225, 1213, 6731, 40364],
+    "kings_endgame": [15, 149, 1274, 12435, 114475],
+}
+
+
+def perft(validator, board: Board, player: Player, depth: int) -> int:
+    if depth == 0:
+        return 1
+    moves = validator.get_all_legal_moves_for_player(board, player)
+    if depth == 1:
+        return len(moves)
+
+    opponent = Player.BLACK if player == Player.WHITE else Player.WHITE
+    nodes = 0
+    for move in moves:
+        undo_token = board.apply_move(move)
+        nodes += perft(validator, board, opponent, depth - 1)
+        board.undo_move(undo_token)
+    return nodes
+
+
+def divide(validator, board: Board, player: Player, depth: int) -> list[tuple[dict, int]]:
+    """Contagem perft separada por movimento da raiz (útil para achar divergências)."""
+    opponent = Player.BLACK if player == Player.WHITE else Player.WHITE
+    result = []
+    for move in validator.get_all_legal_moves_for_player(board, player):
+        undo_token = board.apply_move(move)
+        result.append((move, perft(validator, board, opponent, depth - 1)))
+        board.undo_move(undo_token)
+    return result
+
+
+def run_suite(validator_name: str, names: list[str], max_depth: int | None) -> bool:
+    validator = VALIDATORS[validator_name]()
+    all_ok = True
+    total_nodes = 0
+    total_time = 0.0
+
+    for name in names:
+        player, text = POSITIONS[name]
+        expected = REFERENCE_COUNTS.get(name, [])
+        depth_limit = max_depth or len(expected)
+        for depth in range(1, depth_limit + 1):
+            board = Board.from_string(text)
+            start = time.perf_counter()
+            nodes = perft(validator, board, player, depth)
+            elapsed = time.perf_counter() - start
+            total_nodes += nodes
+            total_time += elapsed
+
+            if depth <= len(expected):
+                ok = nodes == expected[depth - 1]
+                status = "OK" if ok else f"ERRO (esperado {expected[depth - 1]})"
+                all_ok &= ok
+            else:
+                status = "sem referência"
+            nps = nodes / elapsed if elapsed > 0 else float('inf')
+            print(f"{name:<16} d={depth}  {nodes:>10}  {elapsed:8.3f}s  {nps:>12,.0f} nós/s  {status}")
+
+    if total_time > 0:
+        print(f"\n[{validator_name}] {total_nodes} nós em {total_time:.3f}s "
+              f"({total_nodes / total_time:,.0f} nós/s)")
+    return all_ok
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Perft para os geradores de movimentos")
+    parser.add_argument("--validator", choices=sorted(VALIDATORS), action="append",
+                        help="gerador a testar (pode repetir para comparar; padrão: table)")
+    parser.add_argument("--position", choices=sorted(POSITIONS), action="append",
+                        help="posição a testar (pode repetir; padrão: todas)")
+    parser.add_argument("--depth", type=int, default=None,
+                        help="profundidade máxima (padrão: todas as referências gravadas)")
+    parser.add_argument("--divide", action="store_true",
+                        help="mostra a contagem por movimento da raiz na profundidade --depth")
+    args = parser.parse_args(argv)
+
+    names = args.position or list(POSITIONS)
+    validator_names = args.validator or ["table"]
+
+    if args.divide:
+        validator = VALIDATORS[validator_names[0]]()
+        depth = args.depth or 1
+        for name in names:
+            player, text = POSITIONS[name]
+            print(f"--- {name} (d={depth}) ---")
+            for move, nodes in divide(validator, Board.from_string(text), player, depth):
+                print(f"{move['from_pos']} -> {move['to_pos']} x{len(move['captures'])}: {nodes}")
+        return 0
+
+    all_ok = True
+    for validator_name in validator_names:
+        all_ok &= run_suite(validator_name, names, args.depth)
+        print()
+    return 0 if all_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Benchmark de inicialização do jogo.
+
+Mede, em um interpretador novo a cada rodada (como quem abre o jogo):
+- tempo até o primeiro quadro do menu (imports + pygame.init + GameMenu);
+- tempo até o primeiro quadro do tabuleiro (GameManager + PygameView com os
+  agentes do cenário + primeiro _update_display);
+- se o torch foi importado no caminho.
+
+Roda sem janela (SDL_VIDEODRIVER=dummy). Os limites opcionais fazem o
+comando falhar se a inicialização piorar:
+    python -m src.infra.startup_benchmark
+    python -m src.infra.startup_benchmark --scenario human --max-menu-ms 800
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# nome -> configuração dos agentes (o mesmo dicionário que o menu devolve)
+SCENARIOS: dict[str, dict] = {
+    "human": {"white": {"type": "HUMAN"}, "black": {"type": "HUMAN"}},
+    "random": {"white": {"type": "HUMAN"}, "black": {"type": "RANDOM"}},
+    "nn_numpy": {"white": {"type": "HUMAN"}, "black": {"type": "NN", "backend": "numpy"}},
+    "nn": {"white": {"type": "HUMAN"}, "black": {"type": "NN"}},
+}
+
+
+def _measure(scenario: str) -> dict:
+    """Executado no processo filho: mede um único arranque."""
+    start = time.perf_counter()
+
+    import pygame
+    from src.app.use_cases.game_manager import GameManager
+    from src.infra.ui.pygame_view import PygameView
+    from src.infra.ui.menu import GameMenu
+
+    pygame.init()
+    menu = GameMenu()
+    menu._draw_menu("Jogo de Damas - IA", menu.main_buttons)
+    menu_frame = time.perf_counter()
+
+    game = GameManager()
+    view = PygameView(game, SCENARIOS[scenario])
+    view._update_display()
+    board_frame = time.perf_counter()
+
+    pygame.quit()
+    return {
+        "menu_ms": 1000 * (menu_frame - start),
+        "board_ms": 1000 * (board_frame - start),
+        "torch_imported": "torch" in sys.modules,
+    }
+
+
+def run_scenario(scenario: str, repeats: int) -> dict:
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    runs = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-m", "src.infra.startup_benchmark", "--child", scenario],
+            env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        result["process_ms"] = 1000 * (time.perf_counter() - start)
+        runs.append(result)
+
+    return {
+        "menu_ms": statistics.median(r["menu_ms"] for r in runs),
+        "board_ms": statistics.median(r["board_ms"] for r in runs),
+        "process_ms": statistics.median(r["process_ms"] for r in runs),
+        "torch_imported": any(r["torch_imported"] for r in runs),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de inicialização do jogo")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append",
+                        help="cenário a medir (pode repetir; padrão: todos)")
+    parser.add_argument("--repeats", type=int, default=5, help="rodadas por cenário (usa a mediana)")
+    parser.add_argument("--max-menu-ms", type=float, default=None, help="falha se o menu passar disso")
+    parser.add_argument("--max-board-ms", type=float, default=None, help="falha se o tabuleiro passar disso")
+    parser.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(_measure(args.child)))
+        return 0
+
+    ok = True
+    for scenario in args.scenario or list(SCENARIOS):
+        result = run_scenario(scenario, args.repeats)
+        print(f"{scenario:10s} menu {result['menu_ms']:7.1f} ms | tabuleiro {result['board_ms']:7.1f} ms | "
+              f"processo {result['process_ms']:7.1f} ms | torch: {'sim' if result['torch_imported'] else 'não'}")
+        if args.max_menu_ms is not None and result["menu_ms"] > args.max_menu_ms:
+            print(f"  FALHOU: menu acima de {args.max_menu_ms} ms")
+            ok = False
+        if args.max_board_ms is not None and result["board_ms"] > args.max_board_ms:
+            print(f"  FALHOU: tabuleiro acima de {args.max_board_ms} ms")
+            ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,5 +14,15 @@ COLOR_SQUARE_DARK = (75, 115, 153)    # Casas escuras
 COLOR_HIGHLIGHT = (100, 200, 100, 150)  # movimentos
 COLOR_SELECTED = (255, 0, 0)            # borda da peça selecionada
 
+CROWN_PATH = "assets/crown.png"
+CROWN_SIZE = (44, 25)
 
-CROWN_IMG = pygame.transform.scale(pygame.image.load("assets/crown.png"), (44, 25))
\ No newline at end of file
+_crown_img = None
+
+
+def get_crown_img():
+    """Carrega e escala a coroa só na primeira vez que uma dama é desenhada."""
+    global _crown_img
+    if _crown_img is None:
+        _crown_img = pygame.transform.scale(pygame.image.load(CROWN_PATH), CROWN_SIZE)
+    return _crown_img
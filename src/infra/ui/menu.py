@@ -1,6 +1,4 @@
 import pygame
-import tkinter as tk
-from tkinter import filedialog
 from .config import WIDTH, HEIGHT, COLOR_WHITE
 from typing import Optional, Dict, Any
 
@@ -20,7 +18,8 @@ class GameMenu:
         self.font_button = pygame.font.SysFont('Arial', 30)
         self.font_subtitle = pygame.font.SysFont('Arial', 24, bold=True)
 
-        self._setup_tkinter()
+        # A janela do Tk (seletor de arquivo) só é criada quando for usada
+        self.tk_root = None
 
         # Botões principais (centralizados)
         bw = MENU_WIDTH // 2
@@ -42,10 +41,14 @@ class GameMenu:
 
 
     def _setup_tkinter(self):
+        import tkinter as tk
         self.tk_root = tk.Tk()
         self.tk_root.withdraw()
 
     def _ask_for_model_path(self) -> Optional[str]:
+        from tkinter import filedialog
+        if self.tk_root is None:
+            self._setup_tkinter()
         self.tk_root.deiconify()
         self.tk_root.lift()
         self.tk_root.focus_force()
@@ -116,7 +119,8 @@ class GameMenu:
         bx = MENU_WIDTH // 4
         sub_buttons = {
             'RANDOM_AI': pygame.Rect(bx, MENU_HEIGHT // 2 - 30, bw, 50),
-            'NEURAL_NET_AI': pygame.Rect(bx, MENU_HEIGHT // 2 + 30, bw, 50)
+            'NEURAL_NET_AI': pygame.Rect(bx, MENU_HEIGHT // 2 + 30, bw, 50),
+            'ALPHA_BETA_AI': pygame.Rect(bx, MENU_HEIGHT // 2 + 90, bw, 50)
         }
         title = f"Configurar IA: {player_color}"
 
@@ -139,6 +143,10 @@ class GameMenu:
                                 path = self._ask_for_model_path()
                                 if path:
                                     return {'type': 'NN', 'path': path}
+                            if mode == 'ALPHA_BETA_AI':
+                                path = self._ask_for_model_path()
+                                if path:
+                                    return {'type': 'SEARCH', 'path': path}
 
     def run(self) -> Optional[Dict[str, Any]]:
         while True:
@@ -1,11 +1,9 @@
 import pygame
 from src.app.use_cases.game_manager import GameManager
 from src.core.piece import Player
-from src.app.use_cases.move_validator import Move
+from src.core.move import Move
 from .config import *
 from typing import Optional
-from src.infra.ai.random_player import RandomPlayer
-from src.infra.ai.neural_net_player import NeuralNetPlayer
 
 
 class PygameView:
@@ -28,11 +26,30 @@ class PygameView:
             t = cfg.get('type', '').upper()
             if t in ('HUMAN', ''):
                 return None
+            # Cada backend é importado só quando escolhido: partidas sem a rede
+            # (ou com o backend NumPy) não carregam o torch
             if t in ('RANDOM', 'RANDOM_AI'):
+                from src.infra.ai.random_player import RandomPlayer
                 return RandomPlayer(player)
             if t in ('NN', 'NEURAL_NET_AI', 'NEURAL'):
                 path = cfg.get('path', DEFAULT_MODEL_PATH)
-                return NeuralNetPlayer(player, path)
+                # backend 'numpy': forward pass sem torch, com os pesos exportados (.npz)
+                if cfg.get('backend', '').lower() == 'numpy':
+                    from src.infra.ai.numpy_net_player import NumpyNetPlayer
+                    return NumpyNetPlayer(player, path)
+                from src.infra.ai.neural_net_player import NeuralNetPlayer
+                return NeuralNetPlayer(player, path,
+                                       quantization=cfg.get('quantization'),
+                                       calibration_path=cfg.get('calibration_path'))
+            if t in ('SEARCH', 'ALPHA_BETA', 'ALPHA_BETA_AI'):
+                path = cfg.get('path', DEFAULT_MODEL_PATH)
+                from src.infra.ai.search_player import SearchPlayer
+                return SearchPlayer(player, path,
+                                    max_depth=cfg.get('depth', 4),
+                                    node_budget=cfg.get('node_budget'),
+                                    time_budget=cfg.get('time_budget'),
+                                    quantization=cfg.get('quantization'),
+                                    calibration_path=cfg.get('calibration_path'))
             return None
 
         # Build agents from config dict
@@ -142,8 +159,8 @@ class PygameView:
                     color = COLOR_WHITE if piece.player == Player.WHITE else COLOR_BLACK
                     pygame.draw.circle(self.screen, color, (center_x, center_y), radius)
 
-                    if piece.is_king and (CROWN_IMG is not None):
-                        crown = CROWN_IMG
+                    if piece.is_king:
+                        crown = get_crown_img()
                         self.screen.blit(crown, (center_x - crown.get_width() // 2, center_y - crown.get_height() // 2))
 
     def _draw_highlights(self):
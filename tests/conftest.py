@@ -0,0 +1,39 @@
+import random
+
+import pytest
+
+from src.core.board import Board
+from src.core.piece import Player
+from src.app.use_cases.table_move_validator import TableMoveValidator
+from src.infra.perft import POSITIONS
+
+
+@pytest.fixture(scope="session")
+def game_positions() -> list[tuple[Board, Player]]:
+    """As posições do perft e as de 20 partidas com lances aleatórios (semente fixa)."""
+    rng = random.Random(0)
+    validator = TableMoveValidator()
+    positions = [(Board.from_string(text), player) for player, text in POSITIONS.values()]
+    for _ in range(20):
+        board, player = Board(), Player.WHITE
+        board.setup_board()
+        for _ in range(200):
+            moves = validator.get_all_legal_moves_for_player(board, player)
+            if not moves:
+                break
+            positions.append((board.deep_copy(), player))
+            board.apply_move(rng.choice(moves))
+            player = Player.BLACK if player == Player.WHITE else Player.WHITE
+    return positions
+
+
+@pytest.fixture
+def trainer_module(monkeypatch):
+    """O trainer, com as constantes que trainer.main altera restauradas no fim do teste."""
+    from src.infra.ai import trainer
+
+    for name in ("NUM_EPOCHS", "CHECKPOINT_DIR", "CHECKPOINT_EVERY", "CHECKPOINT_KEEP",
+                 "METRICS_PATH", "PROFILE_EPOCH", "PROFILER", "SHOW_LOSS_PLOT",
+                 "NUM_SELF_PLAY_WORKERS"):
+        monkeypatch.setattr(trainer, name, getattr(trainer, name))
+    return trainer
@@ -0,0 +1,57 @@
+import numpy as np
+
+from src.core.board import Board
+from src.core.piece import Player
+from src.app.use_cases.batch_move_generator import (BatchMoveGenerator, boards_to_bitboards,
+                                                    players_to_array)
+from src.app.use_cases.table_move_validator import TableMoveValidator
+
+
+def test_matches_table_validator(game_positions):
+    boards = [board for board, _ in game_positions]
+    players = [player for _, player in game_positions]
+    result = BatchMoveGenerator().generate(boards_to_bitboards(boards), players_to_array(players))
+
+    validator = TableMoveValidator()
+    assert result.move_counts().sum() == len(result.position)
+    for n, (board, player) in enumerate(game_positions):
+        moves = validator.get_all_legal_moves_for_player(board, player)
+        # Triplas completas (origem, destino, capturas), não só as pontas
+        expected = sorted((move.from_square, move.to_square, move.capture_mask) for move in moves)
+        rows = result.position == n
+        got = sorted(zip(result.from_square[rows].tolist(), result.to_square[rows].tolist(),
+                         result.captured[rows].tolist()))
+        assert got == expected, board.to_string()
+        assert set(result.moves(n)) == set(moves)
+        expected_captures = max((bin(move.capture_mask).count("1") for move in moves), default=0)
+        assert result.capture_counts[n] == expected_captures
+
+
+def test_king_chains_with_same_endpoints_stay_distinct():
+    # A dama em 5 chega a 12 (e a 16) capturando dois conjuntos diferentes de peças
+    board = Board.from_string(".....W...bb..........bb...b.....")
+    result = BatchMoveGenerator().generate(boards_to_bitboards([board]), [False])
+    moves = TableMoveValidator().get_all_legal_moves_for_player(board, Player.WHITE)
+    assert len(result.position) == len(moves) == 8
+    assert set(result.moves(0)) == set(moves)
+    assert result.masks.sum() == len({(move.from_square, move.to_square) for move in moves})
+
+    # Os movimentos devolvidos podem ser aplicados: saem exatamente as peças capturadas
+    black_men = board.black_men
+    for move in result.moves(0):
+        token = board.apply_move(move)
+        assert board.black_men == black_men & ~move.capture_mask
+        board.undo_move(token)
+
+
+def test_empty_batch():
+    result = BatchMoveGenerator().generate(np.zeros((0, 4), dtype=np.uint32), np.zeros(0, dtype=bool))
+    assert result.masks.shape == (0, 32, 32)
+    assert result.capture_counts.shape == (0,) and len(result.position) == 0
+
+
+def test_side_to_move_without_pieces():
+    # Só uma peça preta; as Brancas (a jogar) não têm peças
+    result = BatchMoveGenerator().generate([[0, 0, 1, 0]], [False])
+    assert not result.masks.any() and result.moves(0) == []
+    assert result.capture_counts.tolist() == [0]
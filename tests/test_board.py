@@ -0,0 +1,58 @@
+import random
+
+from src.core.board import Board
+from src.core.piece import Player
+from src.core.zobrist import hash_masks
+from src.app.use_cases.table_move_validator import TableMoveValidator
+
+
+def _initial() -> Board:
+    board = Board()
+    board.setup_board()
+    return board
+
+
+def _state(board: Board) -> tuple[int, int, int, int, int]:
+    return (*board.masks(), board.hash)
+
+
+def test_hash_matches_masks_under_apply_and_undo():
+    rng = random.Random(0)
+    validator = TableMoveValidator()
+    start = _state(_initial())
+    assert start[4] == hash_masks(*start[:4])
+    for _ in range(20):
+        board, player = _initial(), Player.WHITE
+        history = []
+        for _ in range(200):
+            moves = validator.get_all_legal_moves_for_player(board, player)
+            if not moves:
+                break
+            before = _state(board)
+            token = board.apply_move(rng.choice(moves))
+            # O hash incremental é o mesmo que o recalculado do zero
+            assert board.hash == hash_masks(*board.masks())
+            assert board.hash == Board.from_masks(*board.masks()).hash
+            history.append((token, before))
+            player = Player.BLACK if player == Player.WHITE else Player.WHITE
+
+        # Desfaz a partida inteira, voltando exatamente por cada posição
+        for token, before in reversed(history):
+            board.undo_move(token)
+            assert _state(board) == before
+        assert _state(board) == start
+
+
+def test_hash_matches_masks_after_square_edits():
+    board = _initial()
+    board.move_piece(5, 0, 4, 1)
+    board.remove_piece(2, 1)
+    board.move_piece(4, 1, 0, 1)
+    board.promote(0, 1)
+    assert board.hash == hash_masks(*board.masks())
+
+
+def test_position_key_depends_on_side_to_move():
+    board = _initial()
+    assert board.position_key(Player.WHITE) == board.hash
+    assert board.position_key(Player.WHITE) != board.position_key(Player.BLACK)
@@ -0,0 +1,82 @@
+import os
+import random
+
+import numpy as np
+import pytest
+import torch
+
+from src.infra.ai.checkpoint import (CheckpointWriter, atomic_torch_save, latest_checkpoint,
+                                     list_checkpoints, load_checkpoint)
+from src.infra.ai.replay_buffer import ReplayBuffer
+
+
+class _Unpicklable:
+    def __reduce__(self):
+        raise RuntimeError("falha no meio da gravação")
+
+
+def test_atomic_save_keeps_previous_file_on_failure(tmp_path):
+    path = str(tmp_path / "state.pt")
+    atomic_torch_save({"value": 1}, path)
+    with pytest.raises(RuntimeError):
+        atomic_torch_save({"value": _Unpicklable()}, path)
+    assert torch.load(path)["value"] == 1
+
+
+def test_writer_retention_and_error_propagation(tmp_path):
+    directory = str(tmp_path / "checkpoints")
+    weights_path = str(tmp_path / "model.pth")
+    with CheckpointWriter(directory, keep=2) as writer:
+        for epoch in range(1, 5):
+            writer.save(epoch, {"model": {"w": torch.full((2,), float(epoch))}}, weights_path)
+        writer.wait()
+        assert [epoch for epoch, _ in list_checkpoints(directory)] == [3, 4]
+        assert torch.load(weights_path)["w"].tolist() == [4.0, 4.0]
+
+        writer.save(5, {"model": {}, "bad": _Unpicklable()})
+        with pytest.raises(RuntimeError):
+            writer.wait()
+    # A falha não deixou arquivo do checkpoint 5
+    assert latest_checkpoint(directory).endswith("checkpoint-000004.pt")
+
+
+def test_memmap_replay_refuses_stale_checkpoint(tmp_path):
+    path = str(tmp_path / "replay.bin")
+    memory = ReplayBuffer(10, path)
+    memory.add_game(np.arange(12, dtype=np.uint32).reshape(3, 4), [0, 1, 0], 0)
+    state = memory.state_dict()
+
+    ReplayBuffer(10, path).load_state_dict(state)  # arquivo igual: aceita
+    memory.add_game(np.arange(4, dtype=np.uint32).reshape(1, 4), [1], 1)
+    memory.flush()
+    with pytest.raises(ValueError):
+        ReplayBuffer(10, path).load_state_dict(state)
+
+
+def _run(trainer, tmp_path, monkeypatch, argv):
+    tmp_path.mkdir(exist_ok=True)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(trainer, "GAMES_PER_EPOCH", 2)
+    monkeypatch.setattr(trainer, "BATCH_SIZE", 16)
+    monkeypatch.setattr(trainer, "BATCHES_PER_EPOCH", 2)
+    trainer.main(argv + ["--workers", "1", "--no-plot", "--metrics", ""])
+
+
+def test_resume_matches_uninterrupted_run(tmp_path, monkeypatch, trainer_module):
+    random.seed(0)
+    torch.manual_seed(0)
+    _run(trainer_module, tmp_path / "full", monkeypatch, ["--epochs", "4"])
+
+    random.seed(0)
+    torch.manual_seed(0)
+    _run(trainer_module, tmp_path / "resumed", monkeypatch, ["--epochs", "2"])
+    random.seed(123)  # o estado certo tem que vir do checkpoint
+    _run(trainer_module, tmp_path / "resumed", monkeypatch, ["--epochs", "4", "--resume"])
+
+    full = load_checkpoint(os.path.join(tmp_path, "full", "checkpoints", "checkpoint-000004.pt"))
+    resumed = load_checkpoint(os.path.join(tmp_path, "resumed", "checkpoints", "checkpoint-000004.pt"))
+    assert full["epsilon"] == resumed["epsilon"]
+    assert full["loss_history"] == resumed["loss_history"]
+    for name, tensor in full["model"].items():
+        assert torch.equal(tensor, resumed["model"][name]), name
+    np.testing.assert_array_equal(full["replay_memory"]["positions"], resumed["replay_memory"]["positions"])
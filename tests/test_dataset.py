@@ -0,0 +1,80 @@
+import numpy as np
+
+from src.infra.ai.dataset import RECORD_DTYPE, ShardDataset, ShardWriter
+
+
+def _games(num_games: int = 12, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    games = []
+    for _ in range(num_games):
+        length = int(rng.integers(20, 60))
+        positions = rng.integers(0, 2**32, (length, 4), dtype=np.uint32)
+        players = np.arange(length, dtype=np.uint8) % 2
+        games.append((positions, players, int(rng.integers(0, 2))))
+    return games
+
+
+def _rows(positions, players, targets):
+    return sorted((tuple(p.tolist()), int(s), float(t)) for p, s, t in zip(positions, players, targets))
+
+
+def test_round_trip_across_shards(tmp_path):
+    games = _games()
+    with ShardWriter(str(tmp_path), "a", records_per_shard=100) as writer:
+        for game in games[:6]:
+            writer.add_game(*game)
+    with ShardWriter(str(tmp_path), "b", records_per_shard=100) as writer:
+        for game in games[6:]:
+            writer.add_game(*game)
+        last_path = writer.path
+    # Partida escrita pela metade (sem atualizar o cabeçalho): ignorada
+    with open(last_path, "ab") as f:
+        f.write(b"\0" * RECORD_DTYPE.itemsize * 7)
+
+    dataset = ShardDataset(str(tmp_path))
+    assert len(dataset.paths) > 2
+    assert dataset.num_games == len(games)
+
+    expected = []
+    for positions, players, winner in games:
+        targets = np.where(players == winner, 1.0, -1.0)
+        expected += _rows(positions, players, targets)
+
+    got_positions, got_players, got_targets = [], [], []
+    for positions, players, targets in dataset.batches(32, np.random.default_rng(1),
+                                                       shuffle_buffer=128, block_size=16):
+        assert len(targets) <= 32
+        got_positions.append(positions)
+        got_players.append(players)
+        got_targets.append(targets)
+    got_positions = np.concatenate(got_positions)
+    assert _rows(got_positions, np.concatenate(got_players), np.concatenate(got_targets)) == sorted(expected)
+    # Embaralhado: a ordem de leitura não é a de escrita
+    assert not np.array_equal(got_positions[:50], np.concatenate([g[0] for g in games])[:50])
+
+
+def test_rotation_does_not_overwrite_previous_run(tmp_path):
+    for _ in range(2):
+        with ShardWriter(str(tmp_path), "same", records_per_shard=100) as writer:
+            writer.add_game(*_games(1)[0])
+    assert len(ShardDataset(str(tmp_path)).paths) == 2
+
+
+def test_train_from_dataset_is_headless(tmp_path, monkeypatch, trainer_module):
+    with ShardWriter(str(tmp_path / "data"), "a") as writer:
+        for game in _games():
+            writer.add_game(*game)
+    monkeypatch.chdir(tmp_path)
+    trainer = trainer_module
+    monkeypatch.setattr(trainer, "plot_loss", lambda losses: (_ for _ in ()).throw(AssertionError("plot")))
+    trainer.main(["--dataset", str(tmp_path / "data"), "--dataset-epochs", "1", "--no-plot"])
+    assert (tmp_path / trainer.MODEL_SAVE_PATH).exists()
+
+
+def test_dataset_epochs_independent_of_self_play_epochs(monkeypatch, trainer_module):
+    trainer = trainer_module
+    calls = []
+    monkeypatch.setattr(trainer, "train_from_dataset", lambda *sources, num_epochs: calls.append(num_epochs))
+    trainer.main(["--dataset", "data", "--no-plot"])
+    trainer.main(["--dataset", "data", "--epochs", "500", "--dataset-epochs", "3", "--no-plot"])
+    assert calls == [trainer.DATASET_EPOCHS, 3]
@@ -0,0 +1,56 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import torch
+
+from src.core.board import Board
+from src.core.piece import Player
+from src.app.use_cases.table_move_validator import TableMoveValidator
+from src.infra.ai.model import (BoardEncoder, CheckersNet, board_to_tensor, boards_to_tensor,
+                                score_successors)
+
+
+def _reference_tensor(board: Board, player: Player) -> torch.Tensor:
+    """O antigo board_to_tensor, casa a casa com get_piece."""
+    planes = torch.zeros((4, 8, 8), dtype=torch.float32)
+    for r in range(8):
+        for c in range(8):
+            piece = board.get_piece(r, c)
+            if piece:
+                offset = 0 if piece.player == player else 2
+                planes[offset, r, c] = 1
+                if piece.is_king:
+                    planes[offset + 1, r, c] = 1
+    return planes.unsqueeze(0)
+
+
+def test_vectorized_encoding_matches_reference(game_positions):
+    encoder = BoardEncoder(capacity=4)  # cresce durante o teste
+    boards = [board for board, _ in game_positions]
+    for player in (Player.WHITE, Player.BLACK):
+        expected = torch.cat([_reference_tensor(board, player) for board in boards])
+        assert torch.equal(boards_to_tensor(boards, [player] * len(boards)), expected)
+        assert torch.equal(encoder.encode(boards, [player] * len(boards)), expected)
+        for board, reference in zip(boards[:50], expected[:50]):
+            assert torch.equal(board_to_tensor(board, player), reference.unsqueeze(0))
+
+
+def test_concurrent_successor_scoring(game_positions):
+    torch.manual_seed(0)
+    model = CheckersNet().eval()
+    validator = TableMoveValidator()
+    jobs = [(board, player, validator.get_all_legal_moves_for_player(board, player))
+            for board, player in game_positions[:200]]
+    jobs = [job for job in jobs if job[2]]
+
+    def score_all(encoder):
+        with torch.no_grad():
+            return [score_successors(model, board.deep_copy(), moves, player, encoder=encoder)
+                    for board, player, moves in jobs]
+
+    expected = score_all(None)
+    # Cada thread com o seu encoder (ou nenhum): nada de buffer compartilhado
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(score_all, [BoardEncoder(), BoardEncoder(), None, None]))
+    for result in results:
+        for got, want in zip(result, expected):
+            assert torch.equal(got, want)
@@ -0,0 +1,56 @@
+import torch
+
+from src.core.board import Board
+from src.core.piece import Player
+from src.app.use_cases.table_move_validator import TableMoveValidator
+from src.infra.ai.eval_cache import EvalCache
+from src.infra.ai.model import CheckersNet, score_successors
+
+
+def _train_step(model: CheckersNet, optimizer: torch.optim.Optimizer):
+    loss = model(torch.ones(2, 4, 8, 8)).sum()
+    optimizer.zero_grad()
+    loss.backward()
+    optimizer.step()
+
+
+def test_optimizer_step_invalidates_cached_scores():
+    torch.manual_seed(0)
+    model = CheckersNet()
+    optimizer = torch.optim.Adam(model.parameters(), lr=0.1)
+    cache = EvalCache(100)
+    cache.watch_optimizer(optimizer)
+    cache.put(1234, 0.5)
+    assert cache.get(1234) == 0.5
+
+    _train_step(model, optimizer)
+    assert cache.get(1234) is None
+    assert cache.invalidations == 1 and len(cache) == 0
+
+
+def test_successors_reevaluated_after_optimizer_step():
+    torch.manual_seed(0)
+    model = CheckersNet().eval()
+    optimizer = torch.optim.Adam(model.parameters(), lr=0.1)
+    cache = EvalCache(100)
+    cache.watch_optimizer(optimizer)
+    forwards = []
+    model.register_forward_pre_hook(lambda module, inputs: forwards.append(len(inputs[0])))
+
+    board = Board()
+    board.setup_board()
+    moves = TableMoveValidator().get_all_legal_moves_for_player(board, Player.WHITE)
+    with torch.no_grad():
+        before = score_successors(model, board, moves, Player.WHITE, cache)
+        assert torch.equal(score_successors(model, board, moves, Player.WHITE, cache), before)
+    assert forwards == [len(moves)]  # a segunda chamada veio toda do cache
+
+    _train_step(model, optimizer)
+    forwards.clear()
+    with torch.no_grad():
+        after = score_successors(model, board, moves, Player.WHITE, cache)
+        fresh = score_successors(model, board, moves, Player.WHITE)
+    # Nada do cache antigo: tudo reavaliado com os pesos novos
+    assert forwards == [len(moves), len(moves)]
+    torch.testing.assert_close(after, fresh)
+    assert not torch.allclose(after, before)
@@ -0,0 +1,77 @@
+import random
+
+from src.core.lru_cache import LRUCache
+from src.core.move import Move
+from src.core.piece import Player
+from src.app.use_cases.game_manager import GameManager
+
+
+def _set_position(manager: GameManager, board, player: Player):
+    manager.board = board.deep_copy()
+    manager.current_player = player
+    manager.winner = None
+    manager._update_legal_moves()
+
+
+def test_cached_moves_match_uncached(game_positions):
+    cache = LRUCache(100_000)
+    cached, uncached = GameManager(move_cache=cache), GameManager()
+    # Duas passadas: a segunda sai toda do cache
+    for _ in range(2):
+        for board, player in game_positions:
+            _set_position(cached, board, player)
+            _set_position(uncached, board, player)
+            assert cached.legal_moves == uncached.legal_moves
+            assert cached._legal_move_keys == {move.key for move in uncached.legal_moves}
+    assert cache.hits >= len(game_positions)
+
+
+def test_cached_game_matches_uncached_after_apply_undo():
+    rng = random.Random(0)
+    cache = LRUCache(100_000)
+    for _ in range(10):
+        cached, uncached = GameManager(move_cache=cache), GameManager()
+        for _ in range(300):
+            if cached.winner is not None:
+                break
+            assert cached.legal_moves == uncached.legal_moves
+            # Uma busca aplica e desfaz lances no tabuleiro antes de jogar
+            for move in cached.legal_moves:
+                token = cached.board.apply_move(move)
+                cached.board.undo_move(token)
+            cached._update_legal_moves()
+            assert cached.legal_moves == uncached.legal_moves
+
+            move = rng.choice(cached.legal_moves)
+            # Alterar a lista recebida não estraga o cache
+            cached.legal_moves.clear()
+            assert cached.make_move(move) and uncached.make_move(move)
+        assert cached.winner == uncached.winner
+
+
+def test_position_keys_do_not_collide(game_positions):
+    # Posições diferentes, chaves diferentes: o cache não mistura movimentos
+    keys = {}
+    for board, player in game_positions:
+        keys.setdefault(board.position_key(player), set()).add((board.masks(), player))
+    assert all(len(positions) == 1 for positions in keys.values())
+
+
+def test_make_move_rejects_illegal_moves():
+    manager = GameManager(move_cache=LRUCache(100))
+    start = manager.board.to_string()
+    legal = manager.legal_moves[0]
+
+    illegal = [
+        Move.from_squares(legal.to_square, legal.from_square),        # de trás para frente
+        Move.from_squares(legal.from_square, legal.to_square, (13,)),  # capturas inventadas
+        Move.from_squares(0, 4),                                      # peça do adversário
+    ]
+    for move in illegal:
+        assert move not in manager.legal_moves
+        assert not manager.make_move(move)
+        assert manager.board.to_string() == start and manager.current_player == Player.WHITE
+
+    # O formato dicionário antigo continua aceito
+    assert manager.make_move(legal.to_dict())
+    assert manager.current_player == Player.BLACK
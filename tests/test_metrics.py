@@ -0,0 +1,24 @@
+from src.infra.ai import metrics as metrics_module
+from src.infra.ai.metrics import read_metrics
+
+
+def test_warmup_epochs_are_logged(tmp_path, monkeypatch, trainer_module, capsys):
+    trainer = trainer_module
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(trainer, "GAMES_PER_EPOCH", 1)
+    # Memória nunca chega a um lote: todas as eras são de aquecimento
+    monkeypatch.setattr(trainer, "BATCH_SIZE", 10**6)
+    trainer.main(["--epochs", "2", "--workers", "1", "--no-plot", "--metrics", "metrics.jsonl"])
+
+    records = read_metrics(str(tmp_path / "metrics.jsonl"))
+    assert [record["epoch"] for record in records] == [1, 2]
+    for record in records:
+        assert record["warmup"] and "loss" not in record
+        assert record["games"] == 1 and record["positions"] > 0 and record["games_per_s"] > 0
+        assert record["phases"]["self_play"] > 0
+        assert record["replay_seen"] >= record["positions"]
+
+    # O resumo e o gráfico aceitam eras sem treino
+    metrics_module.main([str(tmp_path / "metrics.jsonl"), "--plot"])
+    assert "2 eras" in capsys.readouterr().out
+    assert (tmp_path / "metrics.png").exists()
@@ -0,0 +1,11 @@
+from src.app.use_cases.move_validator import MoveValidator
+from src.app.use_cases.table_move_validator import TableMoveValidator
+
+
+def test_table_validator_matches_reference(game_positions):
+    reference, table = MoveValidator(), TableMoveValidator()
+    for board, player in game_positions:
+        expected = reference.get_all_legal_moves_for_player(board, player)
+        got = table.get_all_legal_moves_for_player(board, player)
+        assert len(got) == len(set(got)), board.to_string()
+        assert set(got) == set(expected), board.to_string()
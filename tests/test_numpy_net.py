@@ -0,0 +1,30 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import torch
+
+from src.infra.ai.encoding import encode_boards
+from src.infra.ai.model import CheckersNet
+from src.infra.ai.numpy_net import NumpyCheckersNet
+
+
+def test_matches_torch_on_game_positions(game_positions):
+    torch.manual_seed(0)
+    model = CheckersNet().eval()
+    net = NumpyCheckersNet({name: tensor.numpy() for name, tensor in model.state_dict().items()})
+
+    x = encode_boards([board for board, _ in game_positions], [player for _, player in game_positions])
+    with torch.no_grad():
+        expected = model(torch.from_numpy(x)).numpy()
+    got = net(x)
+    assert got.shape == expected.shape == (len(game_positions), 1)
+    np.testing.assert_allclose(got, expected, rtol=0, atol=1e-6)
+
+
+def test_numpy_player_does_not_import_torch():
+    # Processo novo: neste, o torch já foi importado pelos outros testes
+    code = "import sys, src.infra.ai.numpy_net_player; sys.exit('torch' in sys.modules)"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    assert subprocess.run([sys.executable, "-c", code], cwd=root).returncode == 0
@@ -0,0 +1,21 @@
+import pytest
+
+from src.core.board import Board
+from src.infra.perft import POSITIONS, REFERENCE_COUNTS, VALIDATORS, perft
+
+# Profundidades até esta contagem de nós (alguns segundos no total)
+MAX_NODES = 20_000
+
+
+@pytest.mark.parametrize("validator_name", sorted(VALIDATORS))
+@pytest.mark.parametrize("name", sorted(POSITIONS))
+def test_perft_matches_reference_counts(validator_name, name):
+    validator = VALIDATORS[validator_name]()
+    player, text = POSITIONS[name]
+    board = Board.from_string(text)
+    for depth, expected in enumerate(REFERENCE_COUNTS[name], start=1):
+        if expected > MAX_NODES:
+            break
+        assert perft(validator, board, player, depth) == expected, f"{name}, profundidade {depth}"
+    # perft desfaz cada lance: a posição volta intacta
+    assert board.to_string() == text
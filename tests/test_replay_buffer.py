@@ -0,0 +1,122 @@
+import numpy as np
+
+from src.core.piece import Player
+from src.infra.ai.replay_buffer import ReplayBuffer, position_hashes
+
+
+def _filled(num_positions: int, capacity: int = 1000) -> ReplayBuffer:
+    memory = ReplayBuffer(capacity, rng=np.random.default_rng(0))
+    positions = np.arange(num_positions * 4, dtype=np.uint32).reshape(-1, 4)
+    memory.extend(positions, np.zeros(num_positions, dtype=np.uint8), np.ones(num_positions))
+    return memory
+
+
+def test_sample_batches_draws_distinct_positions_per_batch():
+    memory = _filled(100)
+    positions, players, targets = memory.sample_batches(50, 64)
+    assert positions.shape == (50 * 64, 4) and len(players) == len(targets) == 50 * 64
+    for batch in positions.reshape(50, 64, 4):
+        assert len({tuple(row) for row in batch.tolist()}) == 64
+    # Com poucas posições, cada lote fica do tamanho da memória
+    assert len(_filled(10).sample_batches(3, 64)[0]) == 30
+
+
+def _consistent(memory: ReplayBuffer) -> bool:
+    """A tabela hash aponta exatamente para os slots ocupados."""
+    size = len(memory)
+    hashes = position_hashes(memory.positions[:size], memory.players[:size])
+    return (np.array_equal(memory.hashes[:size], hashes)
+            and np.array_equal(memory.find(hashes), np.arange(size))
+            and np.count_nonzero(memory.table > 0) == size)
+
+
+def test_position_hashes_match_board_position_key(game_positions):
+    boards = [board for board, _ in game_positions]
+    players = np.array([0 if player == Player.WHITE else 1 for _, player in game_positions])
+    hashes = position_hashes(np.array([board.masks() for board in boards]), players)
+    assert hashes.tolist() == [board.position_key(player) for board, player in game_positions]
+
+
+def test_repeated_positions_share_a_slot():
+    memory = ReplayBuffer(100)
+    positions = np.array([[1, 0, 2, 0], [3, 0, 4, 0], [1, 0, 2, 0], [1, 0, 2, 0]], dtype=np.uint32)
+    memory.extend(positions, [0, 0, 0, 1], [1.0, -1.0, -1.0, 1.0])
+    # O mesmo tabuleiro com o outro lado a jogar é outra posição
+    assert len(memory) == 3 and memory.positions_seen == 4
+    slots = memory.find(position_hashes(positions[[0, 1, 3]], [0, 0, 1]))
+    assert memory.visits[slots].tolist() == [2, 1, 1]
+    assert memory.targets[slots].tolist() == [0.0, -1.0, 1.0]
+
+    memory.add_game(positions[:2], [0, 0], winner=0)
+    assert len(memory) == 3 and memory.positions_seen == 6
+    assert memory.visits[slots].tolist() == [3, 2, 1]
+    assert np.allclose(memory.targets[slots], [1 / 3, 0.0, 1.0])
+    assert memory.find(position_hashes([[5, 0, 6, 0]], [0])).tolist() == [-1]
+    assert _consistent(memory)
+
+
+def _one(n: int) -> np.ndarray:
+    return np.array([[n, 0, n + 1, 0]], dtype=np.uint32)
+
+
+def test_full_memory_evicts_least_recently_updated():
+    memory = ReplayBuffer(4)
+    for n in range(4):
+        memory.extend(_one(n), [0], [1.0])
+    # A posição 0 (uma abertura, revista) é atualizada de novo; a 1 é a mais antiga
+    memory.extend(_one(0), [0], [1.0])
+    memory.extend(_one(10), [0], [-1.0])
+    kept = {row[0] for row in memory.positions.tolist()}
+    assert kept == {0, 2, 3, 10}
+    assert memory.visits[memory.find(position_hashes(_one(0), [0]))].tolist() == [2]
+    assert (memory.visits > 0).all()
+    assert _consistent(memory)
+
+
+def test_batch_larger_than_memory_keeps_latest_positions():
+    memory = _filled(10, capacity=4)
+    assert len(memory) == 4 and memory.positions_seen == 10
+    kept = {tuple(row) for row in memory.positions.tolist()}
+    assert kept == {tuple(range(4 * n, 4 * n + 4)) for n in range(6, 10)}
+    assert _consistent(memory)
+
+
+def test_eviction_churn_keeps_table_consistent():
+    # Muitas remoções: a tabela é refeita quando acumula entradas removidas
+    memory = ReplayBuffer(64, rng=np.random.default_rng(0))
+    rng = np.random.default_rng(1)
+    for _ in range(200):
+        positions = rng.integers(0, 300, size=(20, 4)).astype(np.uint32)
+        positions[:, 1:] = 0
+        memory.extend(positions, rng.integers(0, 2, size=20), rng.choice([-1.0, 1.0], size=20))
+        assert _consistent(memory)
+    assert len(memory) == 64 and memory.positions_seen == 4000
+
+
+def test_memmap_reopen_keeps_index(tmp_path):
+    path = str(tmp_path / "replay.bin")
+    memory = ReplayBuffer(4, path=path)
+    memory.extend(np.arange(24, dtype=np.uint32).reshape(-1, 4), np.zeros(6, dtype=np.uint8), np.ones(6))
+    memory.flush()
+    table = memory.table.copy()
+
+    reopened = ReplayBuffer(4, path=path)
+    assert len(reopened) == 4 and reopened.positions_seen == 6
+    np.testing.assert_array_equal(reopened.table, table)
+    reopened.extend([[20, 21, 22, 23]], [0], [-1.0])
+    assert len(reopened) == 4 and reopened.visits.tolist().count(2) == 1
+    assert _consistent(reopened)
+
+
+def test_add_games_matches_one_call_per_game():
+    rng = np.random.default_rng(2)
+    games = [(rng.integers(0, 5, size=(30, 4)).astype(np.uint32), rng.integers(0, 2, size=30),
+              int(rng.integers(0, 2))) for _ in range(5)]
+    together, separate = ReplayBuffer(1000), ReplayBuffer(1000)
+    together.add_games(games)
+    for game in games:
+        separate.add_game(*game)
+    assert len(together) == len(separate) and together.positions_seen == separate.positions_seen == 150
+    hashes = separate.hashes[:len(separate)]
+    np.testing.assert_allclose(together.targets[together.find(hashes)], separate.targets)
+    np.testing.assert_array_equal(together.visits[together.find(hashes)], separate.visits[:len(separate)])
@@ -0,0 +1,42 @@
+import pytest
+
+from src.core.board import Board
+from src.core.piece import Player
+from src.app.use_cases.table_move_validator import TableMoveValidator
+from src.infra.ai.numpy_net import NumpyCheckersNet
+from src.infra.ai.search_player import (MATE_PLY_STEP, WIN_SCORE, SearchPlayer,
+                                        _score_from_table, _score_to_table)
+from src.infra.ai.shared_weights import WeightPublisher
+
+
+@pytest.mark.parametrize("sign", [1, -1])
+def test_mate_scores_are_node_relative_in_table(sign):
+    # Mate 3 plies abaixo de um nó guardado no ply 2 e reencontrado no ply 5
+    stored = _score_to_table(sign * (WIN_SCORE - (2 + 3) * MATE_PLY_STEP), 2)
+    assert _score_from_table(stored, 5) == pytest.approx(sign * (WIN_SCORE - (5 + 3) * MATE_PLY_STEP))
+    # Estimativas da rede passam sem alteração
+    assert _score_from_table(_score_to_table(0.25 * sign, 2), 5) == 0.25 * sign
+
+
+def test_table_cleared_when_shared_weights_change(tmp_path):
+    path = str(tmp_path / "model.weights")
+    publisher = WeightPublisher(path)
+    publisher.publish(NumpyCheckersNet.random(0).weights)
+    player = SearchPlayer(Player.WHITE, path, max_depth=2)
+
+    board = Board()
+    board.setup_board()
+    moves = TableMoveValidator().get_all_legal_moves_for_player(board, Player.WHITE)
+    player.get_move(board, moves)
+    assert len(player.table) > 0
+
+    # Mesma versão: a tabela continua valendo
+    player.get_move(board, moves)
+    assert player.table.hits > 0
+
+    publisher.publish(NumpyCheckersNet.random(1).weights)
+    cleared = []
+    original_clear = player.table.clear
+    player.table.clear = lambda: (cleared.append(True), original_clear())
+    player.get_move(board, moves)
+    assert cleared == [True]
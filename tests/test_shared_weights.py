@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+from src.core.board import Board
+from src.core.piece import Player
+from src.app.use_cases.table_move_validator import TableMoveValidator
+from src.infra.ai.neural_net_player import NeuralNetPlayer
+from src.infra.ai.numpy_net import NumpyCheckersNet
+from src.infra.ai.shared_weights import (_SEQ0, SharedNumpyNet, SharedWeights, WeightPublisher)
+
+
+def test_publish_and_read(tmp_path):
+    path = str(tmp_path / "model.weights")
+    publisher = WeightPublisher(path)
+    first = NumpyCheckersNet.random(0)
+    assert publisher.publish(first.weights) == 1
+
+    version, arrays = SharedWeights(path).arrays()
+    assert version == 1
+    for name, array in first.weights.items():
+        np.testing.assert_array_equal(arrays[name], array)
+
+    net = SharedNumpyNet(path)
+    second = NumpyCheckersNet.random(1)
+    publisher.publish(second.weights)
+    assert net.maybe_reload()
+    x = np.random.default_rng(0).random((4, 4, 8, 8), dtype=np.float32)
+    np.testing.assert_allclose(net(x), second(x), rtol=1e-6)
+    # Os dois slots terminam pares (nenhuma escrita em andamento)
+    assert all(int(publisher._header[seq]) % 2 == 0 for seq in (_SEQ0, _SEQ0 + 1))
+
+
+def test_reader_times_out_without_publish(tmp_path):
+    path = str(tmp_path / "empty.weights")
+    WeightPublisher(path)
+    with pytest.raises(TimeoutError):
+        SharedWeights(path).arrays(timeout=0.01)
+
+
+def test_recovers_from_publisher_killed_mid_write(tmp_path):
+    path = str(tmp_path / "model.weights")
+    publisher = WeightPublisher(path)
+    publisher.publish(NumpyCheckersNet.random(0).weights)
+    # Simula um editor morto no meio da escrita: os dois slots ficam ímpares
+    publisher._header[_SEQ0] = 183
+    publisher._header[_SEQ0 + 1] = 183
+    publisher._header.flush()
+    del publisher
+
+    publisher = WeightPublisher(path)
+    version, _ = SharedWeights(path).arrays(timeout=0.1)
+    assert version == 1
+    publisher.publish(NumpyCheckersNet.random(1).weights)
+    publisher.publish(NumpyCheckersNet.random(2).weights)
+    version, arrays = SharedWeights(path).arrays(timeout=0.1)
+    assert version == 3
+    np.testing.assert_array_equal(arrays["fc2.bias"], NumpyCheckersNet.random(2).weights["fc2.bias"])
+
+
+def test_reader_detects_slot_rewritten_by_second_publish(tmp_path):
+    path = str(tmp_path / "model.weights")
+    publisher = WeightPublisher(path)
+    publisher.publish(NumpyCheckersNet.random(0).weights)
+    shared = SharedWeights(path)
+    _, arrays = shared.arrays()
+
+    # A primeira publicação vai para o outro slot: as views continuam valendo
+    publisher.publish(NumpyCheckersNet.random(1).weights)
+    assert shared.intact()
+    np.testing.assert_array_equal(arrays["fc2.bias"], NumpyCheckersNet.random(0).weights["fc2.bias"])
+    # A segunda reescreve o slot das views
+    publisher.publish(NumpyCheckersNet.random(2).weights)
+    assert not shared.intact()
+
+    version, arrays = shared.arrays()
+    assert version == 3 and shared.intact()
+    np.testing.assert_array_equal(arrays["fc2.bias"], NumpyCheckersNet.random(2).weights["fc2.bias"])
+
+
+def test_shared_net_redoes_evaluation_when_slot_rewritten(tmp_path):
+    path = str(tmp_path / "model.weights")
+    publisher = WeightPublisher(path)
+    publisher.publish(NumpyCheckersNet.random(0).weights)
+    net = SharedNumpyNet(path)
+    x = np.random.default_rng(0).random((4, 4, 8, 8), dtype=np.float32)
+
+    # Duas publicações no meio da primeira avaliação
+    evaluate = net.net
+    def publish_twice_then_evaluate(batch):
+        publisher.publish(NumpyCheckersNet.random(1).weights)
+        publisher.publish(NumpyCheckersNet.random(2).weights)
+        return evaluate(batch)
+    net.net = publish_twice_then_evaluate
+
+    np.testing.assert_allclose(net(x), NumpyCheckersNet.random(2)(x), rtol=1e-6)
+    assert net.version == 3 and net.reloads == 2
+
+
+def test_torch_player_redoes_move_when_slot_rewritten(tmp_path):
+    path = str(tmp_path / "model.weights")
+    publisher = WeightPublisher(path)
+    publisher.publish(NumpyCheckersNet.random(0).weights)
+    player = NeuralNetPlayer(Player.WHITE, path)
+    forwards = []
+
+    def publish_twice_on_first_forward(module, inputs):
+        if not forwards:
+            publisher.publish(NumpyCheckersNet.random(1).weights)
+            publisher.publish(NumpyCheckersNet.random(2).weights)
+        forwards.append(len(inputs[0]))
+    player.model.register_forward_pre_hook(publish_twice_on_first_forward)
+
+    board = Board()
+    board.setup_board()
+    moves = TableMoveValidator().get_all_legal_moves_for_player(board, Player.WHITE)
+    player.get_move(board, moves)
+    # A primeira avaliação foi descartada e refeita com a versão 3
+    assert len(forwards) == 2 and player._weights_version == 3
@@ -0,0 +1,62 @@
+from src.core.transposition_table import TranspositionTable
+
+SIZE = 16
+# Chaves diferentes que caem no mesmo slot (mesmos bits baixos)
+KEY, OTHER = 5, 5 + SIZE
+
+
+def test_size_rounds_up_to_power_of_two():
+    assert TranspositionTable(100).capacity == 128
+
+
+def test_store_and_probe_count_hits_and_misses():
+    table = TranspositionTable(SIZE)
+    assert table.probe(KEY) is None
+    assert table.store(KEY, "a", depth=3)
+    assert table.probe(KEY) == "a"
+    assert table.probe_entry(KEY) == (3, "a")
+    assert table.probe(OTHER) is None  # mesmo slot, outra chave
+    stats = table.stats()
+    assert (stats["hits"], stats["misses"], stats["stores"], stats["used"]) == (2, 2, 1, 1)
+    assert stats["hit_rate"] == 0.5 and stats["fill_rate"] == 1 / SIZE
+
+
+def test_same_generation_keeps_deeper_entry():
+    table = TranspositionTable(SIZE)
+    table.store(KEY, "deep", depth=4)
+    # Mais rasa, mesma geração: recusada
+    assert not table.store(OTHER, "shallow", depth=2)
+    assert table.probe(KEY) == "deep" and table.rejected == 1
+    # Mesma profundidade ou maior: substitui
+    assert table.store(OTHER, "equal", depth=4)
+    assert table.probe(OTHER) == "equal" and table.probe(KEY) is None
+    assert table.replacements == 1 and len(table) == 1
+
+
+def test_same_key_always_overwrites():
+    table = TranspositionTable(SIZE)
+    table.store(KEY, "deep", depth=6)
+    assert table.store(KEY, "shallow", depth=1)
+    assert table.probe_entry(KEY) == (1, "shallow")
+    assert table.replacements == 0 and table.rejected == 0
+
+
+def test_old_generation_is_replaced_regardless_of_depth():
+    table = TranspositionTable(SIZE)
+    table.store(KEY, "old", depth=8)
+    table.new_generation()
+    assert table.store(OTHER, "new", depth=0)
+    assert table.probe(OTHER) == "new" and table.replacements == 1
+
+
+def test_clear_and_reset_stats():
+    table = TranspositionTable(SIZE)
+    for key in range(SIZE):
+        table.store(key, key)
+    assert len(table) == SIZE
+    table.probe(0)
+    table.reset_stats()
+    assert table.stats()["hits"] == 0 and table.stats()["stores"] == 0
+    assert len(table) == SIZE  # reset_stats não apaga entradas
+    table.clear()
+    assert len(table) == 0 and table.probe(0) is None